@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, Header, Request, status
 from fastapi.responses import JSONResponse
-from langchain_openai.chat_models.base import ChatOpenAI
 from starlette.responses import StreamingResponse
 
 from app.core.deps import inject
@@ -10,6 +9,7 @@ from app.schemas.chat import (ChatDetailResponse, ChatListResponse, ChatRequest)
 from dotenv import load_dotenv
 
 from domains.chat.services import ChatService
+from domains.common.llm_registry import LLMRegistry
 from domains.user.agents.memory_extraction_chain import build_memory_extraction_chain
 from domains.user.services import UserMemoryService
 
@@ -17,8 +17,6 @@ load_dotenv()
 
 router = APIRouter(prefix="")
 
-llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.3)
-
 
 @router.post("", response_class=StreamingResponse)
 async def stream_chat(req: Request,
@@ -28,11 +26,13 @@ async def stream_chat(req: Request,
                       run_stream=Depends(get_workflow_stream),
                       memory_service: UserMemoryService = Depends(
                           inject(UserMemoryService)),
-                      chat_service: ChatService = Depends(inject(ChatService))):
+                      chat_service: ChatService = Depends(inject(ChatService)),
+                      llms: LLMRegistry = Depends(inject(LLMRegistry))):
 
     headers = {"Cache-Control": "no-cache"}
 
-    chain = build_memory_extraction_chain(llm=llm, memory_service=memory_service)
+    chain = build_memory_extraction_chain(llm=llms.get("memory"),
+                                          memory_service=memory_service)
 
     return StreamingResponse(
         chat_service.chat_events(chat_id=body.chat_id,
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from common.metrics import registry
+
+router = APIRouter(prefix="")
+
+
+@router.get("", response_class=PlainTextResponse)
+async def get_metrics():
+    """노드, LLM, 도구, Mongo 구간 히스토그램과 토큰, 캐시 카운터 (Prometheus 텍스트 형식)"""
+
+    return PlainTextResponse(registry.render(),
+                             media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -2,6 +2,9 @@ import os
 from dataclasses import dataclass
 
 from domains.auth.config import AuthConfig, KakaoOAuthConfig
+from domains.chat.config import ChatHistoryConfig
+from domains.common.config import LLMConfig, ResearchConfig, SupervisorConfig
+from domains.saving.config import SavingSearchConfig
 from domains.user.config import UserServiceConfig
 
 from .mongo import MongoConfig
@@ -17,6 +20,14 @@ class AppConfig:
     auth: AuthConfig
     user: UserServiceConfig
     kakao: KakaoOAuthConfig
+    saving: SavingSearchConfig
+    supervisor: SupervisorConfig
+    research: ResearchConfig
+    llm: LLMConfig
+    chat: ChatHistoryConfig
+
+    # true 이면 /api/v1/metrics 를 인증 없이 노출 (내부망 수집기 전용)
+    metrics_public: bool = False
 
     @classmethod
     def from_env(cls) -> "AppConfig":
@@ -48,4 +59,10 @@ class AppConfig:
                                         "/api/v1/auth/kakao/callback"),
                 server_origin=os.getenv("SERVER_ORIGIN", "http://localhost:8899"),
             ),
+            saving=SavingSearchConfig(),
+            supervisor=SupervisorConfig(),
+            research=ResearchConfig(),
+            llm=LLMConfig(),
+            chat=ChatHistoryConfig(),
+            metrics_public=os.getenv("METRICS_PUBLIC", "false").lower() == "true",
         )
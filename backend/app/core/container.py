@@ -9,6 +9,7 @@ from domains.auth.services import KakaoOAuthService, TicketService, TokenService
 from domains.auth.usecases import KakaoAuthUseCase
 from domains.chat.repositories import ChatRepository
 from domains.chat.services import ChatService
+from domains.common.llm_registry import LLMRegistry
 from domains.user.repositories import SocialRepository, UserMemoryRepository, UserRepository
 from domains.user.services import UserMemoryService, UserService
 
@@ -81,6 +82,7 @@ async def init_container() -> AppContainer:
         return cfg.mongo.connect()
 
     c.register(AsyncIOMotorDatabase, _db_factory)
+    c.register(LLMRegistry, lambda _c: LLMRegistry(_c.resolve(AppConfig).llm))
     c.register(
         UserMemoryRepository,
         lambda _c: UserMemoryRepository(cfg=_c.resolve(AppConfig),
@@ -152,6 +154,7 @@ async def init_container() -> AppContainer:
         lambda _c: ChatService(cfg=_c.resolve(AppConfig),
                                user_repo=_c.resolve(UserRepository),
                                memory_repo=_c.resolve(UserMemoryRepository),
-                               chat_repo=_c.resolve(ChatRepository)))
+                               chat_repo=_c.resolve(ChatRepository),
+                               llms=_c.resolve(LLMRegistry)))
 
     return c
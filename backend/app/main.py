@@ -2,14 +2,16 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from langchain_upstage import ChatUpstage
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from app.core.config import AppConfig
 from app.core.container import AppContainer, init_container
 
 from app.api.v1 import router as v1_router
+from common.indexes import index_registry
 from domains.auth.services import TokenService
 from domains.common.agents.supervisor import init_graph
+from domains.common.llm_registry import LLMRegistry
 
 
 def create_app(lifespan):
@@ -33,21 +35,28 @@ def create_app(lifespan):
 async def lifespan(app: FastAPI):
     """FastAPI 인스턴스 생명주기 관리 함수"""
 
-    llm = ChatUpstage(
-        model="solar-pro2",
-        temperature=0.0,
-        reasoning_effort="low",
-        max_tokens=16384,
-    )
-
     container = await init_container()
     app.state.container = container
 
+    cfg = container.resolve(AppConfig)
     database = container.resolve(AsyncIOMotorDatabase)
-    app.state.graph = init_graph(llm, database)
+    await index_registry.apply(database, cfg.mongo.collections)
+
+    # 모든 LLM 호출이 공유하는 연결 풀을 첫 요청 전에 미리 연다
+    llms = container.resolve(LLMRegistry)
+    await llms.prewarm()
+
+    app.state.graph = init_graph(llms.get("default"),
+                                 database,
+                                 saving_cfg=cfg.saving,
+                                 supervisor_cfg=cfg.supervisor,
+                                 research_cfg=cfg.research,
+                                 llms=llms)
 
     yield
 
+    await llms.aclose()
+
     app.state.client.close()
 
 
@@ -68,6 +77,8 @@ async def verify_token_middleware(req: Request, call_next):
         "/api/v1/auth/token/refresh",
         "/api/v1/auth/exchange",
     ]
+    if container.resolve(AppConfig).metrics_public:
+        excluded_paths.append("/api/v1/metrics")
 
     if req.method == "OPTIONS" or req.url.path in excluded_paths:
         response = await call_next(req)
@@ -0,0 +1,472 @@
+"""벤치마크용 가짜 LLM, OpenAI 클라이언트, 인메모리 Mongo.
+
+외부 API 와 데이터베이스 없이 실제 그래프와 서비스 코드를 실행하기 위한 대역이다.
+LLM 응답은 `ReplayScript` 가 정한 고정값이며, 지연 시간은 호출당 지연과 토큰당 지연으로 흉내 낸다.
+"""
+
+import asyncio
+import copy
+import json
+import re
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+
+from domains.common.agents.context_compressor import approx_tokens
+from domains.common.config import LLMConfig
+from domains.common.llm_registry import LLMRegistry, ProfileStats, _ProfileStatsHandler
+
+_TOKEN = re.compile(r"\S+\s*")
+
+DEFAULT_REPLY = ("조건에 맞는 적금 상품을 정리했습니다. 첫 번째 상품은 기본 금리가 높고 우대 조건이 단순해 "
+                 "매달 일정 금액을 납입하기에 적합합니다. 두 번째 상품은 최대 금리가 가장 높지만 급여 이체와 "
+                 "카드 실적 조건을 모두 충족해야 합니다. 세 번째 상품은 중도 해지 시 불이익이 적어 기간이 "
+                 "불확실한 경우에 유리합니다. 가입 전 우대 금리 조건과 납입 한도를 꼭 확인하세요.")
+
+DEFAULT_TOOL_CALL = {
+    "name": "find_savings_by_monthly_and_term",
+    "args": {
+        "monthly_deposit": 300_000,
+        "total_term_months": 12
+    },
+}
+
+
+class ReplayScript:
+    """기록된 대화의 턴별 LLM 응답.
+
+    턴은 사용자 메시지로 찾으며, 턴에 없는 항목과 사용자 메시지가 아닌 입력(질의 생성 등)에는
+    기본값을 사용한다.
+
+    턴 항목:
+        message (str): 사용자 메시지
+        plans (List[str]): supervisor 가 반환할 member 순서
+        tool_call (dict): tool_node 가 선택할 {"name", "args"}
+        steps (List[str]): 리서치 계획
+        queries (List[str]): 단계별 검색어
+        reply (str): explain_node 응답
+    """
+
+    def __init__(self, turns: Iterable[dict], suitable_every: int = 2):
+        self.turns: Dict[str, dict] = {t["message"]: t for t in turns}
+        self.suitable_every = max(suitable_every, 1)
+
+    def turn(self, messages: Sequence[BaseMessage]) -> dict:
+        humans = [m for m in messages if m.type == "human"]
+        return self.turns.get(str(humans[-1].content), {}) if humans else {}
+
+    def structured(self, schema: str, messages: Sequence[BaseMessage]) -> dict:
+        turn = self.turn(messages)
+
+        match schema:
+            case "SupervisorResponse":
+                members = turn.get("plans") or ["saving_node", "explain_node"]
+                plans = [{"member": m, "goal": f"{m} 단계 수행"} for m in members]
+                return {"plans": plans, "next": members[0]}
+            case "Plan":
+                return {"steps": turn.get("steps") or ["최근 기준금리 동향 확인"]}
+            case "Response":
+                return {"queries": turn.get("queries") or ["기준금리 동향", "적금 금리 비교"]}
+            case "SavingFitVerdicts":
+                # 상품 번호 순으로 `suitable_every` 개 중 하나만 적합으로 판정
+                count = str(messages[-1].content).count("### 상품 ")
+                verdicts = []
+                for i in range(1, count + 1):
+                    suitable = self.suitable_every == 1 or i % self.suitable_every == 1
+                    verdicts.append({
+                        "index": i,
+                        "thought": "조건 비교",
+                        "suitable": suitable
+                    })
+                return {"verdicts": verdicts}
+
+        raise ValueError(f"스크립트에 없는 구조화 출력입니다: {schema}")
+
+    def respond(self,
+                messages: Sequence[BaseMessage],
+                tools: Optional[List[str]] = None,
+                schema: Optional[str] = None) -> AIMessage:
+        if schema is not None:
+            content = json.dumps(self.structured(schema, messages), ensure_ascii=False)
+            return AIMessage(content=content)
+
+        if tools is not None:
+            tool_call = self.turn(messages).get("tool_call") or DEFAULT_TOOL_CALL
+            return AIMessage(content="",
+                             tool_calls=[{
+                                 "name": tool_call["name"],
+                                 "args": tool_call["args"],
+                                 "id": f"call_{uuid.uuid4().hex[:8]}",
+                             }])
+
+        if "<Answer>" in str(messages[0].content):
+            return AIMessage(content="<Thought>조건 비교</Thought><Answer>적합</Answer>")
+
+        return AIMessage(content=self.turn(messages).get("reply") or DEFAULT_REPLY)
+
+
+class ScriptedChatModel(BaseChatModel):
+    """`ReplayScript` 의 응답을 지연 시간과 함께 반환하는 채팅 모델.
+
+    `bind_tools`, `with_structured_output` 도 실제 모델과 같은 형태(tool_calls, dict /
+    pydantic)로 동작하므로 그래프 코드를 수정하지 않고 사용할 수 있다.
+
+    Attributes:
+        script (ReplayScript): 응답 스크립트
+        latency (float): 호출당 지연 (첫 토큰까지)
+        token_delay (float): 출력 토큰당 지연
+    """
+
+    script: Any
+    latency: float = 0.0
+    token_delay: float = 0.0
+    model_name: str = "scripted"
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def _respond(self, messages: List[BaseMessage], **kwargs) -> AIMessage:
+        message = self.script.respond(messages,
+                                      tools=kwargs.get("tools"),
+                                      schema=kwargs.get("schema"))
+
+        input_tokens = sum(approx_tokens(str(m.content)) for m in messages)
+        output_tokens = approx_tokens(
+            str(message.content) or json.dumps(message.tool_calls, ensure_ascii=False))
+        message.usage_metadata = {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        }
+        message.response_metadata = {"model_name": self.model_name}
+        return message
+
+    def _delay(self, message: AIMessage) -> float:
+        return self.latency + self.token_delay * message.usage_metadata["output_tokens"]
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        message = self._respond(messages, **kwargs)
+        time.sleep(self._delay(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self,
+                         messages,
+                         stop=None,
+                         run_manager=None,
+                         **kwargs) -> ChatResult:
+        message = self._respond(messages, **kwargs)
+        await asyncio.sleep(self._delay(message))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self,
+                messages,
+                stop=None,
+                run_manager=None,
+                **kwargs) -> Iterator[ChatGenerationChunk]:
+        raise NotImplementedError("벤치마크는 비동기 스트리밍만 사용합니다.")
+
+    async def _astream(self,
+                       messages,
+                       stop=None,
+                       run_manager=None,
+                       **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        message = self._respond(messages, **kwargs)
+        await asyncio.sleep(self.latency)
+
+        if message.tool_calls:
+            yield ChatGenerationChunk(
+                message=AIMessageChunk(content="",
+                                       tool_call_chunks=[{
+                                           "name": c["name"],
+                                           "args": json.dumps(c["args"]),
+                                           "id": c["id"],
+                                           "index": i,
+                                       } for i, c in enumerate(message.tool_calls)]))
+            return
+
+        for token in _TOKEN.findall(str(message.content)):
+            await asyncio.sleep(self.token_delay)
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
+
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(content="", usage_metadata=message.usage_metadata))
+
+    def bind_tools(self, tools, **kwargs) -> Runnable:
+        names = [
+            getattr(t, "name", None) or getattr(t, "__name__", str(t)) for t in tools
+        ]
+        return self.bind(tools=names, **kwargs)
+
+    def with_structured_output(self, schema, *, include_raw: bool = False, **kwargs):
+        is_model = isinstance(schema, type) and issubclass(schema, BaseModel)
+
+        def parse(message: AIMessage):
+            if is_model:
+                return schema.model_validate_json(str(message.content))
+            return json.loads(str(message.content))
+
+        return self.bind(schema=schema.__name__) | RunnableLambda(parse)
+
+
+class _FakeCompletions:
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        message = SimpleNamespace(content="적금 추천 상담")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeOpenAIClient:
+    """`AsyncOpenAI.chat.completions.create` 만 흉내 내는 클라이언트 (대화 제목 생성용)"""
+
+    def __init__(self, latency: float = 0.0):
+        self.chat = SimpleNamespace(completions=_FakeCompletions(latency))
+
+
+class ScriptedLLMRegistry(LLMRegistry):
+    """모든 프로필에 `ScriptedChatModel` 을 반환하는 레지스트리. 프로필별 통계는 그대로 집계된다."""
+
+    def __init__(self,
+                 script: ReplayScript,
+                 latency: float = 0.0,
+                 token_delay: float = 0.0):
+        super().__init__(LLMConfig(prewarm_connections=0))
+        self.script = script
+        self.latency = latency
+        self.token_delay = token_delay
+
+    def get(self, name: str) -> BaseChatModel:
+        if name not in self._models:
+            stats = self._stats.setdefault(name, ProfileStats())
+            self._models[name] = ScriptedChatModel(
+                script=self.script,
+                latency=self.latency,
+                token_delay=self.token_delay,
+                model_name=f"scripted-{name}",
+                callbacks=[_ProfileStatsHandler(name, stats)],
+            )
+        return self._models[name]
+
+    def openai_client(self, provider):
+        return FakeOpenAIClient(self.latency)
+
+
+# ──────────────────── 인메모리 Mongo ────────────────────
+
+
+def _get(doc: dict, path: str) -> Any:
+    value: Any = doc
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _matches_condition(value: Any, condition: Any) -> bool:
+    if not isinstance(condition, dict) or not any(k.startswith("$") for k in condition):
+        return value == condition
+
+    for op, operand in condition.items():
+        match op:
+            case "$in":
+                ok = value in operand
+            case "$nin":
+                ok = value not in operand
+            case "$ne":
+                ok = value != operand
+            case "$gte":
+                ok = value is not None and value >= operand
+            case "$gt":
+                ok = value is not None and value > operand
+            case "$lte":
+                ok = value is not None and value <= operand
+            case "$lt":
+                ok = value is not None and value < operand
+            case "$not":
+                ok = not _matches_condition(value, operand)
+            case _:
+                raise NotImplementedError(f"지원하지 않는 조건 연산자입니다: {op}")
+        if not ok:
+            return False
+
+    return True
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    return all(_matches_condition(_get(doc, k), v) for k, v in query.items())
+
+
+def _apply_update(doc: dict, update: dict):
+    for op, fields in update.items():
+        for key, value in fields.items():
+            match op:
+                case "$set":
+                    doc[key] = copy.deepcopy(value)
+                case "$inc":
+                    doc[key] = doc.get(key, 0) + value
+                case "$push":
+                    doc.setdefault(key, []).append(copy.deepcopy(value))
+                case "$setOnInsert":
+                    pass
+                case _:
+                    raise NotImplementedError(f"지원하지 않는 갱신 연산자입니다: {op}")
+
+
+class InMemoryCursor:
+
+    def __init__(self, docs: List[dict]):
+        self._docs = docs
+        self._skip = 0
+        self._limit = 0
+
+    def sort(self, key, direction: int = 1) -> "InMemoryCursor":
+        self._docs.sort(key=lambda d: (_get(d, key) is None, _get(d, key)),
+                        reverse=direction < 0)
+        return self
+
+    def skip(self, count: int) -> "InMemoryCursor":
+        self._skip = count
+        return self
+
+    def limit(self, count: int) -> "InMemoryCursor":
+        self._limit = count
+        return self
+
+    def _window(self) -> List[dict]:
+        docs = self._docs[self._skip:]
+        return docs[:self._limit] if self._limit else docs
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict]:
+        docs = self._window()
+        return [copy.deepcopy(d) for d in (docs[:length] if length else docs)]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self._window():
+            yield copy.deepcopy(doc)
+
+
+class InMemoryCollection:
+    """Motor 컬렉션 중 이 저장소가 사용하는 메서드만 구현한 대역. 도큐먼트는 복사해 주고받는다."""
+
+    def __init__(self, database: "InMemoryDatabase", name: str):
+        self.database = database
+        self.name = name
+        self.full_name = f"{database.name}.{name}"
+        self._docs: Dict[Any, dict] = {}
+
+    def _find(self, query: dict) -> List[dict]:
+        ids = query.get("_id")
+        if isinstance(ids, str):
+            doc = self._docs.get(ids)
+            return [doc] if doc is not None and _matches(doc, query) else []
+        return [d for d in self._docs.values() if _matches(d, query)]
+
+    def find(self, query: Optional[dict] = None, projection=None) -> InMemoryCursor:
+        return InMemoryCursor(self._find(query or {}))
+
+    async def find_one(self, query: Optional[dict] = None, projection=None):
+        docs = self._find(query or {})
+        return copy.deepcopy(docs[0]) if docs else None
+
+    async def insert_one(self, doc: dict):
+        doc = copy.deepcopy(doc)
+        doc.setdefault("_id", uuid.uuid4().hex)
+        if doc["_id"] in self._docs:
+            raise ValueError(f"중복된 _id 입니다: {doc['_id']}")
+        self._docs[doc["_id"]] = doc
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def insert_many(self, docs: Iterable[dict], ordered: bool = True):
+        ids = [(await self.insert_one(doc)).inserted_id for doc in docs]
+        return SimpleNamespace(inserted_ids=ids)
+
+    def _upsert(self, query: dict, update: dict) -> dict:
+        doc = {k: v for k, v in query.items() if not isinstance(v, dict)}
+        doc.setdefault("_id", uuid.uuid4().hex)
+        _apply_update(doc, {"$set": update.get("$setOnInsert", {})})
+        self._docs[doc["_id"]] = doc
+        return doc
+
+    async def update_one(self, query: dict, update: dict, upsert: bool = False):
+        docs = self._find(query)
+        if docs:
+            _apply_update(docs[0], update)
+            return SimpleNamespace(matched_count=1, modified_count=1, upserted_id=None)
+
+        if upsert:
+            doc = self._upsert(query, update)
+            _apply_update(doc, update)
+            return SimpleNamespace(matched_count=0,
+                                   modified_count=0,
+                                   upserted_id=doc["_id"])
+
+        return SimpleNamespace(matched_count=0, modified_count=0, upserted_id=None)
+
+    async def find_one_and_update(self,
+                                  query: dict,
+                                  update: dict,
+                                  upsert: bool = False,
+                                  return_document: bool = False,
+                                  **kwargs):
+        docs = self._find(query)
+        if not docs and not upsert:
+            return None
+
+        doc = docs[0] if docs else self._upsert(query, update)
+        before = copy.deepcopy(doc) if docs else None
+        _apply_update(doc, update)
+
+        # pymongo.ReturnDocument.AFTER == True
+        return copy.deepcopy(doc) if return_document else before
+
+    async def delete_one(self, query: dict):
+        docs = self._find(query)
+        if docs:
+            del self._docs[docs[0]["_id"]]
+        return SimpleNamespace(deleted_count=len(docs[:1]))
+
+    async def delete_many(self, query: dict):
+        docs = self._find(query)
+        for doc in docs:
+            del self._docs[doc["_id"]]
+        return SimpleNamespace(deleted_count=len(docs))
+
+    async def count_documents(self, query: dict) -> int:
+        return len(self._find(query))
+
+    def aggregate(self, pipeline, **kwargs):
+        raise NotImplementedError(
+            "인메모리 컬렉션은 aggregation 을 지원하지 않습니다. engine=catalog 을 사용하세요.")
+
+
+class InMemoryDatabase:
+
+    def __init__(self, name: str = "benchmark"):
+        self.name = name
+        self._collections: Dict[str, InMemoryCollection] = {}
+
+    def get_collection(self, name: str) -> InMemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = InMemoryCollection(self, name)
+        return self._collections[name]
+
+    def __getitem__(self, name: str) -> InMemoryCollection:
+        return self.get_collection(name)
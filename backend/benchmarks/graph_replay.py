@@ -0,0 +1,315 @@
+"""그래프 재생 벤치마크: 가짜 LLM 과 인메모리 Mongo 로 기록된 대화를 재생한다.
+
+실제 `init_graph` 와 `ChatService.chat_events` 를 사용하되, 모든 LLM 은 고정된 tool 호출과
+구조화 출력을 반환하는 `ScriptedChatModel`, 웹 검색은 가짜 검색 도구, Mongo 는 합성 카탈로그를
+적재한 인메모리 대역으로 바꾼다. 외부 API 와 데이터베이스 없이 실행되므로 CI 에서 그래프 코드의
+성능 회귀를 확인할 수 있다.
+
+노드별 소요 시간, 첫 SSE 이벤트까지의 시간(TTFB), 첫 응답 토큰까지의 시간, 초당 이벤트 수를
+출력한다. `--latency 0 --token-delay 0` (기본값) 이면 측정값이 곧 오케스트레이션 오버헤드다.
+
+    python -m benchmarks.graph_replay --repeat 5 --concurrency 4
+    python -m benchmarks.graph_replay --latency 0.2 --token-delay 0.01 --search-latency 0.3
+    python -m benchmarks.graph_replay --conversations recorded.jsonl
+
+`--conversations` 파일은 한 줄에 대화 하나이며, `{"turns": [...]}` 형태로 `ReplayScript` 의
+턴 항목(message, plans, tool_call, steps, queries, reply)을 담는다.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from langchain_core.runnables import RunnableLambda
+
+from app.core.config import AppConfig
+from common.metrics import registry
+from domains.chat.repositories import ChatRepository
+from domains.chat.services import ChatService
+from domains.common.agents.supervisor import StreamGraphType, init_graph
+from domains.common.config import ResearchConfig, SupervisorConfig
+from domains.saving.config import SavingSearchConfig
+from domains.user.models import User
+from domains.user.repositories import UserMemoryRepository, UserRepository
+
+from benchmarks.fakes import InMemoryDatabase, ReplayScript, ScriptedLLMRegistry
+from benchmarks.research_cache import FakeSearch
+from benchmarks.synthetic import generate_savings
+
+CONVERSATIONS: List[List[dict]] = [
+    [
+        {
+            "message": "월 30만원씩 1년 동안 넣을 적금 추천해줘",
+            "plans": ["saving_node", "explain_node"],
+            "tool_call": {
+                "name": "find_savings_by_monthly_and_term",
+                "args": {
+                    "monthly_deposit": 300_000,
+                    "total_term_months": 12
+                },
+            },
+        },
+        {
+            "message": "두 번째 상품 우대금리 조건 다시 설명해줘",
+            "plans": ["explain_node"],
+        },
+        {
+            "message": "요즘 기준금리 동향도 반영해서 2년짜리로 다시 찾아줘",
+            "plans": ["research_node", "saving_node", "explain_node"],
+            "steps": ["최근 기준금리 동향 확인", "2년 만기 적금 금리 수준 확인"],
+            "tool_call": {
+                "name": "find_savings_by_monthly_and_term",
+                "args": {
+                    "monthly_deposit": 300_000,
+                    "total_term_months": 24
+                },
+            },
+        },
+    ],
+    [
+        {
+            "message": "1000만원 모으려면 매달 50만원씩 넣는 적금 있어?",
+            "plans": ["saving_node", "explain_node"],
+            "tool_call": {
+                "name": "find_savings_by_target_and_monthly",
+                "args": {
+                    "target_amount": 10_000_000,
+                    "monthly_deposit": 500_000
+                },
+            },
+        },
+        {
+            "message": "중도해지해도 불이익 적은 걸로 골라줘",
+            "plans": ["saving_node", "explain_node"],
+            "tool_call": {
+                "name": "find_savings_by_target_and_monthly",
+                "args": {
+                    "target_amount": 10_000_000,
+                    "monthly_deposit": 500_000
+                },
+            },
+        },
+    ],
+    [
+        {
+            "message": "내년 워킹홀리데이 경비 500만원을 1년 안에 모으고 싶어",
+            "plans": ["research_node", "saving_node", "explain_node"],
+            "steps": ["호주 워킹홀리데이 초기 정착금 확인"],
+            "queries": ["호주 워킹홀리데이 경비", "워홀 초기 정착금"],
+            "tool_call": {
+                "name": "find_savings_by_target_and_term",
+                "args": {
+                    "target_amount": 5_000_000,
+                    "total_term_months": 12
+                },
+            },
+        },
+    ],
+]
+
+
+@dataclass
+class TurnResult:
+
+    seconds: float
+    ttfb: float
+    first_token: Optional[float]
+    events: int
+
+
+@dataclass
+class Harness:
+
+    service: ChatService
+    graph: StreamGraphType
+    user_id: str
+    llms: ScriptedLLMRegistry
+    search: FakeSearch
+    results: List[TurnResult] = field(default_factory=list)
+
+
+async def _noop_memory(_: dict):
+    return None
+
+
+async def build(conversations: List[List[dict]], catalog_size: int, latency: float,
+                token_delay: float, search_latency: float) -> Harness:
+    cfg = AppConfig.from_env()
+    db = InMemoryDatabase()
+
+    await db.get_collection("savings").insert_many(
+        s.model_dump(by_alias=True) for s in generate_savings(catalog_size))
+
+    user = User(nickname="benchmark")  # type: ignore
+    users = db.get_collection(cfg.mongo.collections.users)
+    await users.insert_one(user.model_dump(by_alias=True))
+
+    script = ReplayScript(turn for turns in conversations for turn in turns)
+    llms = ScriptedLLMRegistry(script, latency=latency, token_delay=token_delay)
+    search = FakeSearch(search_latency)
+
+    # 캐시는 모두 끄고 매 턴 같은 양의 작업을 수행한다
+    graph = init_graph(
+        llms.get("default"),
+        db,  # type: ignore
+        saving_cfg=SavingSearchConfig(engine="catalog",
+                                      cache_backend="none",
+                                      verdict_cache_backend="none"),
+        supervisor_cfg=SupervisorConfig(router_mode="off",
+                                        route_log_path="",
+                                        plan_samples=1),
+        research_cfg=ResearchConfig(cache_backend="none"),
+        llms=llms,
+        search_tool=search)
+
+    service = ChatService(
+        cfg=cfg,
+        user_repo=UserRepository(cfg=cfg, db=db),  # type: ignore
+        memory_repo=UserMemoryRepository(cfg=cfg, db=db),  # type: ignore
+        chat_repo=ChatRepository(cfg=cfg, db=db),  # type: ignore
+        llms=llms)
+
+    return Harness(service, graph, user.id, llms, search)
+
+
+async def replay_conversation(harness: Harness, turns: List[dict]):
+    chat_id: Optional[str] = None
+
+    for turn in turns:
+        start = time.perf_counter()
+        ttfb = first_token = None
+        events = 0
+
+        async for data in harness.service.chat_events(
+                chat_id=chat_id,
+                user_id=harness.user_id,
+                message=turn["message"],
+                run_stream=harness.graph,
+                memory_chain=RunnableLambda(_noop_memory)):
+            elapsed = time.perf_counter() - start
+            events += 1
+
+            if ttfb is None:
+                ttfb = elapsed
+            if data == "data: [DONE]\n\n":
+                continue
+
+            payload = json.loads(data.removeprefix("data: "))
+            chat_id = chat_id or payload["chat_id"]
+            if first_token is None and payload["status"] == "response":
+                first_token = elapsed
+
+        harness.results.append(
+            TurnResult(time.perf_counter() - start, ttfb or 0.0, first_token, events))
+
+
+async def replay(harness: Harness, conversations: List[List[dict]], concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(turns: List[dict]):
+        async with semaphore:
+            await replay_conversation(harness, turns)
+
+    await asyncio.gather(*[run(turns) for turns in conversations])
+
+    # 제목 생성, 대화 요약 등 응답 뒤에 남은 백그라운드 작업 정리
+    pending = asyncio.all_tasks() - {asyncio.current_task()}
+    await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _ms(values: List[float], q: float) -> str:
+    if not values:
+        return "-"
+    values = sorted(values)
+    return f"{values[min(int(len(values) * q), len(values) - 1)] * 1000:8.1f}"
+
+
+def report(harness: Harness, wall: float):
+    results = harness.results
+    events = sum(r.events for r in results)
+
+    print(f"턴 {len(results)}개, 이벤트 {events}개, {wall:.2f}s "
+          f"({events / wall:.1f} events/s, {len(results) / wall:.1f} turns/s)\n")
+
+    print(f"{'':<16}{'p50(ms)':>10}{'p95(ms)':>10}")
+    rows = [
+        ("TTFB", [r.ttfb for r in results]),
+        ("첫 응답 토큰", [r.first_token for r in results if r.first_token is not None]),
+        ("턴 전체", [r.seconds for r in results]),
+    ]
+    for name, values in rows:
+        print(f"{name:<16}{_ms(values, 0.5):>10}{_ms(values, 0.95):>10}")
+
+    spans = registry.totals("agent_span_seconds")
+    by_kind: Dict[str, float] = defaultdict(float)
+
+    print(f"\n{'노드':<24}{'호출':>6}{'평균(ms)':>10}{'합계(ms)':>10}")
+    for labels, (calls, total) in sorted(spans.items(), key=lambda x: -x[1][1]):
+        kind, name = dict(labels)["kind"], dict(labels)["name"]
+        by_kind[kind] += total
+        if kind == "node":
+            mean = total / calls * 1000
+            print(f"{name:<24}{calls:>6}{mean:>10.2f}{total * 1000:>10.1f}")
+
+    # 동시에 실행된 호출은 겹쳐서 합산된다
+    print(f"\nLLM {by_kind['llm'] * 1000:.1f}ms, "
+          f"웹 검색 {harness.search.calls}회, Mongo {by_kind['mongo'] * 1000:.1f}ms")
+    print("LLM 호출 수 (워밍업 포함): " +
+          ", ".join(f"{name} {stats['calls']}"
+                    for name, stats in sorted(harness.llms.stats.items())))
+
+
+def load_conversations(path: Optional[str]) -> List[List[dict]]:
+    if not path:
+        return CONVERSATIONS
+
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line)["turns"] for line in f if line.strip()]
+
+
+async def main(args: argparse.Namespace):
+    conversations = load_conversations(args.conversations)
+    harness = await build(conversations, args.catalog_size, args.latency,
+                          args.token_delay, args.search_latency)
+
+    # 노드의 진행 로그와 요청별 trace 로그는 측정에서 제외
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(
+        io.StringIO())
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    with quiet:
+        # 카탈로그 적재, 그래프 첫 실행 비용 제외
+        await replay(harness, conversations[:1], 1)
+        harness.results.clear()
+        harness.search.calls = 0
+        registry.reset()
+
+        start = time.perf_counter()
+        await replay(harness, conversations * args.repeat, args.concurrency)
+        wall = time.perf_counter() - start
+
+    logging.disable(logging.NOTSET)
+    report(harness, wall)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--catalog-size", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0, help="LLM 호출당 지연(초)")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="출력 토큰당 지연(초)")
+    parser.add_argument("--search-latency", type=float, default=0.0, help="웹 검색 지연(초)")
+    parser.add_argument("--conversations", help="기록된 대화 JSONL 경로")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
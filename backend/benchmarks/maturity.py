@@ -0,0 +1,163 @@
+"""만기 금액 계산: `$function`(JavaScript) / 네이티브 연산자 / NumPy 속도 비교.
+
+MONGODB_* 환경 변수로 지정한 데이터베이스에 임시 컬렉션을 만들어 측정한다.
+서버에서 JavaScript 실행이 비활성화되어 있으면 `$function` 경로는 실패로 표시된다.
+
+    python -m benchmarks.maturity --size 50000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from common.database import init_mongodb_client
+from domains.common.maturity import maturity_details, maturity_details_expr
+
+MONTHLY_DEPOSIT = 200_000
+TERM_MONTHS = 12
+RATE_FIELDS = ["base_interest_rate", "max_interest_rate", "intermediate_interest_rate"]
+
+# 기존 card 검색 파이프라인에서 사용하던 JavaScript 본문
+_JS_TOTAL = ("function(P, r_annual, n) { const r = r_annual / 12 / 100; "
+             "if (r === 0) return P * n; return P * (Math.pow(1 + r, n) - 1) / r; }")
+_JS_INTEREST = ("function(P, r_annual, n) { const r = r_annual / 12 / 100; "
+                "const total = (r === 0) ? P * n : P * (Math.pow(1 + r, n) - 1) / r; "
+                "return total - (P * n); }")
+
+
+def _js_stage() -> dict:
+
+    def js(body: str, field: str) -> dict:
+        return {
+            "$function": {
+                "body": body,
+                "args": [MONTHLY_DEPOSIT, f"${field}", TERM_MONTHS],
+                "lang": "js",
+            }
+        }
+
+    return {
+        "$addFields": {
+            f"{field}_maturity": {
+                "total_amount": js(_JS_TOTAL, field),
+                "interest": js(_JS_INTEREST, field),
+            } for field in RATE_FIELDS
+        }
+    }
+
+
+def _native_stage() -> dict:
+    return {
+        "$addFields": {
+            f"{field}_maturity":
+                maturity_details_expr(MONTHLY_DEPOSIT, f"${field}", TERM_MONTHS)
+            for field in RATE_FIELDS
+        }
+    }
+
+
+def _sum_stage() -> dict:
+    # 결과 전송 비용을 배제하기 위해 서버에서 합계만 반환
+    return {
+        "$group": {
+            "_id": None,
+            **{
+                field: {
+                    "$sum": f"${field}_maturity.total_amount"
+                } for field in RATE_FIELDS
+            }
+        }
+    }
+
+
+def _summary(timings: List[float]) -> str:
+    p95 = max(timings)
+    if len(timings) > 1:
+        p95 = statistics.quantiles(timings, n=20)[-1]
+    return f"p50 {statistics.median(timings):8.2f}ms  p95 {p95:8.2f}ms"
+
+
+async def _measure(run: Callable, repeat: int):
+    timings: List[float] = []
+    result = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings, result
+
+
+async def run(size: int, repeat: int):
+    rng = random.Random(0)
+    docs = []
+    for _ in range(size):
+        base = round(rng.uniform(1.5, 4.0), 2)
+        docs.append({
+            "base_interest_rate": base,
+            "intermediate_interest_rate": round(base + rng.uniform(0, 1.5), 2),
+            "max_interest_rate": round(base + rng.uniform(0, 4.0), 2),
+        })
+
+    _, database = init_mongodb_client()
+    collection = database.get_collection("bench_maturity")
+
+    await collection.drop()
+    await collection.insert_many([dict(doc) for doc in docs])
+    print(f"금리 도큐먼트 {size:,}건 적재 완료\n")
+
+    try:
+        sums: Dict[str, dict] = {}
+
+        for name, stage in (("$function", _js_stage()), ("native", _native_stage())):
+
+            async def aggregate(stage=stage):
+                return await collection.aggregate([stage, _sum_stage()]).to_list()
+
+            try:
+                timings, result = await _measure(aggregate, repeat)
+            except Exception as e:
+                print(f"  {name:>9}: 실패 ({e})")
+                continue
+
+            sums[name] = result[0] if result else {}
+            print(f"  {name:>9}: {_summary(timings)}")
+
+        rates = {field: np.array([doc[field] for doc in docs]) for field in RATE_FIELDS}
+
+        async def vectorized():
+            return {
+                field:
+                    float(
+                        maturity_details(MONTHLY_DEPOSIT, values,
+                                         TERM_MONTHS)["total_amount"].sum())
+                for field, values in rates.items()
+            }
+
+        timings, sums["numpy"] = await _measure(vectorized, repeat)
+        print(f"  {'numpy':>9}: {_summary(timings)}")
+
+        reference = sums["numpy"]
+        for name, result in sums.items():
+            matched = all(
+                abs(result.get(field, 0) - reference[field]) <= 1e-6 * reference[field]
+                for field in RATE_FIELDS)
+            print(f"  {name:>9} 합계 일치: {matched}")
+
+    finally:
+        await collection.drop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.size, args.repeat))
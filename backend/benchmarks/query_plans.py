@@ -0,0 +1,70 @@
+"""핫 쿼리 실행 계획 회귀 검사.
+
+인덱스 레지스트리를 적용한 뒤, 선언된 핫 쿼리마다 `explain("executionStats")` 을 실행해
+우승 계획에 IXSCAN 이 없거나 COLLSCAN 이 있으면 실패(종료 코드 1)로 처리한다.
+
+    python -m benchmarks.query_plans
+"""
+
+import asyncio
+import sys
+from typing import Iterator, List
+
+from app.core.config import AppConfig
+from common.indexes import HotQuery, index_registry
+
+# 리포지토리 모듈을 불러와야 인덱스와 핫 쿼리가 레지스트리에 선언된다.
+import domains.auth.repositories  # noqa: F401
+import domains.chat.repositories  # noqa: F401
+import domains.user.repositories  # noqa: F401
+
+
+def _stages(plan: dict) -> Iterator[str]:
+    yield plan.get("stage", "")
+    if "inputStage" in plan:
+        yield from _stages(plan["inputStage"])
+    for child in plan.get("inputStages", []):
+        yield from _stages(child)
+
+
+async def _explain(db, query: HotQuery, collection_names) -> List[str]:
+    command = {
+        "find": index_registry.resolve_name(query.collection_key, collection_names),
+        "filter": query.filter,
+    }
+    if query.sort:
+        command["sort"] = dict(query.sort)
+
+    result = await db.command({"explain": command, "verbosity": "executionStats"})
+
+    winning = result["queryPlanner"]["winningPlan"]
+    # 샤딩/SBE 환경에서는 실제 계획이 queryPlan 아래에 있다
+    winning = winning.get("queryPlan", winning)
+
+    return list(_stages(winning))
+
+
+async def run() -> int:
+    cfg = AppConfig.from_env()
+    db = cfg.mongo.connect()
+    names = cfg.mongo.collections
+
+    await index_registry.apply(db, names)
+
+    failures = 0
+    for query in index_registry.hot_queries:
+        stages = await _explain(db, query, names)
+        passed = "IXSCAN" in stages and "COLLSCAN" not in stages
+        failures += not passed
+
+        print(f"{'PASS' if passed else 'FAIL'}  {query.collection_key}.{query.name}"
+              f"  ({' <- '.join(stages)})")
+
+    print(f"\n{len(index_registry.hot_queries) - failures}/"
+          f"{len(index_registry.hot_queries)} 쿼리가 인덱스를 사용합니다.")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run()))
@@ -0,0 +1,108 @@
+"""웹 검색 캐시 효과 측정: 캐시 없음 / 요청 내 중복 제거 / 메모리 캐시 / SQLite 캐시.
+
+지연 시간을 흉내 내는 로컬 가짜 검색 도구를 사용하므로 외부 API 없이 실행된다.
+동시에 들어오는 요청들이 서로 겹치는 검색어(표기만 조금 다른 검색어 포함)를 보낸다.
+
+    python -m benchmarks.research_cache --requests 50 --concurrency 10 --latency 0.3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from typing import List, Optional
+
+from common.cache import AsyncCache, InMemoryCache, SqliteCache
+from domains.common.agents.retrieval_subgraph.research_cache import ResearchCache
+
+QUERIES = [
+    ["맥북 에어 M3 가격", "맥북에어 M3 가격", "맥북 에어 M3 최저가"],
+    ["기준금리 동향", "기준금리 동향 2025", "한국은행 기준금리 전망"],
+    ["호주 워킹홀리데이 경비", "호주 워킹 홀리데이 비용", "워홀 초기 정착금"],
+    ["결혼 자금 평균", "결혼자금 평균 비용", "신혼집 전세 자금"],
+    ["적금 금리 비교", "적금 금리 비교 사이트", "고금리 적금 추천"],
+]
+
+
+class FakeSearch:
+    """Tavily 응답 형태를 흉내 내는 가짜 검색 도구"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def ainvoke(self, input: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return {
+            "title": input,
+            "url": f"https://example.com/{self.calls}",
+            "content": f"{input} 검색 결과"
+        }
+
+
+def _requests(count: int) -> List[List[str]]:
+    """요청마다 주제 하나의 검색어 3개와 공통 주제 검색어 1개를 보낸다."""
+
+    rng = random.Random(0)
+
+    requests = []
+    for _ in range(count):
+        topic, common = QUERIES[rng.randrange(3)], QUERIES[rng.randrange(3, 5)]
+        requests.append([rng.choice(topic) for _ in range(3)] + [rng.choice(common)])
+
+    return requests
+
+
+async def _run(name: str, requests: List[List[str]], concurrency: int, latency: float,
+               cache: Optional[AsyncCache], dedupe: bool):
+    tool = FakeSearch(latency)
+    research = ResearchCache(tool, cache, similarity=0.8 if dedupe else 1.1)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def handle(queries: List[str]) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            if dedupe:
+                await research.fetch_many(queries)
+            else:
+                await asyncio.gather(*[tool.ainvoke(q) for q in queries])
+            return time.perf_counter() - start
+
+    start = time.perf_counter()
+    latencies = sorted(await asyncio.gather(*[handle(q) for q in requests]))
+    elapsed = time.perf_counter() - start
+
+    print(f"  {name:<16} 검색 호출 {tool.calls:4d}회  "
+          f"요청 p50 {latencies[len(latencies) // 2] * 1000:7.1f}ms  "
+          f"전체 {elapsed:6.2f}s  {research.stats if dedupe else ''}")
+
+
+async def run(count: int, concurrency: int, latency: float):
+    requests = _requests(count)
+    print(f"요청 {count}건, 요청당 검색어 {len(requests[0])}개, 검색 지연 {latency}s\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = [
+            ("캐시 없음", None, False),
+            ("중복 제거만", None, True),
+            ("메모리 캐시", InMemoryCache(ttl_seconds=3600), True),
+            ("SQLite 캐시",
+             SqliteCache(os.path.join(tmp, "research.sqlite3"),
+                         prefix="research",
+                         ttl_seconds=3600), True),
+        ]
+        for name, cache, dedupe in cases:
+            await _run(name, requests, concurrency, latency, cache, dedupe)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.concurrency, args.latency))
@@ -0,0 +1,95 @@
+"""$facet 정규화, 별도 통계($group) 정규화, 상위 k 부분 선택의 적금 검색 속도 비교.
+
+MONGODB_* 환경 변수로 지정한 데이터베이스에 임시 컬렉션을 만들어 측정한다.
+
+    python -m benchmarks.saving_ranking --size 50000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from common.database import init_mongodb_client
+from domains.saving.repositories.mutations import insert_savings
+from domains.saving.repositories.retrieval import find_savings
+from domains.saving.schemas import SavingRateWeights
+
+from benchmarks.synthetic import generate_savings
+
+SCENARIOS: List[Dict[str, int]] = [
+    {
+        "monthly_deposit": 200_000,
+        "total_term_months": 12
+    },
+    {
+        "target_amount": 10_000_000,
+        "total_term_months": 24
+    },
+    {
+        "target_amount": 3_000_000,
+        "monthly_deposit": 300_000
+    },
+]
+
+
+async def _measure(collection, ranking: str, params: dict, repeat: int):
+    weights = SavingRateWeights(base=0.3, max=0.3, intermediate=0.4)
+    timings: List[float] = []
+    results = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = await find_savings(collection=collection,
+                                     weights=weights,
+                                     ranking=ranking,
+                                     **params)  # type: ignore
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings, [r.product.id for r in results]
+
+
+async def run(size: int, repeat: int):
+    _, database = init_mongodb_client()
+    collection = database.get_collection("bench_savings")
+
+    await collection.drop()
+    await insert_savings(collection, generate_savings(size))
+    print(f"합성 적금 {size:,}건 적재 완료")
+
+    try:
+        for params in SCENARIOS:
+            print(f"\n{params}")
+            ranked = {}
+
+            for ranking in ("facet", "stats", "topk"):
+                try:
+                    timings, ranked[ranking] = await _measure(
+                        collection, ranking, params, repeat)
+                except RuntimeError as e:
+                    print(f"  {ranking:>5}: 실패 ({e})")
+                    continue
+
+                p95 = max(timings)
+                if repeat > 1:
+                    p95 = statistics.quantiles(timings, n=20)[-1]
+
+                print(f"  {ranking:>5}: p50 {statistics.median(timings):8.2f}ms"
+                      f"  p95 {p95:8.2f}ms")
+
+            for ranking in ("stats", "topk"):
+                if "facet" in ranked and ranking in ranked:
+                    print(f"  {ranking:>5} 동일 결과: {ranked['facet'] == ranked[ranking]}")
+
+    finally:
+        await collection.drop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.size, args.repeat))
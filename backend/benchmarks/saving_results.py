@@ -0,0 +1,90 @@
+"""SavingSearchResult 생성 비용 비교: 전체 검증(`__init__`) / `from_trusted` / 상품 캐시.
+
+aggregation 결과와 같이 임시 필드가 붙은 도큐먼트와 `$project` 로 정리한 도큐먼트를
+각각 사용해 결과 1건당 생성 시간을 측정한다. 데이터베이스 없이 실행된다.
+
+    python -m benchmarks.saving_results --size 5000 --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from domains.saving.models import Saving
+from domains.saving.repositories.mutations import materialize_rate_fields
+from domains.saving.repositories.retrieval import _result_fields
+from domains.saving.schemas import SavingSearchResult
+
+from benchmarks.synthetic import generate_savings
+
+
+def _raw_docs(size: int) -> List[dict]:
+    """aggregation 파이프라인이 반환하는 형태의 도큐먼트 (임시 필드 포함)."""
+
+    docs = []
+    for i, saving in enumerate(generate_savings(size)):
+        docs.append({
+            **saving.model_dump(by_alias=True),
+            **materialize_rate_fields(saving),
+            "_termMonths": 12,
+            "_monthlyAmount": 200_000,
+            "baseRate": 3.0,
+            "minBase": 1.5,
+            "maxBase": 4.0,
+            "minMax": 1.5,
+            "maxMax": 9.0,
+            "normBase": 0.6,
+            "normMax": 0.4,
+            "score": 0.5,
+            "principal": 2_400_000,
+            "interest": 72_000.0,
+            "base_rate_rank": i + 1,
+            "max_rate_rank": i + 1,
+        })
+    return docs
+
+
+def _per_result_us(build: Callable[[dict], SavingSearchResult], docs: List[dict],
+                   repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for doc in docs:
+            build(doc)
+        timings.append((time.perf_counter() - start) / len(docs) * 1_000_000)
+    return statistics.median(timings)
+
+
+def run(size: int, repeat: int):
+    raw_docs = _raw_docs(size)
+    projected = [{
+        k: v for k, v in doc.items() if k in _result_fields
+    } for doc in raw_docs]
+
+    mismatched = sum(
+        SavingSearchResult(
+            **doc).model_dump() != SavingSearchResult.from_trusted(doc).model_dump()
+        for doc in raw_docs)
+    print(f"결과 불일치: {mismatched}/{size}\n")
+
+    products = {doc["_id"]: Saving.model_validate(doc) for doc in projected}
+
+    cases = [
+        ("__init__ (원본 도큐먼트)", lambda d: SavingSearchResult(**d), raw_docs),
+        ("__init__ ($project)", lambda d: SavingSearchResult(**d), projected),
+        ("from_trusted", SavingSearchResult.from_trusted, projected),
+        ("from_trusted (상품 캐시)",
+         lambda d: SavingSearchResult.from_trusted(d, products[d["_id"]]), projected),
+    ]
+    for name, build, docs in cases:
+        print(f"  {name:<26} {_per_result_us(build, docs, repeat):8.2f}µs / 건")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.size, args.repeat)
@@ -0,0 +1,108 @@
+"""벤치마크용 합성 적금 카탈로그 생성기."""
+
+import random
+from typing import List, get_args
+
+from domains.common.types import Institution
+from domains.saving.models import Saving
+
+_INSTITUTIONS = get_args(Institution)
+_TERMS = [3, 6, 12, 24, 36]
+
+
+def _term_policy(rng: random.Random) -> dict:
+    match rng.choices(["RANGE", "FIXED_DURATION", "CHOICES", "FIXED_DATE"],
+                      weights=[5, 3, 2, 1])[0]:
+        case "RANGE":
+            return {
+                "policy_type": "RANGE",
+                "min_term": rng.choice([1, 6, 12]),
+                "max_term": rng.choice([12, 24, 36, 60, None]),
+            }
+        case "FIXED_DURATION":
+            term = rng.choice(_TERMS)
+            return {"policy_type": "FIXED_DURATION", "min_term": term, "max_term": term}
+        case "CHOICES":
+            return {"policy_type": "CHOICES", "choices": rng.sample(_TERMS, k=3)}
+        case _:
+            return {"policy_type": "FIXED_DATE"}
+
+
+def _amount_policy(rng: random.Random) -> dict:
+    match rng.choices(["RANGE", "CHOICES", "FIXED_AMOUNT"], weights=[6, 2, 1])[0]:
+        case "RANGE":
+            return {
+                "policy_type": "RANGE",
+                "min_amount": rng.choice([1_000, 10_000, 50_000]),
+                "max_amount": rng.choice([500_000, 1_000_000, 3_000_000, None]),
+            }
+        case "CHOICES":
+            return {
+                "policy_type": "CHOICES",
+                "choices": rng.sample([100_000, 200_000, 300_000, 500_000], k=2),
+            }
+        case _:
+            return {
+                "policy_type": "FIXED_AMOUNT",
+                "fixed_amount": rng.choice([100_000, 200_000, 300_000]),
+            }
+
+
+def _base_interest_rate(rng: random.Random) -> float | List[dict]:
+    if rng.random() < 0.5:
+        return round(rng.uniform(1.5, 4.0), 2)
+
+    bounds = [1, 6, 12, 24, None]
+    rate = rng.uniform(1.5, 3.0)
+    tiers = []
+    for min_term, max_term in zip(bounds, bounds[1:]):
+        tiers.append({
+            "min_term": min_term,
+            "max_term": max_term,
+            "interest_rate": round(rate, 2)
+        })
+        rate += rng.uniform(0, 0.5)
+    return tiers
+
+
+def _preferential_rates(rng: random.Random) -> List[dict]:
+    return [{
+        "description":
+            f"우대 조건 {i + 1}",
+        "rate_type":
+            rng.choice(["user_choice", "pre_condition", "event_based"]),
+        "tiers": [{
+            "condition": f"조건 {i + 1}-{j + 1}",
+            "interest_rate": round(rng.uniform(0.1, 2.0), 2)
+        } for j in range(rng.randint(1, 2))],
+    } for i in range(rng.randint(0, 3))]
+
+
+def generate_savings(size: int, seed: int = 0) -> List[Saving]:
+    """`size` 개의 합성 적금 상품을 생성한다."""
+
+    rng = random.Random(seed)
+    savings: List[Saving] = []
+
+    for i in range(size):
+        base = _base_interest_rate(rng)
+        prefs = _preferential_rates(rng)
+
+        base_max = base if isinstance(base, float) else max(
+            tier["interest_rate"] for tier in base)
+        pref_sum = sum(max(t["interest_rate"] for t in p["tiers"]) for p in prefs)
+
+        savings.append(
+            Saving.model_validate({
+                "_id": f"synthetic-{i}",
+                "name": f"합성 적금 {i}",
+                "institution": rng.choice(_INSTITUTIONS),
+                "targets": "실명의 개인",
+                "term": _term_policy(rng),
+                "amount": _amount_policy(rng),
+                "base_interest_rate": base,
+                "preferential_rates": prefs,
+                "max_interest_rate": round(base_max + pref_sum, 2),
+            }))
+
+    return savings
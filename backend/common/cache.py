@@ -0,0 +1,271 @@
+import asyncio
+import logging
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Hashable, Literal, Optional, Protocol
+
+from common.logger import _logger
+
+logger = _logger(__name__)
+
+CacheBackendType = Literal["none", "memory", "sqlite", "redis"]
+
+
+@dataclass
+class CacheStats:
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "hit_ratio": self.hit_ratio}
+
+
+class AsyncCache(Protocol):
+    """캐시 백엔드 인터페이스"""
+
+    stats: CacheStats
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        ...
+
+    async def set(self, key: Hashable, value: Any):
+        ...
+
+    async def clear(self):
+        ...
+
+
+class InMemoryCache:
+    """프로세스 내부 LRU + TTL 캐시.
+
+    Attributes:
+        max_size (int): 보관할 최대 항목 수. 초과 시 가장 오래 사용되지 않은 항목을 제거
+        ttl_seconds (float): 항목 유효 시간
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+        self._items: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._items.get(key)
+
+        if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+            del self._items[key]
+            self.stats.evictions += 1
+            entry = None
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.stats.hits += 1
+        return entry[1]
+
+    async def set(self, key: Hashable, value: Any):
+        self._items[key] = (time.monotonic(), value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def clear(self):
+        self._items.clear()
+
+
+class SqliteCache:
+    """SQLite 파일에 저장하는 LRU + TTL 캐시. 프로세스를 재시작해도 항목이 유지된다.
+
+    같은 파일을 사용하는 캐시들은 `prefix` 별 테이블로 구분된다.
+    조회/저장은 스레드에서 실행해 이벤트 루프를 막지 않는다.
+
+    Attributes:
+        path (str): SQLite 파일 경로
+        max_size (int): 보관할 최대 항목 수. 초과 시 가장 오래 사용되지 않은 항목을 제거
+        ttl_seconds (float): 항목 유효 시간
+    """
+
+    def __init__(self,
+                 path: str = "cache.sqlite3",
+                 prefix: str = "cache",
+                 max_size: int = 1024,
+                 ttl_seconds: float = 300):
+        self.path = path
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+        self._table = re.sub(r"\W", "_", prefix)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path,
+                                     check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {self._table} ("
+                           "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                           "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)")
+        self._conn.execute(f"CREATE INDEX IF NOT EXISTS {self._table}_accessed_at "
+                           f"ON {self._table} (accessed_at)")
+
+    def _get(self, key: str) -> Optional[Any]:
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, stored_at FROM {self._table} WHERE key = ?",
+                (key,)).fetchone()
+
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute(f"DELETE FROM {self._table} WHERE key = ?", (key,))
+                self.stats.evictions += 1
+                row = None
+
+            if row is None:
+                self.stats.misses += 1
+                return None
+
+            self._conn.execute(
+                f"UPDATE {self._table} SET accessed_at = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+
+        return pickle.loads(row[0])
+
+    def _set(self, key: str, value: bytes):
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?)",
+                (key, value, now, now))
+
+            size = self._conn.execute(
+                f"SELECT COUNT(*) FROM {self._table}").fetchone()[0]
+            if size > self.max_size:
+                self._conn.execute(
+                    f"DELETE FROM {self._table} WHERE key IN (SELECT key FROM "
+                    f"{self._table} ORDER BY accessed_at LIMIT ?)",
+                    (size - self.max_size,))
+                self.stats.evictions += size - self.max_size
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        try:
+            return await asyncio.to_thread(self._get, repr(key))
+        except sqlite3.Error as e:
+            logger(f"캐시 조회에 실패했습니다. ({e})", level=logging.WARNING)
+            self.stats.misses += 1
+            return None
+
+    async def set(self, key: Hashable, value: Any):
+        try:
+            await asyncio.to_thread(self._set, repr(key), pickle.dumps(value))
+        except sqlite3.Error as e:
+            logger(f"캐시 저장에 실패했습니다. ({e})", level=logging.WARNING)
+
+    async def clear(self):
+
+        def _clear():
+            with self._lock:
+                self._conn.execute(f"DELETE FROM {self._table}")
+
+        await asyncio.to_thread(_clear)
+
+
+class RedisCache:
+    """Redis 호환 저장소를 사용하는 캐시. 여러 uvicorn 워커가 같은 캐시를 공유한다.
+
+    `client` 는 `redis.asyncio.Redis` 와 같이 비동기 get/set/scan_iter/delete 를
+    제공하는 객체여야 한다. 만료와 용량 제한은 저장소의 TTL, maxmemory 정책을 따른다.
+    """
+
+    def __init__(self, client: Any, prefix: str = "cache", ttl_seconds: float = 300):
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+
+    def _key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{key!r}"
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        try:
+            raw = await self.client.get(self._key(key))
+        except Exception as e:
+            logger(f"캐시 조회에 실패했습니다. ({e})", level=logging.WARNING)
+            raw = None
+
+        if raw is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return pickle.loads(raw)
+
+    async def set(self, key: Hashable, value: Any):
+        try:
+            await self.client.set(self._key(key),
+                                  pickle.dumps(value),
+                                  ex=max(1, int(self.ttl_seconds)))
+        except Exception as e:
+            logger(f"캐시 저장에 실패했습니다. ({e})", level=logging.WARNING)
+
+    async def clear(self):
+        keys = [key async for key in self.client.scan_iter(f"{self.prefix}:*")]
+        if keys:
+            await self.client.delete(*keys)
+
+
+def create_cache(
+    backend: CacheBackendType,
+    *,
+    prefix: str = "cache",
+    max_size: int = 1024,
+    ttl_seconds: float = 300,
+    redis_url: str = "redis://localhost:6379/0",
+    sqlite_path: str = "cache.sqlite3",
+    client: Any = None,
+) -> Optional[AsyncCache]:
+    """설정값으로 캐시 백엔드를 생성한다. `none` 이면 캐시를 사용하지 않는다."""
+
+    match backend:
+        case "none":
+            return None
+
+        case "memory":
+            return InMemoryCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+        case "sqlite":
+            return SqliteCache(sqlite_path,
+                               prefix=prefix,
+                               max_size=max_size,
+                               ttl_seconds=ttl_seconds)
+
+        case "redis":
+            if client is None:
+                try:
+                    from redis.asyncio import Redis
+                except ImportError as e:
+                    raise RuntimeError("redis 캐시를 사용하려면 redis 패키지가 필요합니다.") from e
+
+                client = Redis.from_url(redis_url)
+
+            return RedisCache(client, prefix=prefix, ttl_seconds=ttl_seconds)
+
+        case _:
+            raise ValueError(f"지원하지 않는 캐시 백엔드입니다: {backend}")
@@ -0,0 +1,94 @@
+import logging
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
+
+from common.logger import _logger
+
+logger = _logger(__name__)
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """인덱스를 반드시 타야 하는 자주 쓰이는 쿼리.
+
+    Attributes:
+        collection_key (str): 인덱스를 선언한 컬렉션 키
+        name (str): 쿼리 식별 이름
+        filter (dict): find 필터 (값은 임의의 예시 값)
+        sort (List[Tuple[str, int]] | None): 정렬 조건
+    """
+
+    collection_key: str
+    name: str
+    filter: Dict[str, Any]
+    sort: Optional[List[Tuple[str, int]]] = None
+
+
+class IndexRegistry:
+    """리포지토리가 선언한 인덱스와 핫 쿼리를 모아 두었다가 한 번에 적용한다.
+
+    컬렉션은 `MongoCollections` 필드 이름(예: "chats")으로 선언하며,
+    적용 시 설정된 실제 컬렉션 이름으로 변환된다. 설정에 없는 키는 그대로 사용한다.
+    """
+
+    def __init__(self):
+        self._indexes: Dict[str, Dict[str, IndexModel]] = {}
+        self._queries: Dict[str, HotQuery] = {}
+
+    def declare(self, collection_key: str, *indexes: IndexModel):
+        declared = self._indexes.setdefault(collection_key, {})
+        for index in indexes:
+            declared[index.document["name"]] = index
+
+    def declare_query(self,
+                      collection_key: str,
+                      name: str,
+                      filter: Dict[str, Any],
+                      sort: Optional[List[Tuple[str, int]]] = None):
+        self._queries[f"{collection_key}.{name}"] = HotQuery(collection_key, name,
+                                                             filter, sort)
+
+    @property
+    def hot_queries(self) -> List[HotQuery]:
+        return list(self._queries.values())
+
+    @staticmethod
+    def resolve_name(collection_key: str, collection_names: Any = None) -> str:
+        names: Mapping[str, str] = {}
+        if is_dataclass(collection_names):
+            names = asdict(collection_names)  # type: ignore
+        elif collection_names:
+            names = collection_names
+
+        return names.get(collection_key, collection_key)
+
+    async def apply(self,
+                    db: AsyncIOMotorDatabase,
+                    collection_names: Any = None) -> Dict[str, List[str]]:
+        """선언된 인덱스를 생성한다. 이미 같은 인덱스가 있으면 아무 일도 하지 않는다.
+
+        Args:
+            db: 대상 데이터베이스
+            collection_names: 컬렉션 키 → 실제 이름 (`MongoCollections` 또는 dict)
+
+        Returns:
+            Dict[str, List[str]]: 컬렉션별로 적용된 인덱스 이름
+        """
+
+        applied: Dict[str, List[str]] = {}
+
+        for key, indexes in self._indexes.items():
+            name = self.resolve_name(key, collection_names)
+            try:
+                applied[name] = await db.get_collection(name).create_indexes(
+                    list(indexes.values()))
+            except Exception as e:
+                logger(f"{name} 인덱스 생성에 실패했습니다. ({e})", level=logging.WARNING)
+
+        return applied
+
+
+index_registry = IndexRegistry()
@@ -0,0 +1,458 @@
+import asyncio
+import inspect
+import json
+import logging
+import threading
+import time
+import uuid
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langgraph.config import get_config
+
+from common.logger import _logger
+
+logger = _logger(__name__)
+
+# RunnableConfig["configurable"] 에서 요청 트레이스를 찾는 키
+TRACE_KEY = "trace"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+                   60.0)
+
+# 1M 토큰당 (입력, 출력) 달러 가격.
+# 목록에 없는 모델은 비용 대신 llm_unpriced_tokens_total 로 토큰 수를 집계한다.
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gpt-5": (1.25, 10.0),
+    "gpt-5-mini": (0.25, 2.0),
+    "gpt-5-nano": (0.05, 0.4),
+    "gpt-4o": (2.5, 10.0),
+    "gpt-4o-mini": (0.15, 0.6),
+    "gpt-4.1": (2.0, 8.0),
+    "gpt-4.1-mini": (0.4, 1.6),
+    "solar-pro": (0.25, 0.25),
+    "solar-pro2": (0.25, 0.25),
+    "solar-mini": (0.15, 0.15),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = [*labels, *extra]
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+@dataclass
+class Histogram:
+
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self):
+        self.counts = self.counts or [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """프로세스 단위 히스토그램, 카운터 저장소.
+
+    `render` 는 Prometheus 텍스트 형식으로 출력한다. 외부 의존성 없이 `/api/v1/metrics`
+    에서 그대로 수집할 수 있다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = defaultdict(dict)
+        self._counters: Dict[str, Dict[Labels, float]] = defaultdict(dict)
+        self._gauges: Dict[str, Dict[Labels, float]] = defaultdict(dict)
+        self._help: Dict[str, str] = {}
+
+    def describe(self, metric: str, help: str):
+        self._help[metric] = help
+
+    def observe(self, metric: str, value: float, **labels):
+        key = _labels(labels)
+        with self._lock:
+            histograms = self._histograms[metric]
+            if key not in histograms:
+                histograms[key] = Histogram()
+            histograms[key].observe(value)
+
+    def inc(self, metric: str, value: float = 1, **labels):
+        key = _labels(labels)
+        with self._lock:
+            counters = self._counters[metric]
+            counters[key] = counters.get(key, 0) + value
+
+    def set(self, metric: str, value: float, **labels):
+        with self._lock:
+            self._gauges[metric][_labels(labels)] = value
+
+    def totals(self, metric: str) -> Dict[Labels, Tuple[int, float]]:
+        """히스토그램 레이블별 (관측 수, 합계)"""
+
+        with self._lock:
+            return {k: (h.count, h.total) for k, h in self._histograms[metric].items()}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def render(self) -> str:
+        lines: List[str] = []
+
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} histogram")
+
+                for labels, h in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip([*h.buckets, "+Inf"], h.counts):
+                        cumulative += count
+                        le = _format_labels(labels, (("le", str(bound)),))
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {h.total}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+
+            for kind, metrics in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, series in sorted(metrics.items()):
+                    if name in self._help:
+                        lines.append(f"# HELP {name} {self._help[name]}")
+                    lines.append(f"# TYPE {name} {kind}")
+
+                    for labels, value in sorted(series.items()):
+                        lines.append(f"{name}{_format_labels(labels)} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+registry.describe("agent_span_seconds", "노드, LLM, 도구, Mongo 호출 소요 시간")
+registry.describe("agent_queue_seconds", "동시 실행 제한으로 대기한 시간")
+registry.describe("agent_request_seconds", "채팅 한 턴의 그래프 실행 시간")
+registry.describe("llm_tokens_total", "LLM 토큰 사용량")
+registry.describe("llm_cost_usd_total", "MODEL_PRICES 기준 추정 LLM 비용")
+registry.describe("llm_unpriced_tokens_total", "MODEL_PRICES 에 가격이 없어 비용에서 빠진 토큰")
+registry.describe("cache_requests_total", "캐시 조회 결과")
+
+_unpriced_models: set = set()
+
+
+def model_price(model: str) -> Optional[Tuple[float, float]]:
+    """모델의 1M 토큰당 (입력, 출력) 가격. `gpt-5-2025-08-07` 과 같은 스냅샷 이름은 가장 긴
+    접두어로 찾는다."""
+
+    if model in MODEL_PRICES:
+        return MODEL_PRICES[model]
+
+    prefixes = [name for name in MODEL_PRICES if model.startswith(name + "-")]
+    return MODEL_PRICES[max(prefixes, key=len)] if prefixes else None
+
+
+@dataclass
+class Span:
+
+    kind: str
+    name: str
+    seconds: float
+    queue_seconds: float = 0.0
+    start: float = 0.0
+
+
+class RequestTrace:
+    """채팅 한 턴 동안의 구간 기록.
+
+    그래프 실행 시 `RunnableConfig["configurable"][TRACE_KEY]` 로 전달되며,
+    `finish` 에서 요청 단위 요약을 한 줄의 JSON 로그로 남긴다.
+
+    Attributes:
+        chat_id (str): 채팅 id
+        request_id (str): 요청 식별자
+    """
+
+    def __init__(self, chat_id: str = "", request_id: Optional[str] = None):
+        self.chat_id = chat_id
+        self.request_id = request_id or uuid.uuid4().hex[:12]
+        self.started = time.perf_counter()
+
+        self.spans: List[Span] = []
+        self.counters: Counter = Counter()
+
+    def add(self, kind: str, name: str, seconds: float, queue_seconds: float = 0.0):
+        start = time.perf_counter() - seconds - self.started
+        self.spans.append(Span(kind, name, seconds, queue_seconds, start))
+
+    def summary(self) -> dict:
+        by_kind: Dict[str, float] = defaultdict(float)
+        by_name: Dict[str, float] = defaultdict(float)
+        queued = 0.0
+        for span in self.spans:
+            by_kind[span.kind] += span.seconds
+            by_name[f"{span.kind}:{span.name}"] += span.seconds
+            queued += span.queue_seconds
+
+        return {
+            "chat_id": self.chat_id,
+            "request_id": self.request_id,
+            "seconds": round(time.perf_counter() - self.started, 3),
+            "queue_seconds": round(queued, 3),
+            "by_kind": {
+                k: round(v, 3) for k, v in by_kind.items()
+            },
+            "by_name": {
+                k: round(v, 3) for k, v in by_name.items()
+            },
+            **{
+                k: round(v, 6) for k, v in self.counters.items()
+            },
+        }
+
+    def finish(self) -> dict:
+        seconds = time.perf_counter() - self.started
+        registry.observe("agent_request_seconds", seconds)
+
+        summary = self.summary()
+        logger(f"trace {json.dumps(summary, ensure_ascii=False)}", level=logging.INFO)
+        return summary
+
+
+def current_trace() -> Optional[RequestTrace]:
+    """실행 중인 그래프의 요청 트레이스. 그래프 밖에서는 None."""
+
+    try:
+        return get_config().get("configurable", {}).get(TRACE_KEY)
+    except RuntimeError:
+        return None
+
+
+def record(kind: str,
+           name: str,
+           seconds: float,
+           *,
+           queue_seconds: float = 0.0,
+           trace: Optional[RequestTrace] = None):
+    """구간 하나를 프로세스 히스토그램과 요청 트레이스에 기록한다."""
+
+    registry.observe("agent_span_seconds", seconds, kind=kind, name=name)
+    if queue_seconds:
+        registry.observe("agent_queue_seconds", queue_seconds, kind=kind, name=name)
+
+    trace = trace or current_trace()
+    if trace is not None:
+        trace.add(kind, name, seconds, queue_seconds)
+
+
+def count(metric: str,
+          value: float = 1,
+          *,
+          trace: Optional[RequestTrace] = None,
+          **labels):
+    """카운터를 증가시키고 요청 트레이스에도 `metric[label=...]` 이름으로 누적한다."""
+
+    registry.inc(metric, value, **labels)
+
+    trace = trace or current_trace()
+    if trace is not None:
+        suffix = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        trace.counters[f"{metric}[{suffix}]" if suffix else metric] += value
+
+
+@asynccontextmanager
+async def timed(kind: str, name: str, trace: Optional[RequestTrace] = None):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(kind, name, time.perf_counter() - start, trace=trace)
+
+
+@asynccontextmanager
+async def queued(semaphore: asyncio.Semaphore, kind: str, name: str):
+    """세마포어 대기 시간과 실행 시간을 나누어 기록한다."""
+
+    start = time.perf_counter()
+    async with semaphore:
+        acquired = time.perf_counter()
+        try:
+            yield
+        finally:
+            record(kind,
+                   name,
+                   time.perf_counter() - acquired,
+                   queue_seconds=acquired - start)
+
+
+def instrumented(kind: str, name: Optional[str] = None):
+    """비동기 함수의 소요 시간을 기록하는 데코레이터"""
+
+    def decorator(func):
+
+        @wraps(func)
+        async def wrapped(*args, **kwargs):
+            async with timed(kind, name or func.__name__):
+                return await func(*args, **kwargs)
+
+        return wrapped
+
+    return decorator
+
+
+def instrument_node(name: str, node: Callable) -> Callable:
+    """그래프 노드의 소요 시간을 기록하는 래퍼.
+
+    `functools.wraps` 로 원래 시그니처를 유지하므로 LangGraph 가 `config` 인자 주입 여부를
+    그대로 판단한다.
+    """
+
+    if inspect.iscoroutinefunction(node):
+
+        @wraps(node)
+        async def async_wrapped(*args, **kwargs):
+            async with timed("node", name):
+                return await node(*args, **kwargs)
+
+        return async_wrapped
+
+    @wraps(node)
+    def wrapped(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return node(*args, **kwargs)
+        finally:
+            record("node", name, time.perf_counter() - start)
+
+    return wrapped
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """LLM, 도구 호출 시간과 토큰 사용량을 기록하는 콜백.
+
+    요청마다 생성해 그래프 실행 config 의 callbacks 로 전달하면, 노드 안의 LLM, 도구 호출에
+    자동으로 상속된다.
+    """
+
+    run_inline = True
+
+    def __init__(self, trace: Optional[RequestTrace] = None):
+        self.trace = trace
+        self._runs: Dict[UUID, Tuple[str, str, float]] = {}
+
+    @staticmethod
+    def _model_name(serialized: Optional[dict], metadata: Optional[dict],
+                    kwargs: dict) -> str:
+        params = kwargs.get("invocation_params") or {}
+        return str((metadata or {}).get("ls_model_name") or params.get("model") or
+                   params.get("model_name") or (serialized or {}).get("name") or
+                   "unknown")
+
+    def on_chat_model_start(self,
+                            serialized,
+                            messages,
+                            *,
+                            run_id,
+                            metadata=None,
+                            **kwargs):
+        model = self._model_name(serialized, metadata, kwargs)
+        self._runs[run_id] = ("llm", model, time.perf_counter())
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        model = self._model_name(serialized, metadata, kwargs)
+        self._runs[run_id] = ("llm", model, time.perf_counter())
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs):
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+
+        _, model, start = run
+        record("llm", model, time.perf_counter() - start, trace=self.trace)
+
+        prompt_tokens, completion_tokens = _token_usage(response)
+        count("llm_tokens_total",
+              prompt_tokens,
+              trace=self.trace,
+              model=model,
+              type="prompt")
+        count("llm_tokens_total",
+              completion_tokens,
+              trace=self.trace,
+              model=model,
+              type="completion")
+
+        price = model_price(model)
+        if price is None:
+            count("llm_unpriced_tokens_total",
+                  prompt_tokens + completion_tokens,
+                  trace=self.trace,
+                  model=model)
+            if model not in _unpriced_models:
+                _unpriced_models.add(model)
+                logger(f"MODEL_PRICES 에 {model} 가격이 없어 비용을 집계하지 않습니다.",
+                       level=logging.WARNING)
+            return
+
+        cost = (prompt_tokens * price[0] + completion_tokens * price[1]) / 1e6
+        if cost:
+            count("llm_cost_usd_total", cost, trace=self.trace, model=model)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            count("llm_errors_total", trace=self.trace, model=run[1])
+
+    def on_tool_start(self, serialized, input_str, *, run_id, **kwargs):
+        name = (serialized or {}).get("name") or kwargs.get("name") or "tool"
+        self._runs[run_id] = ("tool", name, time.perf_counter())
+
+    def on_tool_end(self, output, *, run_id, **kwargs):
+        run = self._runs.pop(run_id, None)
+        if run is not None:
+            record("tool", run[1], time.perf_counter() - run[2], trace=self.trace)
+
+    def on_tool_error(self, error, *, run_id, **kwargs):
+        self.on_tool_end(None, run_id=run_id)
+
+
+def _token_usage(response: LLMResult) -> Tuple[int, int]:
+    """(입력 토큰, 출력 토큰). 메시지의 usage_metadata 를 우선 사용한다."""
+
+    prompt_tokens = completion_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata",
+                            None)
+            if usage:
+                prompt_tokens += usage.get("input_tokens", 0)
+                completion_tokens += usage.get("output_tokens", 0)
+
+    if not (prompt_tokens or completion_tokens):
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        prompt_tokens = usage.get("prompt_tokens", 0)
+        completion_tokens = usage.get("completion_tokens", 0)
+
+    return prompt_tokens, completion_tokens
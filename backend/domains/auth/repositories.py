@@ -1,8 +1,10 @@
 from typing import Dict, Optional, Any
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
 from pymongo.results import DeleteResult, UpdateResult
 
 from app.core.config import AppConfig
+from common.indexes import index_registry
 from domains.user.models import Token
 
 
@@ -11,12 +13,6 @@ class TicketRepository:
     def __init__(self, *, cfg: AppConfig, db: AsyncIOMotorDatabase):
         self.col = db.get_collection(cfg.mongo.collections.tickets)
 
-    async def ensure_indexes(self) -> None:
-        await self.col.create_index([("ticket_hash", 1)], unique=True, background=True)
-        await self.col.create_index([("expires_at", 1)],
-                                    expireAfterSeconds=0,
-                                    background=True)
-
     async def insert(self, doc: dict) -> None:
         await self.col.insert_one(doc)
 
@@ -28,6 +24,14 @@ class TicketRepository:
         return await self.col.find_one_and_delete(query)
 
 
+index_registry.declare(
+    "tickets",
+    IndexModel([("ticket_hash", ASCENDING)], unique=True),
+    IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0),
+)
+index_registry.declare_query("tickets", "by_ticket_hash", {"ticket_hash": ""})
+
+
 class TokenRepository:
 
     def __init__(self, *, cfg: AppConfig, db: AsyncIOMotorDatabase):
@@ -71,3 +75,12 @@ class TokenRepository:
 
         result: DeleteResult = await self.col.delete_many(query)
         return result.deleted_count
+
+
+index_registry.declare(
+    "tokens",
+    IndexModel([("refresh_token", ASCENDING)]),
+    IndexModel([("user_id", ASCENDING)]),
+)
+index_registry.declare_query("tokens", "by_refresh_token", {"refresh_token": ""})
+index_registry.declare_query("tokens", "by_user_id", {"user_id": ""})
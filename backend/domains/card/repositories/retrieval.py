@@ -1,10 +1,12 @@
 from typing import Optional, List
 from motor.motor_asyncio import AsyncIOMotorCollection
 
+from domains.common.maturity import maturity_details_expr, months_to_target_expr
 from domains.saving.schemas import (
     SavingRateWeights,
     SavingSearchResult,
 )
+from domains.saving.types import SavingRankingMode
 
 
 async def search_savings(
@@ -13,6 +15,7 @@ async def search_savings(
     monthly_deposit: Optional[int] = None,
     target_amount: Optional[int] = None,
     total_term_months: Optional[int] = None,
+    ranking: SavingRankingMode = "facet",
 ) -> List[SavingSearchResult]:
     """다중 조건과 Weighted Sum을 결합한 통합 적금 상품 검색 수행.
 
@@ -22,6 +25,8 @@ async def search_savings(
         target_amount (Optional[int]): 목표 금액. 월 납입액과 함께 주어지면 도달 기간 계산.
         total_term_months (Optional[int]): 총 납입 기간(개월). 주어지면 상품 필터링 적용 및 만기 금액 계산.
         k (int): RRF 랭킹 가중치 상수
+        ranking (SavingRankingMode): 금리 정규화 방식 ("facet" | "stats" | "topk").
+            전체 결과를 반환하므로 "topk" 는 "stats" 와 같이 동작한다.
 
     Returns:
         List[dict]: 하이브리드 랭킹 순으로 정렬된 상품 목록. 조건에 따라 추가 계산 결과가 포함됩니다.
@@ -62,24 +67,32 @@ async def search_savings(
                     }
                 ]
             },
+            # 적재 시 계산된 값이 있으면 그대로 사용
             "intermediate_interest_rate": {
-                "$add": [
-                    "$base_interest_rate", {
-                        "$sum": {
-                            "$map": {
-                                "input": {
-                                    "$filter": {
-                                        "input": "$preferential_rates",
-                                        "as": "rate",
-                                        "cond": {
-                                            "$eq": ["$$rate.rate_type", "user_choice"]
-                                        }
+                "$ifNull": [
+                    "$intermediate_interest_rate", {
+                        "$add": [
+                            "$base_interest_rate", {
+                                "$sum": {
+                                    "$map": {
+                                        "input": {
+                                            "$filter": {
+                                                "input": "$preferential_rates",
+                                                "as": "rate",
+                                                "cond": {
+                                                    "$eq": [
+                                                        "$$rate.rate_type",
+                                                        "user_choice"
+                                                    ]
+                                                }
+                                            }
+                                        },
+                                        "as": "filtered_rate",
+                                        "in": "$$filtered_rate.interest_rate"
                                     }
-                                },
-                                "as": "filtered_rate",
-                                "in": "$$filtered_rate.interest_rate"
+                                }
                             }
-                        }
+                        ]
                     }
                 ]
             }
@@ -89,52 +102,63 @@ async def search_savings(
     # 3. 조건부 금융 계산 ($addFields)
     financial_calculations = {}
 
-    # 3. 정규화를 위한 각 금리별 min/max 값 계산 ($facet)
-    pipeline.append({
-        "$facet": {
-            "stats": [{
-                "$group": {
-                    "_id": None,
-                    "min_base": {
-                        "$min": "$base_interest_rate"
-                    },
-                    "max_base": {
-                        "$max": "$base_interest_rate"
-                    },
-                    "min_max": {
-                        "$min": "$max_interest_rate"
-                    },
-                    "max_max": {
-                        "$max": "$max_interest_rate"
-                    },
-                    "min_intermediate": {
-                        "$min": "$intermediate_interest_rate"
-                    },
-                    "max_intermediate": {
-                        "$max": "$intermediate_interest_rate"
-                    }
-                }
-            }],
-            "documents": [{
-                "$match": {}
-            }]  # 모든 문서를 그대로 전달
+    # 3. 정규화를 위한 각 금리별 min/max 값 계산
+    stats_group = {
+        "$group": {
+            "_id": None,
+            "min_base": {
+                "$min": "$base_interest_rate"
+            },
+            "max_base": {
+                "$max": "$base_interest_rate"
+            },
+            "min_max": {
+                "$min": "$max_interest_rate"
+            },
+            "max_max": {
+                "$max": "$max_interest_rate"
+            },
+            "min_intermediate": {
+                "$min": "$intermediate_interest_rate"
+            },
+            "max_intermediate": {
+                "$max": "$intermediate_interest_rate"
+            }
         }
-    })
+    }
 
-    # 4. 통계 데이터(stats)를 각 문서에 결합
-    pipeline.extend([{
-        "$unwind": "$documents"
-    }, {
-        "$addFields": {
-            "documents.stats": {
-                "$arrayElemAt": ["$stats", 0]
+    if ranking in ("stats", "topk"):
+        # 통계만 별도로 계산한 뒤 리터럴로 결합 ($facet 미사용)
+        stats_docs = await collection.aggregate([*pipeline, stats_group]).to_list()
+        if not stats_docs:
+            return []
+
+        pipeline.append({"$addFields": {"stats": {"$literal": stats_docs[0]}}})
+
+    else:
+        pipeline.append({
+            "$facet": {
+                "stats": [stats_group],
+                "documents": [{
+                    "$match": {}
+                }]  # 모든 문서를 그대로 전달
             }
-        }
-    }, {
-        "$replaceRoot": {
-            "newRoot": "$documents"
-        }
-    }])
+        })
+
+        # 4. 통계 데이터(stats)를 각 문서에 결합
+        pipeline.extend([{
+            "$unwind": "$documents"
+        }, {
+            "$addFields": {
+                "documents.stats": {
+                    "$arrayElemAt": ["$stats", 0]
+                }
+            }
+        }, {
+            "$replaceRoot": {
+                "newRoot": "$documents"
+            }
+        }])
 
     # 5. 정규화 및 가중합 점수 계산
     pipeline.append({
@@ -204,121 +228,36 @@ async def search_savings(
     })
 
     # 만기 금액 계산 (월 납입액, 기간 모두 존재 시)
+    # 월 복리 계산 공식: P * [((1 + r)^n - 1) / r]  (r = 월이율, n = 개월 수, P = 월 납입액)
     if monthly_deposit is not None and total_term_months is not None:
-        total_principal = monthly_deposit * total_term_months
         financial_calculations["maturity_details"] = {
-            # 월 복리 계산 공식: P * [((1 + r)^n - 1) / r]
-            # r = 월이율, n = 개월 수, P = 월 납입액
-            "base_rate": {
-                "total_amount": {
-                    "$function": {
-                        "body":
-                            "function(P, r_annual, n) { const r = r_annual / 12 / 100; if (r === 0) return P * n; return P * (Math.pow(1 + r, n) - 1) / r; }",
-                        "args": [
-                            monthly_deposit, "$base_interest_rate", total_term_months
-                        ],
-                        "lang":
-                            "js"
-                    }
-                },
-                "principal": total_principal,
-                "interest": {
-                    "$function": {
-                        "body":
-                            "function(P, r_annual, n) { const r = r_annual / 12 / 100; const total = (r === 0) ? P * n : P * (Math.pow(1 + r, n) - 1) / r; return total - (P * n); }",
-                        "args": [
-                            monthly_deposit, "$base_interest_rate", total_term_months
-                        ],
-                        "lang":
-                            "js"
-                    }
-                },
-            },
-            "max_rate": {
-                # ... max_rate, intermediate_rate 에 대해서도 동일한 로직 적용 ...
-                "total_amount": {
-                    "$function": {
-                        "body": "...",
-                        "args": [
-                            monthly_deposit, "$max_interest_rate", total_term_months
-                        ],
-                        "lang": "js"
-                    }
-                },
-                "interest": {
-                    "$function": {
-                        "body": "...",
-                        "args": [
-                            monthly_deposit, "$max_interest_rate", total_term_months
-                        ],
-                        "lang": "js"
-                    }
-                },
-                "principal": total_principal,
-            },
-            "intermediate_rate": {
-                "total_amount": {
-                    "$function": {
-                        "body": "...",
-                        "args": [
-                            monthly_deposit, "$intermediate_interest_rate",
-                            total_term_months
-                        ],
-                        "lang": "js"
-                    }
-                },
-                "interest": {
-                    "$function": {
-                        "body": "...",
-                        "args": [
-                            monthly_deposit, "$intermediate_interest_rate",
-                            total_term_months
-                        ],
-                        "lang": "js"
-                    }
-                },
-                "principal": total_principal,
-            }
+            rate_name:
+                maturity_details_expr(monthly_deposit, rate_field, total_term_months)
+            for rate_name, rate_field in [
+                ("base_rate", "$base_interest_rate"),
+                ("max_rate", "$max_interest_rate"),
+                ("intermediate_rate", "$intermediate_interest_rate"),
+            ]
         }
 
     # 목표 금액 도달 기간 계산 (월 납입액, 목표액 모두 존재 시)
     if monthly_deposit is not None and target_amount is not None:
+        # 기간 계산 공식 (로그 활용): n = log(1 + (FV * r) / P) / log(1 + r)
+        # 최고 금리(max_rate) 기준으로 가장 빠른 도달 기간 계산
+        months_to_target = months_to_target_expr(target_amount, monthly_deposit,
+                                                 "$max_interest_rate")
         financial_calculations["target_details"] = {
-            # 기간 계산 공식 (로그 활용): n = log(1 + (FV * r) / P) / log(1 + r)
-            # 최고 금리(max_rate) 기준으로 가장 빠른 도달 기간 계산
-            "months_to_target": {
-                "$function": {
-                    "body":
-                        "function(FV, P, r_annual) { const r = r_annual / 12 / 100; if (r === 0) return FV / P; return Math.log(1 + (FV * r) / P) / Math.log(1 + r); }",
-                    "args": [target_amount, monthly_deposit, "$max_interest_rate"],
-                    "lang":
-                        "js"
-                }
-            },
+            "months_to_target": months_to_target,
             "total_interest": {
-                "$function": {
-                    "body":
-                        "function(FV, P, r_annual) { const r = r_annual / 12 / 100; const n = (r === 0) ? FV / P : Math.log(1 + (FV * r) / P) / Math.log(1 + r); return FV - (P * n); }",
-                    "args": [target_amount, monthly_deposit, "$max_interest_rate"],
-                    "lang":
-                        "js"
-                }
-            }
+                "$subtract": [
+                    target_amount, {
+                        "$multiply": [monthly_deposit, months_to_target]
+                    }
+                ]
+            },
         }
 
     if financial_calculations:
-        financial_calculations["maturity_details"]["max_rate"]["total_amount"][
-            "body"] = financial_calculations["maturity_details"]["base_rate"][
-                "total_amount"]["body"]
-        financial_calculations["maturity_details"]["max_rate"]["interest"][
-            "body"] = financial_calculations["maturity_details"]["base_rate"][
-                "interest"]["body"]
-        financial_calculations["maturity_details"]["intermediate_rate"]["total_amount"][
-            "body"] = financial_calculations["maturity_details"]["base_rate"][
-                "total_amount"]["body"]
-        financial_calculations["maturity_details"]["intermediate_rate"]["interest"][
-            "body"] = financial_calculations["maturity_details"]["base_rate"][
-                "interest"]["body"]
         pipeline.append({"$addFields": financial_calculations})
 
     # 6. 최종 정렬 및 불필요한 필드 제거
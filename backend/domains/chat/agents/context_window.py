@@ -0,0 +1,97 @@
+import asyncio
+from typing import Dict, List, Sequence
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from domains.chat.agents.prompts import CHAT_SUMMARY_HUMAN_PROMPT, CHAT_SUMMARY_SYSTEM_PROMPT
+from domains.chat.models import Chat, ChatMessage
+from domains.chat.repositories import ChatRepository
+
+
+def to_messages(messages: Sequence[ChatMessage]) -> List[BaseMessage]:
+    """저장된 대화를 LangChain 메시지로 변환한다. (상품 정보 제외)"""
+
+    return [
+        HumanMessage(content=m.content.message or "")
+        if m.role == "user" else AIMessage(content=m.content.message or "")
+        for m in messages
+    ]
+
+
+class ConversationWindow:
+    """최근 `window_turns` 턴만 그대로 두고 이전 대화는 요약 하나로 대체한다.
+
+    요약은 `Chat.summary` 에 저장되며 `Chat.summarized_count` 개의 메시지를 대신한다.
+    요약되지 않은 메시지가 창을 넘으면 응답이 끝난 뒤 백그라운드에서 넘친 부분만 기존 요약에
+    더해 갱신하므로, 턴마다 LLM 에 전달되는 대화 길이는 대화가 길어져도 일정하게 유지된다.
+
+    Attributes:
+        llm (BaseChatModel): 요약 모델
+        chat_repo (ChatRepository): 요약을 저장할 리포지토리
+        window_turns (int): 그대로 전달할 최근 턴 수
+        summary_max_chars (int): 요약 최대 길이
+    """
+
+    def __init__(self,
+                 llm: BaseChatModel,
+                 chat_repo: ChatRepository,
+                 window_turns: int = 4,
+                 summary_max_chars: int = 1200):
+        self.chat_repo = chat_repo
+        self.window_messages = max(window_turns, 1) * 2
+        self.summary_max_chars = summary_max_chars
+
+        prompt = ChatPromptTemplate([
+            ("system", CHAT_SUMMARY_SYSTEM_PROMPT),
+            ("user", CHAT_SUMMARY_HUMAN_PROMPT),
+        ])
+        self.chain = prompt | llm
+
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def history(self, chat: Chat) -> List[BaseMessage]:
+        """그래프에 전달할 이전 대화. 요약(있다면)과 아직 요약되지 않은 메시지로 구성된다."""
+
+        messages = to_messages(chat.messages[chat.summarized_count:])
+        if chat.summary:
+            messages.insert(0, SystemMessage(content=f"## 이전 대화 요약\n{chat.summary}"))
+
+        return messages
+
+    def overflows(self, chat: Chat) -> bool:
+        return len(chat.messages) - chat.summarized_count > self.window_messages
+
+    def schedule(self, chat: Chat):
+        """창을 넘친 경우에만 요약 갱신을 백그라운드로 시작한다. 같은 대화는 한 번에 하나씩."""
+
+        if not self.overflows(chat) or chat.id in self._tasks:
+            return
+
+        task = asyncio.create_task(self._summarize(chat))
+        self._tasks[chat.id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(chat.id, None))
+
+    async def _summarize(self, chat: Chat):
+        until = len(chat.messages) - self.window_messages
+        overflow = chat.messages[chat.summarized_count:until]
+
+        conversation = "\n".join(
+            f"{m.type.capitalize()}: {m.content}" for m in to_messages(overflow))
+
+        try:
+            res = await self.chain.ainvoke({
+                "summary": chat.summary or "(없음)",
+                "conversation": conversation,
+                "max_chars": self.summary_max_chars,
+            })
+            summary = str(res.content).strip()[:self.summary_max_chars]
+
+            await self.chat_repo.update_summary(chat.id,
+                                                summary=summary,
+                                                summarized_count=until)
+            print(f"대화 요약을 갱신했습니다. ({chat.id}, {until}개 메시지)")
+
+        except Exception as e:
+            print(f"대화 요약 갱신에 실패했습니다. ({e})")
@@ -0,0 +1,14 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class ChatHistoryConfig:
+
+    # 그대로 전달할 최근 대화 턴 수 (사용자 질문 + 응답 = 1턴). 이전 대화는 요약으로 대체
+    window_turns: int = field(
+        default_factory=lambda: int(os.getenv("CHAT_WINDOW_TURNS", 4)))
+
+    # 요약 최대 길이(글자)
+    summary_max_chars: int = field(
+        default_factory=lambda: int(os.getenv("CHAT_SUMMARY_MAX_CHARS", 1200)))
@@ -62,5 +62,9 @@ class Chat(BaseModel):
     title: Optional[str] = None
     messages: List[ChatMessage] = []
 
+    # 앞쪽 `summarized_count` 개 메시지를 대신하는 요약
+    summary: Optional[str] = None
+    summarized_count: int = 0
+
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
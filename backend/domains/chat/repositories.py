@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
 from pymongo.results import UpdateResult
 from app.core.config import AppConfig
+from common.indexes import index_registry
 from domains.chat.models import Chat, ChatMessage
 
 
@@ -29,6 +31,23 @@ class ChatRepository:
             "messages": message.model_dump(by_alias=True)
         }})
 
+    async def update_summary(self, chat_id: str, *, summary: str,
+                             summarized_count: int) -> UpdateResult:
+        """더 많은 메시지를 요약한 경우에만 갱신한다. (늦게 끝난 이전 요약이 덮어쓰지 않도록)"""
+
+        return await self.col.update_one(
+            {
+                "_id": chat_id,
+                "summarized_count": {
+                    "$not": {
+                        "$gte": summarized_count
+                    }
+                }
+            }, {"$set": {
+                "summary": summary,
+                "summarized_count": summarized_count
+            }})
+
     async def insert_chat(self, chat: Chat):
         await self.col.insert_one(chat.model_dump(by_alias=True))
         return chat
@@ -63,3 +82,7 @@ class ChatRepository:
 
         raw = await self.col.find_one({"_id": chat_id})
         return Chat.model_validate(raw) if raw else None
+
+
+index_registry.declare("chats", IndexModel([("user_id", ASCENDING)]))
+index_registry.declare_query("chats", "by_user_id", {"user_id": ""})
@@ -3,42 +3,41 @@ import json
 from typing import AsyncGenerator, List, Optional
 
 from fastapi.encoders import jsonable_encoder
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableSerializable
-from openai import AsyncOpenAI
 from pymongo.results import UpdateResult
 from app.core.config import AppConfig
 from app.schemas.chat import ChatContentDTO, ChatResponseDTO
+from domains.chat.agents.context_window import ConversationWindow
 from domains.chat.models import Chat, ChatContent, ChatMessage
 from domains.chat.repositories import ChatPreviewDTO, ChatRepository
 from domains.common.agents.supervisor import StreamGraphType
+from domains.common.llm_registry import LLMRegistry
 from domains.user.repositories import UserMemoryRepository, UserRepository
 from domains.user.services import UserNotFound
 
-import os
-
 
 class ChatNotFound(Exception):
     pass
 
 
-UPSTAGE_API_KEY = os.getenv("UPSTAGE_API_KEY", "")
-
-
 class ChatService:
 
     def __init__(self, *, cfg: AppConfig, user_repo: UserRepository,
-                 memory_repo: UserMemoryRepository, chat_repo: ChatRepository):
+                 memory_repo: UserMemoryRepository, chat_repo: ChatRepository,
+                 llms: LLMRegistry):
 
         self.cfg = cfg.user
         self.user_repo = user_repo
         self.memory_repo = memory_repo
         self.chat_repo = chat_repo
 
-        self.openai_client = AsyncOpenAI(
-            api_key=UPSTAGE_API_KEY,
-            base_url="https://api.upstage.ai/v1",
-        )
+        self.openai_client = llms.openai_client("upstage")
+
+        self.window = ConversationWindow(llms.get("summary"),
+                                         chat_repo,
+                                         window_turns=cfg.chat.window_turns,
+                                         summary_max_chars=cfg.chat.summary_max_chars)
 
     async def generate_chat_title(self, chat_id: str, question: str) -> str:
 
@@ -101,11 +100,8 @@ class ChatService:
         else:
             chat = await self.get_chat_detail(chat_id)
 
-        prev_messages = list(
-            map(
-                lambda msg: HumanMessage(content=msg.content.message or "")
-                if msg.role == "assistant" else AIMessage(content=msg.content.message or
-                                                          ""), chat.messages))
+        # 최근 턴 + 이전 대화 요약
+        prev_messages = self.window.history(chat)
 
         asyncio.create_task(
             memory_chain.ainvoke({
@@ -138,7 +134,8 @@ class ChatService:
 
         async for _, chunk in run_stream(user_msg=message,
                                          curr_chat=chat,
-                                         memories=memories):
+                                         memories=memories,
+                                         history=prev_messages):
             payload = ChatResponseDTO(**chunk)
             data_json = json.dumps(jsonable_encoder(payload), ensure_ascii=False)
 
@@ -173,4 +170,8 @@ class ChatService:
                                             products=products))  # type: ignore
         await self.add_message(chat_id=chat.id, message=assistant_message)
 
+        # 창을 넘친 경우에만 다음 턴을 위해 백그라운드에서 요약을 갱신
+        chat.messages += [user_message, assistant_message]
+        self.window.schedule(chat)
+
         yield "data: [DONE]\n\n"
@@ -0,0 +1,160 @@
+import math
+import re
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import Hashable, List, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+from domains.common.config import ResearchConfig
+
+_HANGUL = re.compile(r"[가-힣]")
+
+
+def approx_tokens(text: str) -> int:
+    """토크나이저 없이 추정한 토큰 수. 한글은 글자당 1토큰, 그 외는 4글자당 1토큰으로 계산한다."""
+
+    hangul = len(_HANGUL.findall(text))
+    return hangul + math.ceil((len(text) - hangul) / 4)
+
+
+def _terms(text: str) -> List[str]:
+    """BM25 색인어: 단어와 단어 안의 글자 bigram (조사가 붙은 한국어 단어도 부분 일치)"""
+
+    words = re.sub(r"[^\w\s]", " ", unicodedata.normalize("NFKC", text).lower()).split()
+
+    terms = list(words)
+    for word in words:
+        terms += [word[i:i + 2] for i in range(len(word) - 1)]
+
+    return terms
+
+
+def split_passages(text: str, max_chars: int = 400) -> List[str]:
+    """문단, 문장 단위로 나눈 뒤 `max_chars` 를 넘지 않도록 이어 붙인다."""
+
+    sentences = [
+        s.strip()
+        for paragraph in re.split(r"\n\s*\n", text)
+        for s in re.split(r"(?<=[.!?。])\s+|\n", paragraph)
+        if s.strip()
+    ]
+
+    passages: List[str] = []
+    current = ""
+    for sentence in sentences:
+        while len(sentence) > max_chars:
+            if current:
+                passages.append(current)
+                current = ""
+            passages.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+
+        if current and len(current) + len(sentence) + 1 > max_chars:
+            passages.append(current)
+            current = ""
+        current = f"{current} {sentence}".strip()
+
+    if current:
+        passages.append(current)
+
+    return passages
+
+
+def bm25_scores(query: str,
+                passages: Sequence[str],
+                k1: float = 1.5,
+                b: float = 0.75) -> List[float]:
+    docs = [Counter(_terms(p)) for p in passages]
+    if not docs:
+        return []
+
+    avg_len = sum(sum(d.values()) for d in docs) / len(docs) or 1
+    df = Counter(term for d in docs for term in d)
+    query_terms = set(_terms(query))
+
+    scores = []
+    for d in docs:
+        length = sum(d.values())
+        score = 0.0
+        for term in query_terms:
+            tf = d.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log(1 + (len(docs) - df[term] + 0.5) / (df[term] + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_len))
+        scores.append(score)
+
+    return scores
+
+
+class ContextCompressor:
+    """리서치 문서를 질문과 관련된 구절만 남겨 토큰 예산 안으로 줄인다.
+
+    문서를 구절로 나눈 뒤 질문에 대한 BM25 점수 순으로 `budget_tokens` 까지 채운다.
+    같은 질문과 문서 묶음의 결과는 재사용되어, 한 그래프 실행에서 filter_node 와
+    explain_node 가 여러 번 호출되어도 한 번만 계산된다.
+
+    Attributes:
+        budget_tokens (int): 압축 결과의 최대 (추정) 토큰 수
+        passage_chars (int): 구절 최대 길이
+        max_entries (int): 보관할 압축 결과 수 (LRU)
+    """
+
+    def __init__(self,
+                 budget_tokens: int = 1200,
+                 passage_chars: int = 400,
+                 max_entries: int = 128):
+        self.budget_tokens = budget_tokens
+        self.passage_chars = passage_chars
+        self.max_entries = max_entries
+
+        self._blobs: OrderedDict[Hashable, str] = OrderedDict()
+
+    @classmethod
+    def from_config(cls, cfg: ResearchConfig) -> "ContextCompressor":
+        return cls(budget_tokens=cfg.context_budget_tokens,
+                   passage_chars=cfg.passage_chars)
+
+    def select(self, question: str,
+               documents: Sequence[Document]) -> List[Tuple[str, Document]]:
+        """예산 안에 들어가는 (구절, 원본 문서) 목록. 관련도가 높은 순서."""
+
+        passages = [(p, doc)
+                    for doc in documents
+                    for p in split_passages(doc.page_content, self.passage_chars)]
+        scores = bm25_scores(question, [p for p, _ in passages])
+        ranked = sorted(range(len(passages)), key=lambda i: scores[i], reverse=True)
+
+        selected, used = [], 0
+        for i in ranked:
+            cost = approx_tokens(passages[i][0])
+            if used + cost > self.budget_tokens:
+                continue
+            selected.append(passages[i])
+            used += cost
+
+        return selected
+
+    def compress(self, question: str, documents: Sequence[Document]) -> str:
+        """프롬프트에 넣을 "## 외부 참고 정보" 블록"""
+
+        key = (question,
+               tuple(doc.metadata.get("uuid") or doc.page_content for doc in documents))
+        blob = self._blobs.get(key)
+        if blob is not None:
+            self._blobs.move_to_end(key)
+            return blob
+
+        lines = []
+        for passage, doc in self.select(question, documents):
+            source = doc.metadata.get("title") or doc.metadata.get("source")
+            lines.append(f"- {passage}" + (f" (출처: {source})" if source else ""))
+
+        blob = "\n\n## 외부 참고 정보\n" + "\n".join(lines)
+
+        self._blobs[key] = blob
+        while len(self._blobs) > self.max_entries:
+            self._blobs.popitem(last=False)
+
+        return blob
@@ -15,6 +15,10 @@ ProductSearchResults = Union[List[SavingSearchResult]] | None
 #ProductSearchResults = List[ChatProductInfo] | None
 ProductSearchResult = Union[SavingSearchResult]
 
+# research 와 saving 을 병렬 실행할 때, 아직 도착하지 않은 리서치 문서(asyncio.Task)를
+# 하위 그래프에 전달하는 RunnableConfig["configurable"] 키
+PENDING_DOCUMENTS_KEY = "pending_documents"
+
 
 class PlanWithGoals(TypedDict):
     member: Members
@@ -34,6 +38,9 @@ class GraphState(TypedDict):
     user_memories: List[UserMemory]  # 사용자 장기메모리
 
     offset: int
+    page_size: int  # 이번 적금 검색에서 가져온 후보 수
+    search_rounds: int  # 요청 내 적금 검색 횟수
+    search_call: Optional[Dict[str, Any]]  # 적금 검색 tool 선택 결과 (name, args)
     target_count: int  # 목표 상품 개수
 
     plans: List[PlanWithGoals]  # 예정된 하위 노드 실행 순서
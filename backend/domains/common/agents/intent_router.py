@@ -0,0 +1,319 @@
+"""Supervisor 계획을 로컬에서 예측하는 의도 분류기.
+
+Supervisor(LLM)가 내린 결정을 JSONL 로 기록해 두고, 그 기록으로 문자 n-gram
+나이브 베이즈 분류기를 학습한다. 확신도가 충분히 높으면 LLM 호출 없이 계획을 반환한다.
+
+    python -m domains.common.agents.intent_router \\
+        --log data/supervisor_routes.jsonl --out data/intent_router.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import time
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from common.logger import _logger
+from domains.common.agents.graph_state import PlanWithGoals
+from domains.common.agents.types import Members
+from domains.common.config import SupervisorConfig
+from domains.common.types import IntentRouterMode
+
+logger = _logger(__name__)
+
+# 라우트 이름 → 하위 노드 실행 순서
+ROUTES: Dict[str, List[Members]] = {
+    "research_saving_explain": ["research_node", "saving_node", "explain_node"],
+    "saving_explain": ["saving_node", "explain_node"],
+    "explain": ["explain_node"],
+}
+
+_GOALS: Dict[Members, str] = {
+    "research_node": "질문과 관련된 금리 동향 등 외부 정보 조사: {question}",
+    "saving_node": "사용자의 조건을 만족하는 적금 상품 검색: {question}",
+    "explain_node": "사용자 질문에 대한 답변 및 상품 설명: {question}",
+}
+
+# 이전 대화에서 추천한 상품이 있는지를 나타내는 특징
+_HAS_PRODUCTS = "\0has_products"
+
+
+def route_of(plans: Sequence[PlanWithGoals]) -> Optional[str]:
+    """계획의 실행 순서에 해당하는 라우트 이름. 정해진 라우트가 아니면 None."""
+
+    members = [plan["member"] for plan in plans]
+    for route, route_members in ROUTES.items():
+        if members == route_members:
+            return route
+
+    return None
+
+
+def plans_for(route: str, question: str) -> List[PlanWithGoals]:
+    return [{
+        "member": member,
+        "goal": _GOALS[member].format(question=question)
+    } for member in ROUTES[route]]
+
+
+def _features(question: str, has_products: bool) -> Counter:
+    text = unicodedata.normalize("NFKC", question).lower()
+    text = " ".join(re.sub(r"[^\w\s]", " ", text).split())
+
+    features = Counter(
+        text[i:i + n] for n in (1, 2, 3) for i in range(len(text) - n + 1))
+    if has_products:
+        features[_HAS_PRODUCTS] += 1
+
+    return features
+
+
+class IntentClassifier:
+    """문자 1~3-gram 다항 나이브 베이즈 분류기.
+
+    한국어는 띄어쓰기가 일정하지 않아 형태소 분석 대신 문자 n-gram 을 사용한다.
+
+    Attributes:
+        alpha (float): 라플라스 스무딩 계수
+    """
+
+    def __init__(self, alpha: float = 0.5):
+        self.alpha = alpha
+
+        self._priors: Dict[str, float] = {}
+        self._log_probs: Dict[str, Dict[str, float]] = {}
+        self._unseen: Dict[str, float] = {}
+
+    @property
+    def labels(self) -> List[str]:
+        return list(self._priors)
+
+    def fit(self, samples: Iterable[Tuple[str, bool, str]]) -> "IntentClassifier":
+        """(질문, 이전 추천 상품 유무, 라우트) 목록으로 학습한다."""
+
+        docs: Counter = Counter()
+        counts: Dict[str, Counter] = defaultdict(Counter)
+
+        for question, has_products, route in samples:
+            docs[route] += 1
+            counts[route].update(_features(question, has_products))
+
+        vocab = set().union(*counts.values()) if counts else set()
+        total_docs = sum(docs.values())
+
+        self._priors = {
+            route: math.log(count / total_docs) for route, count in docs.items()
+        }
+        for route, grams in counts.items():
+            denom = sum(grams.values()) + self.alpha * (len(vocab) + 1)
+            self._log_probs[route] = {
+                gram: math.log((count + self.alpha) / denom)
+                for gram, count in grams.items()
+            }
+            self._unseen[route] = math.log(self.alpha / denom)
+
+        return self
+
+    def predict(self, question: str, has_products: bool = False) -> Tuple[str, float]:
+        """가장 가능성이 높은 라우트와 그 사후 확률"""
+
+        if not self._priors:
+            raise ValueError("학습되지 않은 분류기입니다.")
+
+        features = _features(question, has_products)
+
+        # n-gram 들은 서로 강하게 겹치므로, 우도를 n-gram 수의 제곱근으로 나눠 과신을 줄인다
+        scale = math.sqrt(max(sum(features.values()), 1))
+
+        scores = {}
+        for route, prior in self._priors.items():
+            log_probs, unseen = self._log_probs[route], self._unseen[route]
+            scores[route] = prior + sum(count * log_probs.get(gram, unseen)
+                                        for gram, count in features.items()) / scale
+
+        best = max(scores, key=scores.__getitem__)
+        norm = sum(math.exp(score - scores[best]) for score in scores.values())
+
+        return best, 1 / norm
+
+    def to_dict(self) -> dict:
+        return {
+            "alpha": self.alpha,
+            "priors": self._priors,
+            "log_probs": self._log_probs,
+            "unseen": self._unseen,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IntentClassifier":
+        classifier = cls(alpha=data["alpha"])
+        classifier._priors = data["priors"]
+        classifier._log_probs = data["log_probs"]
+        classifier._unseen = data["unseen"]
+        return classifier
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "IntentClassifier":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def read_route_log(path: str) -> List[Tuple[str, bool, str]]:
+    """Supervisor 결정 기록을 (질문, 이전 추천 상품 유무, 라우트) 목록으로 읽는다."""
+
+    samples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                samples.append(
+                    (record["question"], record["has_products"], record["route"]))
+
+    return samples
+
+
+class IntentRouter:
+    """Supervisor 앞단의 로컬 라우터.
+
+    - off: 분류기를 사용하지 않고 LLM 결정만 기록한다.
+    - shadow: 항상 LLM 을 호출하고, 분류기 예측과의 일치 여부를 기록한다.
+    - on: 분류기 확신도가 `threshold` 이상이면 LLM 을 호출하지 않는다.
+
+    Attributes:
+        classifier (IntentClassifier | None): 학습된 분류기
+        mode (IntentRouterMode): 동작 방식
+        threshold (float): 분류기 결과를 그대로 사용할 최소 확신도
+        log_path (str): LLM 결정을 추가할 JSONL 경로. 빈 문자열이면 기록하지 않는다.
+    """
+
+    def __init__(self,
+                 classifier: Optional[IntentClassifier] = None,
+                 *,
+                 mode: IntentRouterMode = "shadow",
+                 threshold: float = 0.9,
+                 log_path: str = ""):
+        self.classifier = classifier
+        self.mode = mode
+        self.threshold = threshold
+        self.log_path = log_path
+
+        self.stats: Counter = Counter()
+
+    @classmethod
+    def from_config(cls, cfg: SupervisorConfig) -> "IntentRouter":
+        classifier = None
+        if cfg.router_mode != "off" and os.path.exists(cfg.router_model_path):
+            classifier = IntentClassifier.load(cfg.router_model_path)
+
+        return cls(classifier,
+                   mode=cfg.router_mode,
+                   threshold=cfg.router_threshold,
+                   log_path=cfg.route_log_path)
+
+    def predict(self, question: str, has_products: bool) -> Optional[Tuple[str, float]]:
+        if self.classifier is None or self.mode == "off":
+            return None
+        return self.classifier.predict(question, has_products)
+
+    def route(self, prediction: Optional[Tuple[str, float]],
+              question: str) -> Optional[List[PlanWithGoals]]:
+        """확신도가 충분하면 LLM 대신 사용할 계획을 반환한다."""
+
+        if self.mode != "on" or prediction is None:
+            return None
+
+        route, confidence = prediction
+        if confidence < self.threshold:
+            self.stats["fallback"] += 1
+            return None
+
+        self.stats["local"] += 1
+        return plans_for(route, question)
+
+    def _append(self, entry: dict):
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    async def record(self, question: str, has_products: bool,
+                     plans: Sequence[PlanWithGoals],
+                     prediction: Optional[Tuple[str, float]]):
+        """LLM 결정을 학습용으로 기록하고, shadow 모드에서는 예측과 비교한다.
+
+        파일 기록은 이벤트 루프를 막지 않도록 별도 스레드에서 수행한다.
+        """
+
+        route = route_of(plans)
+        if route is None:
+            return
+
+        if self.log_path:
+            await asyncio.to_thread(
+                self._append, {
+                    "question": question,
+                    "has_products": has_products,
+                    "route": route,
+                    "ts": time.time(),
+                })
+
+        if prediction is None:
+            return
+
+        predicted, confidence = prediction
+        confident = confidence >= self.threshold
+
+        self.stats["compared"] += 1
+        self.stats["agreed"] += predicted == route
+        self.stats["confident"] += confident
+        self.stats["confident_agreed"] += confident and predicted == route
+
+        logger(f"의도 분류 {predicted}({confidence:.2f}) / LLM {route} "
+               f"일치율 {self.stats['agreed']}/{self.stats['compared']}, "
+               f"확신 구간 {self.stats['confident_agreed']}/{self.stats['confident']}")
+
+
+def _evaluate(train: List[Tuple[str, bool, str]], test: List[Tuple[str, bool, str]],
+              threshold: float):
+    classifier = IntentClassifier().fit(train)
+
+    correct = confident = confident_correct = 0
+    for question, has_products, route in test:
+        predicted, confidence = classifier.predict(question, has_products)
+        correct += predicted == route
+        if confidence >= threshold:
+            confident += 1
+            confident_correct += predicted == route
+
+    print(f"검증 정확도: {correct}/{len(test)}")
+    print(f"확신도 {threshold} 이상: {confident}/{len(test)} 건 "
+          f"(정확도 {confident_correct}/{max(confident, 1)})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--log", default="data/supervisor_routes.jsonl")
+    parser.add_argument("--out", default="data/intent_router.json")
+    parser.add_argument("--threshold", type=float, default=0.9)
+    parser.add_argument("--holdout", type=float, default=0.2)
+    args = parser.parse_args()
+
+    samples = read_route_log(args.log)
+    print(f"Supervisor 결정 {len(samples)}건: {dict(Counter(s[2] for s in samples))}")
+
+    shuffled = samples[:]
+    random.Random(0).shuffle(shuffled)
+    split = int(len(shuffled) * (1 - args.holdout))
+    if 0 < split < len(shuffled):
+        _evaluate(shuffled[:split], shuffled[split:], args.threshold)
+
+    IntentClassifier().fit(samples).save(args.out)
+    print(f"{args.out} 저장 완료")
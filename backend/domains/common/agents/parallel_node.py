@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
+
+from domains.common.agents.graph_state import GraphState, PENDING_DOCUMENTS_KEY
+
+
+def init_research_saving_node(research_node: Callable[[GraphState], Awaitable[dict]],
+                              saving_graph: CompiledStateGraph):
+    """research_node 와 적금 서브그래프를 동시에 실행하는 노드 초기화.
+
+    적금 검색(tool 선택, 검색)은 리서치 결과를 기다리지 않고 바로 시작하며,
+    리서치 문서는 `PENDING_DOCUMENTS_KEY` 로 전달되어 filter_node 에서 합쳐진다.
+    전체 소요 시간은 두 작업 시간의 합이 아니라 더 긴 쪽에 가까워진다.
+    """
+
+    async def node(state: GraphState, config: RunnableConfig):
+        print("============ Research + Saving Node ============")
+
+        async def research_documents():
+            result = await research_node(state)
+            return result.get("documents") or []
+
+        pending = asyncio.create_task(research_documents())
+        saving_config: RunnableConfig = {**config}
+        saving_config["configurable"] = {
+            **config.get("configurable", {}),
+            PENDING_DOCUMENTS_KEY: pending,
+        }
+
+        try:
+            result = await saving_graph.ainvoke(state, config=saving_config)
+            documents = await pending
+        except BaseException:
+            pending.cancel()
+            raise
+
+        return {**result, "documents": documents}
+
+    return node
@@ -1,3 +1,4 @@
+from .research_cache import *
 from .research_subgraph import *
 from .planning_node import *
 from .retrieval_node import *
@@ -0,0 +1,136 @@
+import asyncio
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, Optional, Protocol
+
+from common.cache import AsyncCache, create_cache
+from common.metrics import count
+from domains.common.config import ResearchConfig
+
+
+class SearchTool(Protocol):
+    """`TavilySearch` 와 같이 검색어 하나를 받아 결과를 반환하는 도구"""
+
+    async def ainvoke(self, input: str) -> Any:
+        ...
+
+
+def normalize_query(query: str) -> str:
+    """대소문자, 문장부호, 공백, 단어 순서 차이를 무시한 검색어 키"""
+
+    text = unicodedata.normalize("NFKC", query).lower()
+    tokens = re.sub(r"[^\w\s]", " ", text).split()
+    return " ".join(sorted(set(tokens)))
+
+
+def _bigrams(text: str) -> set:
+    compact = text.replace(" ", "")
+    return {compact[i:i + 2] for i in range(len(compact) - 1)} or {compact}
+
+
+def _similarity(a: str, b: str) -> float:
+    x, y = _bigrams(a), _bigrams(b)
+    return len(x & y) / len(x | y)
+
+
+class ResearchCache:
+    """웹 검색 결과 캐시.
+
+    - 정규화한 검색어를 키로 결과를 `cache` 에 저장한다 (TTL, 용량은 백엔드 설정을 따름).
+    - 한 요청 안에서 문자 bigram Jaccard 유사도가 `similarity` 이상인 검색어는 하나로 합친다.
+    - 같은 검색어를 동시에 요청하면 진행 중인 검색 하나를 공유한다.
+
+    Attributes:
+        tool (SearchTool): 실제 검색 도구
+        cache (AsyncCache | None): 검색 결과 저장소. None 이면 요청 간 캐시 없이 중복 제거만 한다.
+        similarity (float): 같은 검색어로 간주할 최소 유사도
+    """
+
+    def __init__(self,
+                 tool: SearchTool,
+                 cache: Optional[AsyncCache] = None,
+                 *,
+                 similarity: float = 0.8):
+        self.tool = tool
+        self.cache = cache
+        self.similarity = similarity
+
+        self.counts: Counter = Counter()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def dedupe(self, queries: List[str]) -> List[str]:
+        """유사한 검색어를 제거하고 처음 등장한 검색어만 남긴다."""
+
+        unique: List[str] = []
+        keys: List[str] = []
+
+        for query in queries:
+            key = normalize_query(query)
+            if not key or any(_similarity(key, k) >= self.similarity for k in keys):
+                self.counts["collapsed"] += 1
+                continue
+
+            unique.append(query)
+            keys.append(key)
+
+        return unique
+
+    async def _search(self, key: str, query: str) -> Any:
+        result = await self.tool.ainvoke(query)
+        if self.cache is not None:
+            await self.cache.set(key, result)
+        return result
+
+    async def fetch(self, query: str) -> Any:
+        key = normalize_query(query)
+
+        if self.cache is not None:
+            cached = await self.cache.get(key)
+            count("cache_requests_total",
+                  cache="research",
+                  result="hit" if cached is not None else "miss")
+            if cached is not None:
+                return cached
+
+        # 진행 중인 유사 검색이 있으면 그 결과를 함께 사용
+        task = self._inflight.get(key) or next(
+            (t for k, t in self._inflight.items()
+             if _similarity(key, k) >= self.similarity), None)
+        if task is not None:
+            self.counts["shared"] += 1
+            count("cache_requests_total", cache="research", result="shared")
+        else:
+            self.counts["searched"] += 1
+            task = asyncio.create_task(self._search(key, query))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # 한 요청이 취소되어도 검색을 공유하는 다른 요청에는 영향을 주지 않는다
+        return await asyncio.shield(task)
+
+    async def fetch_many(self, queries: List[str]) -> List[Any]:
+        return await asyncio.gather(*[self.fetch(q) for q in self.dedupe(queries)])
+
+    @property
+    def stats(self) -> dict:
+        cache_stats = self.cache.stats.to_dict() if self.cache is not None else {}
+        return {**cache_stats, **self.counts}
+
+
+def init_research_cache(cfg: ResearchConfig = ResearchConfig(),
+                        tool: Optional[SearchTool] = None) -> ResearchCache:
+    """설정값으로 검색 캐시를 생성한다. `tool` 을 주입하지 않으면 TavilySearch 를 사용한다."""
+
+    if tool is None:
+        from langchain_tavily import TavilySearch
+        tool = TavilySearch(max_result=3)
+
+    cache = create_cache(cfg.cache_backend,
+                         prefix="research",
+                         max_size=cfg.cache_size,
+                         ttl_seconds=cfg.cache_ttl_seconds,
+                         redis_url=cfg.redis_url,
+                         sqlite_path=cfg.sqlite_path)
+
+    return ResearchCache(tool, cache, similarity=cfg.dedupe_similarity)
@@ -1,5 +1,5 @@
 import asyncio
-from typing import TypedDict, cast
+from typing import Optional, TypedDict, cast
 
 from langchain_core.documents import Document
 from langchain_core.language_models import BaseChatModel
@@ -9,8 +9,9 @@ from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Send
 
 from langgraph.types import Send
-from langchain_tavily import TavilySearch
 
+from common.metrics import instrument_node
+from domains.common.agents.retrieval_subgraph.research_cache import ResearchCache, init_research_cache
 from domains.common.agents.retrieval_subgraph.states import ResearcherState, QueryState, RetrievalAgentState
 
 QUERY_GENERATION_NODE_SYSTEM_PROMPT = """\
@@ -80,26 +81,28 @@ def _tavily2document(data: dict):
     return Document(page_content=page_content, metadata=metadata)
 
 
-def init_document_retrieval_node():
+def init_document_retrieval_node(research: Optional[ResearchCache] = None):
 
-    tool = TavilySearch(max_result=3)
-
-    async def _fetch(query: str) -> Document:
-        resp = await tool.ainvoke(query)
-        return _tavily2document(resp)
+    research = research or init_research_cache()
 
     async def node(state: ResearcherState):
-        documents = await asyncio.gather(*[_fetch(q) for q in state.queries])
-        return {"documents": list(documents)}
+        responses = await research.fetch_many(state.queries)
+        print(f"웹 검색 캐시: {research.stats}")
+        return {"documents": [_tavily2document(resp) for resp in responses]}
 
     return node
 
 
-def init_research_subgraph(llm: BaseChatModel):
+def init_research_subgraph(llm: BaseChatModel,
+                           research: Optional[ResearchCache] = None):
     builder = StateGraph(ResearcherState)
-    builder.add_node("generate_queries", init_query_generation_node(llm))
-    builder.add_node("retrieve_documents",
-                     init_document_retrieval_node())  # type: ignore
+    builder.add_node(
+        "generate_queries",
+        instrument_node("generate_queries", init_query_generation_node(llm)))
+    builder.add_node(
+        "retrieve_documents",
+        instrument_node("retrieve_documents",
+                        init_document_retrieval_node(research)))  # type: ignore
 
     builder.add_edge(START, "generate_queries")
     builder.add_edge("generate_queries", "retrieve_documents")
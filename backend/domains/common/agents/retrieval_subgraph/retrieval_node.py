@@ -1,18 +1,24 @@
+from typing import Optional
+
+from langchain_core.language_models import BaseChatModel
 from langchain_openai.chat_models.base import ChatOpenAI
 from langchain_upstage import ChatUpstage
 from langgraph.config import get_stream_writer
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+from common.metrics import instrument_node
 from domains.common.agents.graph_state import GraphState
 from domains.common.agents.retrieval_subgraph.planning_node import check_finished, init_retrieval_planning_node
+from domains.common.agents.retrieval_subgraph.research_cache import ResearchCache
 from domains.common.agents.retrieval_subgraph.research_subgraph import init_research_node, init_research_subgraph
 from domains.common.agents.retrieval_subgraph.states import InputState, RetrievalAgentState
 
 
-def init_retrieval_subgraph():
+def init_retrieval_subgraph(research: Optional[ResearchCache] = None,
+                            llm: Optional[BaseChatModel] = None):
 
-    llm = ChatUpstage(
+    llm = llm or ChatUpstage(
         model="solar-pro2",
         temperature=0.3,
         reasoning_effort="low",
@@ -21,10 +27,15 @@ def init_retrieval_subgraph():
 
     builder = StateGraph(RetrievalAgentState, input_schema=InputState)
 
-    research_graph = init_research_subgraph(llm)
-    builder.add_node("research_node", init_research_node(research_graph))
-    builder.add_node("planning_node", init_retrieval_planning_node(llm))
-    builder.add_node("check_finished", check_finished)
+    research_graph = init_research_subgraph(llm, research)
+    builder.add_node(
+        "research_node",
+        instrument_node("retrieval_research_node", init_research_node(research_graph)))
+    builder.add_node(
+        "planning_node",
+        instrument_node("planning_node", init_retrieval_planning_node(llm)))
+    builder.add_node("check_finished", instrument_node("check_finished",
+                                                       check_finished))
 
     builder.add_edge(START, "planning_node")
     builder.add_edge("planning_node", "research_node")
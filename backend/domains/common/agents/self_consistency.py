@@ -1,20 +1,111 @@
-from langchain_core.runnables import Runnable
+import asyncio
+import json
 from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import BaseModel
+
+
+def _default_key(answer: Any) -> Hashable:
+    """투표에 사용할 키. 구조화 출력(pydantic, dict)은 JSON 으로 비교한다."""
+
+    if isinstance(answer, BaseModel):
+        return answer.model_dump_json()
+    if isinstance(answer, (dict, list)):
+        return json.dumps(answer, ensure_ascii=False, sort_keys=True, default=str)
+    return answer
 
 
 class CoTSCWrapper(Runnable):
+    """같은 입력으로 여러 번 샘플링해 다수결 답을 반환한다. (self-consistency)
+
+    `ainvoke` 는 최대 `max_concurrency` 개의 샘플을 동시에 요청하고, 남은 샘플이 모두
+    2위 답에 가더라도 1위가 바뀌지 않는 시점에 나머지 요청을 취소한다.
 
-    def __init__(self, llm, num_samples=5):
+    `llm` 이 `with_structured_output` 으로 만든 러너블이면 구조화 출력끼리 투표한다.
+    `key` 로 비교 기준을 바꿀 수 있다. (예: 계획의 member 순서만 비교)
+
+    Attributes:
+        llm (Runnable): 샘플을 생성할 모델 또는 러너블
+        num_samples (int): 최대 샘플 수
+        max_concurrency (int | None): 동시에 요청할 샘플 수. None 이면 모두 동시에 요청
+        key (Callable | None): 추출한 답을 투표 키로 바꾸는 함수
+    """
+
+    def __init__(self,
+                 llm: Runnable,
+                 num_samples: int = 5,
+                 max_concurrency: Optional[int] = None,
+                 key: Optional[Callable[[Any], Hashable]] = None):
 
         self.llm = llm
         self.num_samples = num_samples
+        self.max_concurrency = max_concurrency or num_samples
+        self.key = key or _default_key
+
+    def extract_answer(self, response: Any) -> Any:
+        content = getattr(response, "content", response)
+        if isinstance(content, str):
+            return content.strip()
+        return content
+
+    def _decided(self, votes: Counter, remaining: int) -> bool:
+        """남은 샘플로 1위가 바뀔 수 없는지 여부"""
+
+        ranked = votes.most_common(2)
+        if not ranked:
+            return False
+        second = ranked[1][1] if len(ranked) > 1 else 0
+        return ranked[0][1] > second + remaining
+
+    def invoke(self, input, config: Optional[RunnableConfig] = None, **kwargs):
+        votes: Counter = Counter()
+        answers: Dict[Hashable, Any] = {}
+
+        for i in range(self.num_samples):
+            answer = self.extract_answer(self.llm.invoke(input, config))
+            key = self.key(answer)
+            votes[key] += 1
+            answers.setdefault(key, answer)
+
+            if self._decided(votes, self.num_samples - i - 1):
+                break
+
+        return answers[votes.most_common(1)[0][0]]
+
+    async def ainvoke(self, input, config: Optional[RunnableConfig] = None, **kwargs):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def sample():
+            async with semaphore:
+                return self.extract_answer(await self.llm.ainvoke(input, config))
+
+        votes: Counter = Counter()
+        answers: Dict[Hashable, Any] = {}
+        errors: List[BaseException] = []
+
+        tasks = [asyncio.create_task(sample()) for _ in range(self.num_samples)]
+        try:
+            for finished, completed in enumerate(asyncio.as_completed(tasks), 1):
+                try:
+                    answer = await completed
+                except Exception as e:
+                    errors.append(e)
+                    continue
+
+                key = self.key(answer)
+                votes[key] += 1
+                answers.setdefault(key, answer)
 
-    def invoke(self, input, *args, **kwargs):
-        responses = [self.llm.invoke(input) for _ in range(self.num_samples)]
-        final_answers = [self.extract_answer(r) for r in responses]
-        most_common = Counter(final_answers).most_common(1)[0][0]
-        return most_common
+                if self._decided(votes, self.num_samples - finished):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-    def extract_answer(self, text):
+        if not votes:
+            raise errors[0]
 
-        return text.strip()
+        return answers[votes.most_common(1)[0][0]]
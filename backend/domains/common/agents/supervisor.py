@@ -1,19 +1,29 @@
 from typing import AsyncIterator, List, Optional, Protocol, TypedDict, cast
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
-from langchain_core.runnables import RunnableConfig
-from langchain_openai.chat_models.base import ChatOpenAI
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.runnables import Runnable, RunnableConfig
 from langchain_upstage import ChatUpstage
 from langgraph.config import get_stream_writer
 from langgraph.graph import END, StateGraph
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from common.metrics import (TRACE_KEY, MetricsCallbackHandler, RequestTrace,
+                            instrument_node, timed)
+from domains.chat.agents.context_window import to_messages
 from domains.chat.models import Chat, ChatProductInfo
+from domains.common.agents.context_compressor import ContextCompressor
 from domains.common.agents.graph_state import GraphState, PlanWithGoals
+from domains.common.agents.intent_router import IntentRouter
+from domains.common.agents.parallel_node import init_research_saving_node
 from domains.common.agents.retrieval_subgraph.retrieval_node import init_retrieval_node, init_retrieval_subgraph
 from domains.common.agents.types import Members
+from domains.common.agents.retrieval_subgraph.research_cache import SearchTool, init_research_cache
+from domains.common.agents.self_consistency import CoTSCWrapper
+from domains.common.config import ResearchConfig, SupervisorConfig
+from domains.common.llm_registry import LLMRegistry
 from domains.saving.agents.explain_node import init_explain_node
 from domains.saving.agents.saving_subgraph import init_saving_subgraph
 from domains.saving.agents.tool_factory import init_saving_retrieval_tools
+from domains.saving.config import SavingSearchConfig
 from domains.saving.repositories.retrieval import get_saving_by_ids
 from domains.user.models import UserMemory
 from domains.user.services import UserMemoryService
@@ -95,12 +105,46 @@ SUPERVISOR_SYSTEM_PROMPT = """\
 </Examples>"""
 
 
-def init_supervisor_node(llm: BaseChatModel):
+def init_supervisor_node(llm: BaseChatModel,
+                         router: Optional[IntentRouter] = None,
+                         parallel: bool = False,
+                         samples: int = 1,
+                         sample_concurrency: Optional[int] = None):
+    """Supervisor 노드 초기화
+
+    `router` 가 주어지면 로컬 의도 분류기로 계획을 먼저 예측하고,
+    확신도가 충분하면(on 모드) LLM 호출을 생략한다.
+    `parallel` 이면 연속된 research_node → saving_node 단계를
+    research_saving_node 한 번으로 묶어 동시에 실행한다.
+    `samples` 가 2 이상이면 계획을 여러 번 샘플링해 member 순서가 같은 계획끼리 다수결로 정한다.
+    """
 
     class SupervisorResponse(TypedDict):
         plans: List[PlanWithGoals]
         next: Members
 
+    planner: Runnable = llm.with_structured_output(SupervisorResponse)
+    if samples > 1:
+        planner = CoTSCWrapper(
+            planner,
+            num_samples=samples,
+            max_concurrency=sample_concurrency,
+            key=lambda r: tuple(p["member"] for p in r["plans"]),
+        )
+
+    def dispatch(plans: List[PlanWithGoals], step: int) -> dict:
+        next_ = plans[step]
+
+        if (parallel and next_["member"] == "research_node" and
+                step + 1 < len(plans) and plans[step + 1]["member"] == "saving_node"):
+            next_ = {
+                "member": "research_saving_node",  # type: ignore
+                "goal": f"{next_['goal']} / {plans[step + 1]['goal']}",
+            }
+            return {"next": next_, "current_step": step + 2}
+
+        return {"next": next_, "current_step": step + 1}
+
     async def supervisor_node(state: GraphState):
         print("============ Supervisor Node ============")
 
@@ -108,8 +152,18 @@ def init_supervisor_node(llm: BaseChatModel):
 
         # 1) 이미 계획이 있으면 다음 단계만 실행
         if "plans" in state and state["current_step"] < len(state["plans"]):
-            next_ = state["plans"][state["current_step"]]
-            return {"next": next_, "current_step": state["current_step"] + 1}
+            return dispatch(state["plans"], state["current_step"])
+
+        question = str(state["messages"][-1].content)
+        has_products = bool(state.get("selected"))
+
+        # 2) 로컬 분류기의 확신도가 높으면 LLM 없이 계획 결정
+        prediction = None
+        if router is not None:
+            prediction = router.predict(question, has_products)
+            plans = router.route(prediction, question)
+            if plans:
+                return {"plans": plans, **dispatch(plans, 0)}
 
         writer({
             "chat_id": state["chat_id"],
@@ -119,7 +173,7 @@ def init_supervisor_node(llm: BaseChatModel):
             }
         })
 
-        # 2) 최초 호출 → 계획 수립
+        # 3) 최초 호출 → 계획 수립
         messages = [
             {
                 "role": "system",
@@ -127,13 +181,14 @@ def init_supervisor_node(llm: BaseChatModel):
             },
             *state["messages"],
         ]
-        result = cast(
-            SupervisorResponse, await
-            llm.with_structured_output(SupervisorResponse).ainvoke(messages))
+        result = cast(SupervisorResponse, await planner.ainvoke(messages))
 
         print(result["plans"])
 
-        return {"next": result["plans"][0], "plans": result["plans"], "current_step": 1}
+        if router is not None:
+            await router.record(question, has_products, result["plans"], prediction)
+
+        return {"plans": result["plans"], **dispatch(result["plans"], 0)}
 
     return supervisor_node
 
@@ -144,7 +199,8 @@ class StreamGraphType(Protocol):
                  user_msg: str,
                  curr_chat: Chat,
                  memories: List[UserMemory],
-                 config: Optional[RunnableConfig] = ...) -> AsyncIterator[dict]:
+                 config: Optional[RunnableConfig] = ...,
+                 history: Optional[List[BaseMessage]] = ...) -> AsyncIterator[dict]:
         ...
 
 
@@ -152,14 +208,17 @@ def init_graph(
     llm: BaseChatModel,
     db: AsyncIOMotorDatabase,
     target_count: int = 3,
+    saving_cfg: SavingSearchConfig = SavingSearchConfig(),
+    supervisor_cfg: SupervisorConfig = SupervisorConfig(),
+    research_cfg: ResearchConfig = ResearchConfig(),
+    llms: Optional[LLMRegistry] = None,
+    search_tool: Optional[SearchTool] = None,
 ) -> StreamGraphType:
     sg = StateGraph(GraphState)
 
-    llm_with_reasoning = ChatOpenAI(
-        model="gpt-5",
-        reasoning_effort="low",
-        #temperature=0.3,
-    )
+    llms = llms or LLMRegistry()
+
+    llm_with_reasoning = llms.get("supervisor")
     """
     llm_with_reasoning = ChatUpstage(
         model="solar-pro2",
@@ -171,21 +230,49 @@ def init_graph(
 
     saving_col = db.get_collection("savings")
 
-    saving_tools = init_saving_retrieval_tools(saving_col)
-    sg.add_node("saving_node", init_saving_subgraph(llm, saving_tools))
+    # filter_node 와 explain_node 가 같은 압축 결과를 재사용
+    compressor = ContextCompressor.from_config(research_cfg)
+
+    saving_tools = init_saving_retrieval_tools(saving_col, saving_cfg)
+    _saving_subgraph = init_saving_subgraph(llm,
+                                            saving_tools,
+                                            saving_cfg,
+                                            saving_col,
+                                            compressor,
+                                            fit_llm=llms.get("filter"))
+    sg.add_node("saving_node", _saving_subgraph)
 
-    _retrieval_subgraph = init_retrieval_subgraph()
+    research = init_research_cache(research_cfg, search_tool)
+    _retrieval_subgraph = init_retrieval_subgraph(research, llm=llms.get("research"))
     _retrieval_node = init_retrieval_node(_retrieval_subgraph)
 
     #sg.add_node("research_node", init_research_node(llm))
-    sg.add_node("research_node", _retrieval_node)
-
-    sg.add_node("explain_node", init_explain_node(llm))
-
-    sg.add_node("supervisor", init_supervisor_node(llm_with_reasoning))
+    sg.add_node("research_node", instrument_node("research_node", _retrieval_node))
+
+    sg.add_node(
+        "research_saving_node",
+        instrument_node("research_saving_node",
+                        init_research_saving_node(_retrieval_node, _saving_subgraph)))
+
+    sg.add_node(
+        "explain_node",
+        instrument_node("explain_node",
+                        init_explain_node(llms.get("explain"), compressor)))
+
+    sg.add_node(
+        "supervisor",
+        instrument_node(
+            "supervisor",
+            init_supervisor_node(
+                llm_with_reasoning,
+                IntentRouter.from_config(supervisor_cfg),
+                parallel=supervisor_cfg.scheduler == "parallel",
+                samples=supervisor_cfg.plan_samples,
+                sample_concurrency=supervisor_cfg.plan_sample_concurrency)))
 
     sg.add_edge("research_node", "supervisor")
     sg.add_edge("saving_node", "supervisor")
+    sg.add_edge("research_saving_node", "supervisor")
     sg.add_edge("explain_node", END)
 
     sg.add_conditional_edges("supervisor", lambda s: s["next"]["member"])
@@ -198,7 +285,9 @@ def init_graph(
             user_msg: str,
             curr_chat: Chat,
             memories: List[UserMemory] = [],
-            config: Optional[RunnableConfig] = None) -> AsyncIterator[dict]:
+            config: Optional[RunnableConfig] = None,
+            history: Optional[List[BaseMessage]] = None) -> AsyncIterator[dict]:
+        """`history` 가 주어지면 `curr_chat.messages` 대신 이전 대화로 사용한다. (요약 + 최근 턴)"""
 
         products: List[ChatProductInfo] = []
         prev_messages: List[BaseMessage] = []
@@ -210,14 +299,23 @@ def init_graph(
                        curr_chat.messages))[-1].content.products or []
 
             # 이전 대화 내역 convert (products 제외)
-            prev_messages = list(
-                map(
-                    lambda msg: HumanMessage(content=msg.content.message or "")
-                    if msg.role == "assistant" else AIMessage(
-                        content=msg.content.message or ""), curr_chat.messages))
+            prev_messages = to_messages(curr_chat.messages)
+
+        if history is not None:
+            prev_messages = history
+
+        # 노드, LLM, 도구, Mongo 구간을 요청 단위로 모아 로그와 /metrics 에 남긴다
+        trace = RequestTrace(curr_chat.id)
+        config = {**(config or {})}
+        config["configurable"] = {**config.get("configurable", {}), TRACE_KEY: trace}
+        config["callbacks"] = [
+            *(config.get("callbacks") or []),
+            MetricsCallbackHandler(trace)
+        ]
 
         saving_ids = [p.product_id for p in products if p.product_id]
-        savings = await get_saving_by_ids(saving_col, saving_ids)
+        async with timed("mongo", "get_saving_by_ids", trace):
+            savings = await get_saving_by_ids(saving_col, saving_ids)
 
         init_state: GraphState = {
             "chat_id": curr_chat.id,
@@ -226,6 +324,9 @@ def init_graph(
             "candidates": [],
             "selected": savings,
             "offset": 0,
+            "page_size": 0,
+            "search_rounds": 0,
+            "search_call": None,
             "target_count": target_count + len(savings),
             "next": None,
             "plans": [],
@@ -233,10 +334,13 @@ def init_graph(
             "user_info": None,
             "user_memories": memories,
         }
-        async for chunk in graph.astream(init_state,
-                                         stream_mode="custom",
-                                         subgraphs=True,
-                                         config=config):
-            yield chunk
+        try:
+            async for chunk in graph.astream(init_state,
+                                             stream_mode="custom",
+                                             subgraphs=True,
+                                             config=config):
+                yield chunk
+        finally:
+            trace.finish()
 
     return stream_graph
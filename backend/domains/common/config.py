@@ -0,0 +1,75 @@
+import os
+from dataclasses import dataclass, field
+
+from common.cache import CacheBackendType
+from domains.common.types import IntentRouterMode, SchedulerMode
+
+
+@dataclass(frozen=True)
+class SupervisorConfig:
+
+    # 로컬 의도 분류기 (off | shadow | on)
+    router_mode: IntentRouterMode = field(default_factory=lambda: os.getenv(
+        "SUPERVISOR_ROUTER_MODE", "off").lower())  # type: ignore
+    router_model_path: str = field(default_factory=lambda: os.getenv(
+        "SUPERVISOR_ROUTER_MODEL_PATH", "data/intent_router.json"))
+    router_threshold: float = field(
+        default_factory=lambda: float(os.getenv("SUPERVISOR_ROUTER_THRESHOLD", 0.9)))
+
+    # 학습용 Supervisor 결정 기록 (빈 값이면 기록하지 않음)
+    route_log_path: str = field(
+        default_factory=lambda: os.getenv("SUPERVISOR_ROUTE_LOG_PATH", ""))
+
+    # 계획 실행 방식 (sequential | parallel)
+    scheduler: SchedulerMode = field(default_factory=lambda: os.getenv(
+        "SUPERVISOR_SCHEDULER", "sequential").lower())  # type: ignore
+
+    # 계획 수립 self-consistency 샘플 수 (1 이면 사용하지 않음), 동시 요청 수
+    plan_samples: int = field(
+        default_factory=lambda: int(os.getenv("SUPERVISOR_PLAN_SAMPLES", 1)))
+    plan_sample_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("SUPERVISOR_PLAN_SAMPLE_CONCURRENCY", 3)))
+
+
+@dataclass(frozen=True)
+class ResearchConfig:
+
+    # 웹 검색 결과 캐시 (none | memory | sqlite | redis)
+    cache_backend: CacheBackendType = field(default_factory=lambda: os.getenv(
+        "RESEARCH_CACHE_BACKEND", "sqlite").lower())  # type: ignore
+    cache_size: int = field(
+        default_factory=lambda: int(os.getenv("RESEARCH_CACHE_SIZE", 2048)))
+    cache_ttl_seconds: float = field(
+        default_factory=lambda: float(os.getenv("RESEARCH_CACHE_TTL_SECONDS", 21600)))
+    redis_url: str = field(
+        default_factory=lambda: os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    sqlite_path: str = field(
+        default_factory=lambda: os.getenv("CACHE_SQLITE_PATH", "cache.sqlite3"))
+
+    # 같은 검색어로 간주할 최소 유사도 (문자 bigram Jaccard)
+    dedupe_similarity: float = field(
+        default_factory=lambda: float(os.getenv("RESEARCH_DEDUPE_SIMILARITY", 0.8)))
+
+    # 프롬프트에 넣을 리서치 문서 토큰 예산, 구절 최대 길이
+    context_budget_tokens: int = field(
+        default_factory=lambda: int(os.getenv("RESEARCH_CONTEXT_TOKENS", 1200)))
+    passage_chars: int = field(
+        default_factory=lambda: int(os.getenv("RESEARCH_PASSAGE_CHARS", 400)))
+
+
+@dataclass(frozen=True)
+class LLMConfig:
+
+    # 공급자(openai, upstage)별 공유 HTTP 연결 풀 크기
+    max_connections: int = field(
+        default_factory=lambda: int(os.getenv("LLM_MAX_CONNECTIONS", 64)))
+    max_keepalive_connections: int = field(
+        default_factory=lambda: int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", 16)))
+    keepalive_expiry: float = field(
+        default_factory=lambda: float(os.getenv("LLM_KEEPALIVE_EXPIRY", 60)))
+    timeout_seconds: float = field(
+        default_factory=lambda: float(os.getenv("LLM_TIMEOUT_SECONDS", 120)))
+
+    # 서버 시작 시 공급자별로 미리 열어 둘 연결 수 (0 이면 사용하지 않음)
+    prewarm_connections: int = field(
+        default_factory=lambda: int(os.getenv("LLM_PREWARM_CONNECTIONS", 2)))
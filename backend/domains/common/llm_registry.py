@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Literal, Optional
+from uuid import UUID
+
+import httpx
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_openai import ChatOpenAI
+from langchain_upstage import ChatUpstage
+from openai import AsyncOpenAI
+
+from common.logger import _logger
+from common.metrics import registry as metrics
+from domains.common.config import LLMConfig
+
+logger = _logger(__name__)
+
+metrics.describe("llm_in_flight", "LLM 프로필별 진행 중인 호출 수")
+metrics.describe("llm_profile_seconds", "LLM 프로필별 응답 시간")
+
+LLMProvider = Literal["openai", "upstage"]
+
+BASE_URLS: Dict[LLMProvider, str] = {
+    "openai": os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"),
+    "upstage": "https://api.upstage.ai/v1",
+}
+
+API_KEY_ENVS: Dict[LLMProvider, str] = {
+    "openai": "OPENAI_API_KEY",
+    "upstage": "UPSTAGE_API_KEY",
+}
+
+
+@dataclass(frozen=True)
+class LLMProfile:
+    """용도별 모델 설정.
+
+    Attributes:
+        provider (LLMProvider): 공급자. 같은 공급자의 프로필은 연결 풀을 공유한다.
+        model (str): 모델 이름
+        options (dict): 모델 생성자에 그대로 전달할 추가 인자 (temperature 등)
+    """
+
+    provider: LLMProvider
+    model: str
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+LLM_PROFILES: Dict[str, LLMProfile] = {
+    # 그래프 공용 (tool 선택, 질의 생성 등)
+    "default":
+        LLMProfile("upstage", "solar-pro2", {
+            "temperature": 0.0,
+            "reasoning_effort": "low",
+            "max_tokens": 16384
+        }),
+    "supervisor":
+        LLMProfile("openai", "gpt-5", {"reasoning_effort": "low"}),
+    "research":
+        LLMProfile("upstage", "solar-pro2", {
+            "temperature": 0.3,
+            "reasoning_effort": "low",
+            "max_tokens": 16384
+        }),
+    "filter":
+        LLMProfile("openai", "gpt-4o"),
+    "explain":
+        LLMProfile("openai", "gpt-4.1", {"temperature": 0.3}),
+    "memory":
+        LLMProfile("openai", "gpt-4o-mini", {"temperature": 0.3}),
+    "summary":
+        LLMProfile("openai", "gpt-4o-mini", {"temperature": 0.0}),
+}
+
+
+@dataclass
+class ProfileStats:
+
+    calls: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        finished = self.calls - self.in_flight
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "avg_seconds": self.total_seconds / finished if finished else 0.0,
+            "max_seconds": self.max_seconds,
+        }
+
+
+class _ProfileStatsHandler(BaseCallbackHandler):
+    """프로필별 동시 호출 수와 응답 시간을 집계하는 모델 단위 콜백"""
+
+    run_inline = True
+
+    def __init__(self, profile: str, stats: ProfileStats):
+        self.profile = profile
+        self.stats = stats
+        self._started: Dict[UUID, float] = {}
+
+    def _start(self, run_id: UUID):
+        self._started[run_id] = time.perf_counter()
+        self.stats.calls += 1
+        self.stats.in_flight += 1
+        metrics.set("llm_in_flight", self.stats.in_flight, profile=self.profile)
+
+    def _end(self, run_id: UUID, error: bool = False):
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+
+        seconds = time.perf_counter() - started
+        self.stats.in_flight -= 1
+        self.stats.errors += error
+        self.stats.total_seconds += seconds
+        self.stats.max_seconds = max(self.stats.max_seconds, seconds)
+
+        metrics.set("llm_in_flight", self.stats.in_flight, profile=self.profile)
+        metrics.observe("llm_profile_seconds", seconds, profile=self.profile)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id, error=True)
+
+
+class LLMRegistry:
+    """이름 있는 모델 프로필을 공유 연결 풀 위에서 한 번씩만 생성해 재사용한다.
+
+    공급자마다 keep-alive `httpx.AsyncClient` 하나를 두고, 그 공급자의 모든 모델과
+    `AsyncOpenAI` 클라이언트가 이를 공유한다. 호출마다 새 연결과 TLS 핸드셰이크를 만들지 않는다.
+
+    Attributes:
+        cfg (LLMConfig): 연결 풀 설정
+        profiles (Dict[str, LLMProfile]): 프로필 이름별 모델 설정
+    """
+
+    def __init__(self,
+                 cfg: LLMConfig = LLMConfig(),
+                 profiles: Optional[Dict[str, LLMProfile]] = None):
+        self.cfg = cfg
+        self.profiles = profiles or LLM_PROFILES
+
+        self._pools: Dict[LLMProvider, httpx.AsyncClient] = {}
+        self._models: Dict[str, BaseChatModel] = {}
+        self._clients: Dict[LLMProvider, AsyncOpenAI] = {}
+        self._stats: Dict[str, ProfileStats] = {}
+
+    def pool(self, provider: LLMProvider) -> httpx.AsyncClient:
+        if provider not in self._pools:
+            self._pools[provider] = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.cfg.max_connections,
+                    max_keepalive_connections=self.cfg.max_keepalive_connections,
+                    keepalive_expiry=self.cfg.keepalive_expiry,
+                ),
+                timeout=self.cfg.timeout_seconds,
+            )
+        return self._pools[provider]
+
+    def get(self, name: str) -> BaseChatModel:
+        """프로필 이름에 해당하는 채팅 모델. 처음 요청될 때 생성된다."""
+
+        if name in self._models:
+            return self._models[name]
+
+        profile = self.profiles.get(name)
+        if profile is None:
+            raise KeyError(f"등록되지 않은 LLM 프로필입니다: {name}")
+
+        stats = self._stats.setdefault(name, ProfileStats())
+        kwargs = {
+            "model": profile.model,
+            "http_async_client": self.pool(profile.provider),
+            "callbacks": [_ProfileStatsHandler(name, stats)],
+            **profile.options,
+        }
+
+        if profile.provider == "upstage":
+            model: BaseChatModel = ChatUpstage(**kwargs)
+        else:
+            model = ChatOpenAI(**kwargs)
+
+        self._models[name] = model
+        return model
+
+    def openai_client(self, provider: LLMProvider) -> AsyncOpenAI:
+        """공유 연결 풀을 사용하는 OpenAI 호환 SDK 클라이언트"""
+
+        if provider not in self._clients:
+            self._clients[provider] = AsyncOpenAI(
+                api_key=os.getenv(API_KEY_ENVS[provider], ""),
+                base_url=BASE_URLS[provider],
+                http_client=self.pool(provider),
+            )
+        return self._clients[provider]
+
+    async def prewarm(self):
+        """프로필에서 사용하는 공급자마다 `prewarm_connections` 개의 연결을 미리 연다."""
+
+        if self.cfg.prewarm_connections <= 0:
+            return
+
+        providers = {p.provider for p in self.profiles.values()}
+
+        async def touch(provider: LLMProvider):
+            # 응답 내용과 상태 코드는 무관하다. TLS 연결이 풀에 남는 것이 목적.
+            api_key = os.getenv(API_KEY_ENVS[provider], "")
+            try:
+                await self.pool(provider).get(
+                    f"{BASE_URLS[provider]}/models",
+                    headers={"Authorization": f"Bearer {api_key}"})
+            except httpx.HTTPError as e:
+                logger(f"{provider} 연결 예열에 실패했습니다. ({e})", level=logging.WARNING)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            touch(provider)
+            for provider in providers
+            for _ in range(self.cfg.prewarm_connections)
+        ])
+        logger(
+            f"LLM 연결 예열 완료: {sorted(providers)} "
+            f"({time.perf_counter() - start:.2f}s)",
+            level=logging.INFO)
+
+    @property
+    def stats(self) -> Dict[str, dict]:
+        return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    async def aclose(self):
+        for pool in self._pools.values():
+            await pool.aclose()
+        self._pools.clear()
+        self._models.clear()
+        self._clients.clear()
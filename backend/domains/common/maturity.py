@@ -0,0 +1,235 @@
+"""적금 만기 금액 계산기.
+
+MongoDB aggregation 네이티브 연산자 표현식과 NumPy 벡터 연산 두 가지 경로를 제공한다.
+표현식 함수의 인자는 숫자, 필드 경로("$field"), 또는 다른 표현식을 받는다.
+
+- 월 복리: FV = P * ((1 + r)^n - 1) / r   (r = 연이율 / 12 / 100, 매월 말 납입)
+- 단리(적립식): I = P * r * n(n + 1) / 2
+- 예치 단리: I = 원금 * 연이율 * (n / 12) / 100
+- 목표 도달 기간: n = ln(1 + FV * r / P) / ln(1 + r)
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+
+# 이자소득세 (소득세 14% + 지방소득세 1.4%)
+INTEREST_TAX_RATE = 0.154
+
+Expr = Any
+
+# ---------------------------------------------------------------------------
+# aggregation 표현식
+# ---------------------------------------------------------------------------
+
+
+def monthly_rate_expr(annual_rate: Expr) -> dict:
+    """연이율(%) → 월이율. 금리가 없으면 0."""
+
+    return {"$divide": [{"$ifNull": [annual_rate, 0]}, 1200]}
+
+
+def compound_total_expr(monthly_deposit: Expr, annual_rate: Expr,
+                        term_months: Expr) -> dict:
+    """월 복리 적립 시 만기 원리금(세전)."""
+
+    return {
+        "$let": {
+            "vars": {
+                "p": monthly_deposit,
+                "r": monthly_rate_expr(annual_rate),
+                "n": term_months,
+            },
+            "in": {
+                "$cond": [{
+                    "$eq": ["$$r", 0]
+                }, {
+                    "$multiply": ["$$p", "$$n"]
+                }, {
+                    "$divide": [{
+                        "$multiply": [
+                            "$$p", {
+                                "$subtract": [{
+                                    "$pow": [{
+                                        "$add": [1, "$$r"]
+                                    }, "$$n"]
+                                }, 1]
+                            }
+                        ]
+                    }, "$$r"]
+                }]
+            }
+        }
+    }
+
+
+def simple_interest_expr(monthly_deposit: Expr, annual_rate: Expr,
+                         term_months: Expr) -> dict:
+    """단리 적립 시 세전 이자. 각 회차 납입액이 남은 개월 수만큼 이자를 받는다."""
+
+    return {
+        "$let": {
+            "vars": {
+                "n": term_months
+            },
+            "in": {
+                "$multiply": [
+                    monthly_deposit,
+                    monthly_rate_expr(annual_rate), {
+                        "$divide": [{
+                            "$multiply": ["$$n", {
+                                "$add": ["$$n", 1]
+                            }]
+                        }, 2]
+                    }
+                ]
+            }
+        }
+    }
+
+
+def lump_sum_interest_expr(principal: Expr, annual_rate: Expr,
+                           term_months: Expr) -> dict:
+    """원금 전체를 가입 기간 동안 예치했을 때의 단리 이자."""
+
+    return {
+        "$divide": [{
+            "$multiply": [
+                principal, {
+                    "$ifNull": [annual_rate, 0]
+                }, {
+                    "$divide": [term_months, 12]
+                }
+            ]
+        }, 100]
+    }
+
+
+def after_tax_expr(interest: Expr) -> dict:
+    """세후 이자."""
+
+    return {"$multiply": [interest, 1 - INTEREST_TAX_RATE]}
+
+
+def maturity_details_expr(monthly_deposit: Expr, annual_rate: Expr,
+                          term_months: Expr) -> Dict[str, dict]:
+    """월 복리 기준 원금, 이자, 세후 이자, 만기 수령액 표현식."""
+
+    total = compound_total_expr(monthly_deposit, annual_rate, term_months)
+    principal = {"$multiply": [monthly_deposit, term_months]}
+    interest = {"$subtract": [total, principal]}
+
+    return {
+        "principal": principal,
+        "total_amount": total,
+        "interest": interest,
+        "interest_after_tax": after_tax_expr(interest),
+        "payout_after_tax": {
+            "$add": [principal, after_tax_expr(interest)]
+        },
+    }
+
+
+def months_to_target_expr(target_amount: Expr, monthly_deposit: Expr,
+                          annual_rate: Expr) -> dict:
+    """월 복리 적립으로 목표 금액에 도달하는 데 필요한 개월 수(실수)."""
+
+    return {
+        "$let": {
+            "vars": {
+                "fv": target_amount,
+                "p": monthly_deposit,
+                "r": monthly_rate_expr(annual_rate),
+            },
+            "in": {
+                "$cond": [{
+                    "$eq": ["$$r", 0]
+                }, {
+                    "$divide": ["$$fv", "$$p"]
+                }, {
+                    "$divide": [{
+                        "$ln": {
+                            "$add": [
+                                1, {
+                                    "$divide": [{
+                                        "$multiply": ["$$fv", "$$r"]
+                                    }, "$$p"]
+                                }
+                            ]
+                        }
+                    }, {
+                        "$ln": {
+                            "$add": [1, "$$r"]
+                        }
+                    }]
+                }]
+            }
+        }
+    }
+
+
+# ---------------------------------------------------------------------------
+# NumPy 벡터 연산
+# ---------------------------------------------------------------------------
+
+
+def _monthly_rate(annual_rate) -> np.ndarray:
+    return np.nan_to_num(np.asarray(annual_rate, dtype=np.float64)) / 1200
+
+
+def compound_total(monthly_deposit, annual_rate, term_months) -> np.ndarray:
+    """월 복리 적립 시 만기 원리금(세전)."""
+
+    r = _monthly_rate(annual_rate)
+    p = np.asarray(monthly_deposit, dtype=np.float64)
+    n = np.asarray(term_months, dtype=np.float64)
+
+    safe_r = np.where(r == 0, 1.0, r)
+    return np.where(r == 0, p * n, p * np.expm1(n * np.log1p(safe_r)) / safe_r)
+
+
+def simple_interest(monthly_deposit, annual_rate, term_months) -> np.ndarray:
+    """단리 적립 시 세전 이자."""
+
+    n = np.asarray(term_months, dtype=np.float64)
+    return monthly_deposit * _monthly_rate(annual_rate) * n * (n + 1) / 2
+
+
+def lump_sum_interest(principal, annual_rate, term_months) -> np.ndarray:
+    """원금 전체를 가입 기간 동안 예치했을 때의 단리 이자."""
+
+    rate = np.nan_to_num(np.asarray(annual_rate, dtype=np.float64))
+    return principal * rate * (term_months / 12) / 100
+
+
+def after_tax(interest) -> np.ndarray:
+    """세후 이자."""
+
+    return np.asarray(interest) * (1 - INTEREST_TAX_RATE)
+
+
+def maturity_details(monthly_deposit, annual_rate,
+                     term_months) -> Dict[str, np.ndarray]:
+    """월 복리 기준 원금, 이자, 세후 이자, 만기 수령액."""
+
+    total = compound_total(monthly_deposit, annual_rate, term_months)
+    principal = np.broadcast_to(
+        np.asarray(monthly_deposit, dtype=np.float64) * term_months, total.shape)
+    interest = total - principal
+
+    return {
+        "principal": principal,
+        "total_amount": total,
+        "interest": interest,
+        "interest_after_tax": after_tax(interest),
+        "payout_after_tax": principal + after_tax(interest),
+    }
+
+
+def months_to_target(target_amount, monthly_deposit, annual_rate) -> np.ndarray:
+    """월 복리 적립으로 목표 금액에 도달하는 데 필요한 개월 수(실수)."""
+
+    r = _monthly_rate(annual_rate)
+    safe_r = np.where(r == 0, 1.0, r)
+    months = np.log1p(target_amount * safe_r / monthly_deposit) / np.log1p(safe_r)
+    return np.where(r == 0, target_amount / monthly_deposit, months)
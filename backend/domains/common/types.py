@@ -17,3 +17,15 @@ def unit_map(unit: TermUnit):
             return "개월"
         case "year":
             return "년"
+
+
+# Supervisor 로컬 의도 분류기 동작 방식
+# - off: 사용하지 않음
+# - shadow: LLM 결정과 비교만 하고 기록
+# - on: 확신도가 높으면 LLM 대신 사용
+IntentRouterMode = Literal["off", "shadow", "on"]
+
+# Supervisor 계획 실행 방식
+# - sequential: 계획 순서대로 한 노드씩 실행
+# - parallel: 연속된 research_node → saving_node 를 동시에 실행
+SchedulerMode = Literal["sequential", "parallel"]
@@ -1,19 +1,35 @@
-from typing import List
+from typing import List, Optional
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate, HumanMessagePromptTemplate, SystemMessagePromptTemplate
-from langchain_openai.chat_models.base import ChatOpenAI
 from langgraph.config import get_stream_writer
 from langgraph.graph import END
 
-from domains.common.agents.graph_state import GraphState
+from domains.common.agents.context_compressor import ContextCompressor
+from domains.common.agents.graph_state import GraphState, ProductSearchResult
 from domains.saving.agents.prompts import (SAVING_EXPLAIN_NODE_SYSTEM_PROMPT,
                                            SAVING_EXPLAIN_USER_PROMPT_TEMPLATE)
 
 
-def init_explain_node(llm: BaseChatModel):
+def chat_product_info(result: ProductSearchResult) -> dict:
+    """클라이언트로 스트리밍할 상품 정보 (`ChatProductInfo` 형식)"""
 
-    llm = ChatOpenAI(model="gpt-4.1", temperature=0.3)
+    return {
+        "name": result.product.name,
+        "product_id": result.product.id,
+        "product_type": "saving",
+        "options": result.product.format_interest_rates(),
+        "institution": result.product.institution,
+        "description": result.product.name,
+        "details": str(result.product),
+        "tags": [],
+    }
+
+
+def init_explain_node(llm: BaseChatModel,
+                      compressor: Optional[ContextCompressor] = None):
+
+    compressor = compressor or ContextCompressor()
 
     async def node(state: GraphState):
         writer = get_stream_writer()
@@ -28,9 +44,9 @@ def init_explain_node(llm: BaseChatModel):
         ])
 
         products = state["selected"]
+        question = str(state["messages"][-1].content)
 
-        research_blob = "\n\n## 외부 참고 정보\n" + "\n".join(
-            f"- {d}" for d in state["documents"])
+        research_blob = compressor.compress(question, state["documents"])
 
         combined_memories = "\n".join([m.content for m in state["user_memories"]])
 
@@ -42,23 +58,14 @@ def init_explain_node(llm: BaseChatModel):
                 "user_memories": combined_memories,
                 "product_info": blob,
                 "context": research_blob,
-                "user_question": str(state["messages"][0].content),
+                "user_question": question,
             })
 
             writer({
                 "chat_id": state["chat_id"],
                 "status": "response",
                 "content": {
-                    "products": [{
-                        "name": p.product.name,
-                        "product_id": p.product.id,
-                        "product_type": "saving",
-                        "options": p.product.format_interest_rates(),
-                        "institution": p.product.institution,
-                        "description": p.product.name,
-                        "details": str(p.product),
-                        "tags": [],
-                    } for p in products]
+                    "products": [chat_product_info(p) for p in products]
                 }
             })
 
@@ -68,7 +75,7 @@ def init_explain_node(llm: BaseChatModel):
                 "user_memories": combined_memories,
                 "product_info": "NONE",
                 "context": research_blob,
-                "user_question": str(state["messages"][0].content),
+                "user_question": question,
             })
 
         chunks: List[str] = []
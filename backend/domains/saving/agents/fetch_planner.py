@@ -0,0 +1,92 @@
+import math
+from typing import Any, Dict, Hashable, Optional
+
+from domains.common.agents.graph_state import GraphState
+
+# 페이지네이션 인자는 질의 형태에서 제외
+_PAGING_ARGS = {"top_k", "offset"}
+
+# 가입 기간 구간(개월). 기간에 따라 가입 가능한 상품과 적합 판정 비율이 크게 달라진다.
+_TERM_BUCKETS = (6, 12, 24, 36)
+
+
+class AdaptiveFetchPlanner:
+    """filter_node 의 과거 통과율로 한 번에 가져올 후보 수를 정한다.
+
+    질의 형태(tool 이름, 인자 구성, 가입 기간 구간)별 통과율을 지수 이동 평균으로 추적하고,
+    필요한 상품 수 / 통과율 만큼 후보를 미리 가져와 대부분 router 루프 한 번에 끝나도록 한다.
+
+    Attributes:
+        max_rounds (int): 요청당 최대 검색 횟수
+        max_candidates (int): 요청당 최대 평가 후보 수
+        alpha (float): 통과율 지수 이동 평균의 가중치
+        prior (float): 처음 보는 질의 형태의 통과율
+        min_rate (float): 페이지 크기 계산에 사용할 통과율 하한
+        headroom (float): 통과율 변동에 대비해 더 가져올 배수
+    """
+
+    def __init__(self,
+                 *,
+                 max_rounds: int = 3,
+                 max_candidates: int = 30,
+                 alpha: float = 0.2,
+                 prior: float = 0.5,
+                 min_rate: float = 0.1,
+                 headroom: float = 1.5):
+        self.max_rounds = max_rounds
+        self.max_candidates = max_candidates
+        self.alpha = alpha
+        self.prior = prior
+        self.min_rate = min_rate
+        self.headroom = headroom
+
+        self._rates: Dict[Hashable, float] = {}
+
+    @staticmethod
+    def shape(search_call: Optional[Dict[str, Any]]) -> Hashable:
+        if not search_call:
+            return None
+
+        args = search_call.get("args", {})
+        term = args.get("total_term_months")
+        term_bucket = None
+        if term is not None:
+            term_bucket = next((b for b in _TERM_BUCKETS if term <= b),
+                               _TERM_BUCKETS[-1] + 1)
+
+        return (
+            search_call.get("name"),
+            tuple(
+                sorted(k for k, v in args.items()
+                       if k not in _PAGING_ARGS and v is not None)),
+            term_bucket,
+        )
+
+    def acceptance_rate(self, shape: Hashable) -> float:
+        return self._rates.get(shape, self.prior)
+
+    def page_size(self, state: GraphState, shape: Hashable) -> int:
+        """이번 검색에서 가져올 후보 수. 요청당 후보 상한을 넘지 않는다."""
+
+        needed = max(state["target_count"] - len(state.get("selected") or []), 1)
+        rate = max(self.acceptance_rate(shape), self.min_rate)
+
+        size = math.ceil(needed * self.headroom / rate)
+        return max(min(size, self.max_candidates - state["offset"]), 1)
+
+    def observe(self, shape: Hashable, evaluated: int, accepted: int):
+        """filter_node 평가 결과로 질의 형태의 통과율을 갱신한다."""
+
+        if evaluated <= 0:
+            return
+
+        observed = accepted / evaluated
+        rate = self.acceptance_rate(shape)
+        self._rates[shape] = (1 - self.alpha) * rate + self.alpha * observed
+
+    def exhausted(self, state: GraphState) -> bool:
+        """검색 횟수나 후보 수 상한에 도달했는지 여부"""
+
+        fetched = state["offset"] + (state.get("page_size") or 0)
+        return (state.get("search_rounds") or 0) >= self.max_rounds or \
+            fetched >= self.max_candidates
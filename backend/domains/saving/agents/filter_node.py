@@ -1,21 +1,51 @@
+import math
 import re
+from typing import Dict, List, Optional, Sequence, Tuple, cast
+
+from langchain_core.documents import Document
 from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai.chat_models.base import ChatOpenAI
+from langchain_core.runnables import RunnableConfig
 from langgraph.config import get_stream_writer
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import BaseModel, Field
 
 from langchain_upstage import ChatUpstage
 
+from common.cache import create_cache
+from common.metrics import queued
+from domains.common.agents.context_compressor import ContextCompressor
 from domains.common.agents.graph_state import (
     GraphState,
+    PENDING_DOCUMENTS_KEY,
     ProductSearchResult,
 )
-from domains.saving.agents.prompts import (SAVING_ANALYSIS_SYSTEM_PROMPT,
-                                           SAVING_ANALYSIS_USER_PROMPT_TEMPLATE)
+from domains.saving.agents.prompts import (
+    SAVING_ANALYSIS_SYSTEM_PROMPT,
+    SAVING_ANALYSIS_USER_PROMPT_TEMPLATE,
+    SAVING_BATCH_ANALYSIS_SYSTEM_PROMPT,
+    SAVING_BATCH_ANALYSIS_USER_PROMPT_TEMPLATE,
+)
+from domains.saving.agents.explain_node import chat_product_info
+from domains.saving.agents.fetch_planner import AdaptiveFetchPlanner
+from domains.saving.agents.verdict_cache import ProductFitCache
+from domains.saving.config import SavingSearchConfig
 
 import asyncio
 
 
+class SavingFitVerdict(BaseModel):
+    """상품 하나에 대한 적합성 판정"""
+
+    index: int = Field(description="상품 번호")
+    thought: str = Field(description="판단 근거")
+    suitable: bool = Field(description="적합 여부")
+
+
+class SavingFitVerdicts(BaseModel):
+    verdicts: List[SavingFitVerdict]
+
+
 def _parse_saving_analysis(response: str):
     out = {"thought": None, "answer": None, "valid": False}
 
@@ -37,31 +67,28 @@ def _parse_saving_analysis(response: str):
     return out
 
 
-async def _evaluate_product_fit(
-    llm: BaseChatModel,
-    product: ProductSearchResult,
-    state: GraphState,
-) -> bool:
+def _shared_context(state: GraphState, documents: List[Document],
+                    compressor: ContextCompressor) -> Dict[str, str]:
+    """모든 상품 평가에 공통으로 들어가는 프롬프트 변수"""
 
-    llm = ChatOpenAI(model="gpt-4o")
-    #llm = ChatUpstage(model="solar-pro2", reasoning_effort="low")
+    question = str(state["messages"][-1].content)
+    combined_memories = "\n".join([m.content for m in state["user_memories"]])
 
-    prompt_template = ChatPromptTemplate([
-        ("system", SAVING_ANALYSIS_SYSTEM_PROMPT),
-        ("user", SAVING_ANALYSIS_USER_PROMPT_TEMPLATE),
-    ])
+    return {
+        "user_memories": combined_memories,
+        "user_question": question,
+        "context": compressor.compress(question, documents),
+    }
 
-    research_blob = "\n\n## 외부 참고 정보\n" + "\n".join(
-        f"- {d}" for d in state["documents"])
 
-    combined_memories = "\n".join([m.content for m in state["user_memories"]])
+async def _evaluate_product_fit(
+    llm: BaseChatModel,
+    prompt_template: ChatPromptTemplate,
+    product: ProductSearchResult,
+    shared: Dict[str, str],
+) -> bool:
 
-    prompt = prompt_template.invoke({
-        "user_memories": combined_memories,
-        "user_question": str(state["messages"][0].content),
-        "product_info": str(product),
-        "context": research_blob,
-    })
+    prompt = prompt_template.invoke({**shared, "product_info": str(product)})
 
     res = await llm.ainvoke(prompt)
     result = str(res.content)
@@ -76,9 +103,81 @@ async def _evaluate_product_fit(
     return parsed["valid"]
 
 
-def init_filter_node(llm: BaseChatModel):
+def init_filter_node(llm: BaseChatModel,
+                     cfg: SavingSearchConfig = SavingSearchConfig(),
+                     collection: Optional[AsyncIOMotorCollection] = None,
+                     planner: Optional[AdaptiveFetchPlanner] = None,
+                     compressor: Optional[ContextCompressor] = None):
+    """상품 적합성 평가 노드 초기화
+
+    `cfg.filter_mode` 가 "batch" 이면 후보를 `cfg.filter_batch_size` 개씩 묶어 한 번의
+    구조화 출력 호출로 평가한다. 조기 종료가 가능하도록 묶음 크기는 목표 개수를 넘지 않는다.
+    호출이 실패했거나 판정이 누락된 상품은 상품별 개별 호출로 다시 평가한다. 모든 LLM 호출은 `cfg.filter_concurrency` 개로 제한된다.
 
-    async def node(state: GraphState):
+    `cfg.verdict_cache_backend` 가 설정되어 있으면 이전 판정을 재사용하고,
+    캐시에 없는 상품만 LLM 으로 평가한다. `collection` 은 판정 캐시 키의 카탈로그 버전 조회에 쓰인다.
+
+    판정은 끝나는 순서대로 처리되며, 적합 판정을 받은 상품은 즉시 클라이언트로 스트리밍된다.
+    목표 개수(`target_count`)를 채우면 남은 평가는 취소하고 다음 단계로 넘어간다.
+    """
+
+    single_prompt = ChatPromptTemplate([
+        ("system", SAVING_ANALYSIS_SYSTEM_PROMPT),
+        ("user", SAVING_ANALYSIS_USER_PROMPT_TEMPLATE),
+    ])
+    batch_prompt = ChatPromptTemplate([
+        ("system", SAVING_BATCH_ANALYSIS_SYSTEM_PROMPT),
+        ("user", SAVING_BATCH_ANALYSIS_USER_PROMPT_TEMPLATE),
+    ])
+    batch_model = llm.with_structured_output(SavingFitVerdicts)
+
+    batch_size = max(cfg.filter_batch_size, 1)
+    compressor = compressor or ContextCompressor()
+
+    cache = create_cache(cfg.verdict_cache_backend,
+                         prefix="saving_fit",
+                         max_size=cfg.verdict_cache_size,
+                         ttl_seconds=cfg.verdict_cache_ttl_seconds,
+                         redis_url=cfg.redis_url,
+                         sqlite_path=cfg.sqlite_path)
+    fit_cache = ProductFitCache(cache, collection) if cache is not None else None
+
+    def llm_calls(count: int, size: int) -> int:
+        if cfg.filter_mode == "batch":
+            return math.ceil(count / size)
+        return count
+
+    async def evaluate_single(product: ProductSearchResult, shared: Dict[str, str],
+                              semaphore: asyncio.Semaphore) -> bool:
+        async with queued(semaphore, "filter", "evaluate_single"):
+            return await _evaluate_product_fit(llm, single_prompt, product, shared)
+
+    async def evaluate_batch(
+        chunk: Sequence[ProductSearchResult],
+        shared: Dict[str, str],
+        semaphore: asyncio.Semaphore,
+    ) -> List[bool]:
+        product_infos = "\n\n".join(
+            f"### 상품 {i}\n{product}" for i, product in enumerate(chunk, 1))
+        prompt = batch_prompt.invoke({**shared, "product_infos": product_infos})
+
+        verdicts: Dict[int, bool] = {}
+        try:
+            async with queued(semaphore, "filter", "evaluate_batch"):
+                result = cast(SavingFitVerdicts, await batch_model.ainvoke(prompt))
+            verdicts = {v.index: v.suitable for v in result.verdicts}
+        except Exception as e:
+            print(f"배치 적합성 평가 실패, 개별 평가로 전환합니다. ({e})")
+
+        missing = [i for i in range(1, len(chunk) + 1) if i not in verdicts]
+        if missing:
+            fallback = await asyncio.gather(
+                *[evaluate_single(chunk[i - 1], shared, semaphore) for i in missing])
+            verdicts.update(zip(missing, fallback))
+
+        return [verdicts[i] for i in range(1, len(chunk) + 1)]
+
+    async def node(state: GraphState, config: RunnableConfig):
         print("============ Fileter Node ============")
         writer = get_stream_writer()
         candidates = state.get("candidates") or []
@@ -97,9 +196,100 @@ def init_filter_node(llm: BaseChatModel):
             }
         })
 
-        eval_result = await asyncio.gather(
-            *[_evaluate_product_fit(llm, product, state) for product in candidates])
-        filtered = [product for eval, product in zip(eval_result, candidates) if eval]
+        # research 와 병렬로 실행 중이면 리서치 문서가 도착할 때까지 기다린 뒤 합친다
+        documents = list(state["documents"])
+        pending_documents = config.get("configurable", {}).get(PENDING_DOCUMENTS_KEY)
+        if pending_documents is not None:
+            documents += await pending_documents
+
+        shared = _shared_context(state, documents, compressor)
+        semaphore = asyncio.Semaphore(max(cfg.filter_concurrency, 1))
+
+        cached: Dict[int, bool] = {}
+        if fit_cache is not None:
+            verdict_ctx = await fit_cache.context(state)
+            cached = await fit_cache.get_many(verdict_ctx, candidates)
+
+        needed = state["target_count"] - len(state.get("selected") or [])
+
+        # 배치가 하나로 끝나면 조기 종료가 일어나지 않으므로 필요한 개수 이하로 나눈다
+        unit_size = max(min(batch_size, needed), 1)
+        pending = [i for i in range(len(candidates)) if i not in cached]
+        if cfg.filter_mode == "batch":
+            units = [
+                pending[i:i + unit_size] for i in range(0, len(pending), unit_size)
+            ]
+        else:
+            units = [[i] for i in pending]
+
+        async def evaluate(indices: List[int]) -> List[Tuple[int, bool]]:
+            products = [candidates[i] for i in indices]
+            if cfg.filter_mode == "batch":
+                verdicts = await evaluate_batch(products, shared, semaphore)
+            else:
+                verdicts = [await evaluate_single(products[0], shared, semaphore)]
+            return list(zip(indices, verdicts))
+
+        fresh: Dict[int, bool] = {}
+        accepted: List[int] = []
+
+        def accept(index: int):
+            # 목표 개수를 채운 뒤에 도착한 판정은 선택하지도, 스트리밍하지도 않는다
+            if len(accepted) >= needed:
+                return
+
+            accepted.append(index)
+            writer({
+                "chat_id": state["chat_id"],
+                "status": "pending",
+                "content": {
+                    "message": f"{candidates[index].product.name} 상품이 조건에 맞습니다.",
+                    "products": [chat_product_info(candidates[index])],
+                }
+            })
+
+        for i in sorted(cached):
+            if cached[i]:
+                accept(i)
+
+        tasks = []
+        if len(accepted) < needed:
+            tasks = [asyncio.create_task(evaluate(unit)) for unit in units]
+
+        try:
+            for completed in asyncio.as_completed(tasks):
+                for i, verdict in await completed:
+                    fresh[i] = verdict
+                    if verdict:
+                        accept(i)
+
+                if len(accepted) >= needed:
+                    break
+        finally:
+            # 목표 개수를 채웠거나 실패한 경우 남은 평가를 취소
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        cancelled = len(pending) - len(fresh)
+        if cancelled:
+            print(f"목표 상품 수를 채워 {cancelled}개 상품의 평가를 생략했습니다.")
+
+        if fit_cache is not None:
+            await fit_cache.set_many(verdict_ctx, [candidates[i] for i in fresh],
+                                     list(fresh.values()))
+            fit_cache.record_avoided(
+                llm_calls(len(candidates), unit_size) -
+                llm_calls(len(pending), unit_size))
+            print(f"적합성 판정 캐시: {fit_cache.stats}")
+
+        filtered = [candidates[i] for i in sorted(accepted)][:max(needed, 0)]
+
+        if planner is not None:
+            # 통과율은 목표 개수로 자르기 전의 적합 판정 수로 추적
+            passed = sum(cached.values()) + sum(fresh.values())
+            planner.observe(planner.shape(state.get("search_call")),
+                            len(cached) + len(fresh), passed)
 
         return {
             "selected": filtered,
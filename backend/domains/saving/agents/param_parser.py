@@ -0,0 +1,378 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from domains.saving.agents.tool_factory import SEARCH_TOOL_PARAMS, tool_for_params
+
+_DIGITS = {
+    "영": 0,
+    "공": 0,
+    "일": 1,
+    "이": 2,
+    "삼": 3,
+    "사": 4,
+    "오": 5,
+    "육": 6,
+    "칠": 7,
+    "팔": 8,
+    "구": 9
+}
+_SMALL_UNITS = {"십": 10, "백": 100, "천": 1_000}
+_BIG_UNITS = {"억": 100_000_000, "만": 10_000}
+
+# 기간 앞에 오는 고유어 수사
+_NATIVE = {
+    "한": 1,
+    "두": 2,
+    "세": 3,
+    "네": 4,
+    "다섯": 5,
+    "여섯": 6,
+    "일곱": 7,
+    "여덟": 8,
+    "아홉": 9,
+    "열": 10,
+    "열한": 11,
+    "열두": 12
+}
+
+# 만/억 앞에 오는 수: 30, 2.5, 5천, 삼십, 천
+_VALUE = r"(?:\d[\d,]*(?:\.\d+)?\s*[십백천]?|[일이삼사오육칠팔구십백천]+)"
+
+_AMOUNT = re.compile(r"(?<![가-힣\d.,])"
+                     rf"(?P<expr>{_VALUE}\s*억(?:\s*{_VALUE}\s*만)?"
+                     rf"|{_VALUE}\s*만"
+                     r"|\d[\d,]*(?=\s*원))"
+                     r"(?P<won>\s*원)?")
+
+_TERM = re.compile(r"(?<![가-힣\d.])"
+                   r"(?P<num>\d+(?:\.\d+)?|열한|열두|다섯|여섯|일곱|여덟|아홉|[한두세네열]"
+                   r"|[일이삼사오육칠팔구십]+)"
+                   r"\s*(?P<unit>개월|달|년|해|주일?)(?P<half>\s*반)?")
+
+# 1년 6개월 과 같이 이어진 기간은 합산
+_COMPOUND_TERM = re.compile(r"(?<![\d.])(\d+)\s*년\s*(\d+)\s*개월")
+
+_HALF_YEAR = re.compile(r"(?<![가-힣])반\s*년")
+
+# 기간이 아니라 납입 주기를 뜻하는 표현 (한 달에, 일주일마다)
+_PERIOD_SUFFIX = re.compile(r"^\s*(?:에|마다|씩)")
+
+_MONTHLY_BEFORE = re.compile(r"(?:매달|매월|달마다|(?<!개)월마다|다달이|한\s*달에|(?<![가-힣])월)\s*$")
+_MONTHLY_AFTER = re.compile(r"^\s*씩")
+# 월이 아닌 납입 주기 (매주, 매일, 일주일에, 분기마다, 1년에, 2주마다, 3개월마다)
+_OTHER_PERIOD = (r"(?:매주|매일|매년|매분기|날마다|하루\s*(?:에|마다)|주마다|격주|연간"
+                 r"|(?:(?<!\d)\d+|일|한|두|세)\s*주일?\s*(?:에|마다)"
+                 r"|(?:분기|반기)\s*(?:에|마다|별)"
+                 r"|(?:(?<!\d)\d{1,2}|한|두|세)\s*(?:년|해)\s*(?:에|마다)"
+                 r"|(?:(?<!\d)(?:[2-9]|\d{2,})|두|세|여섯)\s*(?:개월|달)\s*마다)")
+_OTHER_PERIOD_BEFORE = re.compile(_OTHER_PERIOD + r"[^만억원.?!,]{0,8}$")
+# 5만원씩 매주 와 같이 뒤에 오는 주기는 기간과 헷갈리지 않는 표현만 본다
+_OTHER_PERIOD_AFTER = re.compile(r"^\s*씩?\s*(?:매주|매일|매년|매분기|날마다|격주|(?:분기|반기)\s*마다)")
+_TARGET_BEFORE = re.compile(r"(?:목표(?:는|로|액)?|총|안에|내에|이내에?|까지|만에|뒤에|후에)\s*$")
+# 다른 금액을 건너뛰지 않는 범위에서 뒤따르는 목표 동사 (500만원을 1년 안에 모으고)
+_TARGET_AFTER = re.compile(r"^[^만억원.?!,]{0,12}?(?:모으|모을|모아|모이|만들|마련|목표|채우|달성)")
+# 소득, 잔액 등 검색 파라미터가 아닌 금액
+_IGNORED_BEFORE = re.compile(r"(?:월급|급여|연봉|소득|수입|월세|잔액|예금|대출)\D{0,4}$")
+# 범위를 뜻하는 금액은 정확한 값이 아니므로 사용하지 않는다
+_BOUND_AFTER = re.compile(r"^\s*(?:이하|이상|미만|초과|넘게|안쪽)")
+
+# 값 범위 (원, 개월)
+_AMOUNT_RANGE = (1_000, 10_000_000_000)
+_TERM_RANGE = (1, 120)
+
+
+def _small_number(text: str) -> Optional[float]:
+    """만 단위 미만의 수. `30`, `2.5`, `5천`, `삼십`, `천오백`"""
+
+    value, found = 0.0, False
+    for m in re.finditer(r"(\d+(?:\.\d+)?|[영공일이삼사오육칠팔구])?([십백천])?", text):
+        number, unit = m.groups()
+        if not number and not unit:
+            continue
+
+        if number is None:
+            n = 1.0
+        elif number in _DIGITS:
+            n = float(_DIGITS[number])
+        else:
+            n = float(number)
+
+        value += n * (_SMALL_UNITS[unit] if unit else 1)
+        found = True
+
+    return value if found else None
+
+
+def parse_korean_number(text: str) -> Optional[int]:
+    """한국어 수 표현을 정수로 변환한다. `1억 2천만`, `천만`, `30만`, `300,000`, `삼십만`"""
+
+    text = re.sub(r"[\s,원]", "", text)
+    if not text:
+        return None
+
+    total = 0.0
+    for m in re.finditer(r"([^억만]*)([억만]|$)", text):
+        part, unit = m.groups()
+        if not part and not unit:
+            continue
+
+        value = _small_number(part) if part else 1.0
+        if value is None:
+            return None
+        total += value * _BIG_UNITS.get(unit, 1)
+
+    return round(total)
+
+
+def _term_months(num: str, unit: str, half: bool) -> Optional[int]:
+    if num in _NATIVE:
+        n: Optional[float] = _NATIVE[num]
+    elif num[0].isdigit():
+        n = float(num)
+    else:
+        n = _small_number(num)
+
+    if n is None:
+        return None
+
+    if unit in ("년", "해"):
+        if n >= 100:  # 2025년 과 같은 연도
+            return None
+        return round(n * 12 + (6 if half else 0))
+    if unit.startswith("주"):
+        return max(round(n / 4.345), 1)
+    return round(n + (0.5 if half else 0))
+
+
+@dataclass
+class ParsedParams:
+    """사용자 발화에서 확실하게 찾은 검색 파라미터.
+
+    Attributes:
+        params (Dict[str, int]): monthly_deposit / target_amount / total_term_months
+        ambiguous (List[str]): 찾았지만 값이 여러 개이거나 역할이 불분명해 제외한 파라미터
+    """
+
+    params: Dict[str, int]
+    ambiguous: List[str]
+
+    @property
+    def tool_name(self) -> Optional[str]:
+        """애매한 파라미터 없이 정확히 두 파라미터를 찾았을 때 그 조합을 받는 검색 도구"""
+
+        if self.ambiguous or len(self.params) != 2:
+            return None
+        return tool_for_params(self.params)
+
+
+def _amounts(text: str) -> Tuple[List[Tuple[str, int]], List[int], bool, bool]:
+    """(역할이 확실한 금액, 역할을 모르는 금액, 범위 금액 존재 여부, 월이 아닌 주기 납입액 존재 여부)"""
+
+    labeled: List[Tuple[str, int]] = []
+    unlabeled: List[int] = []
+    bounded = periodic = False
+
+    for m in _AMOUNT.finditer(text):
+        expr = m.group("expr")
+        if not m.group("won") and not re.search(r"[만억]", expr):
+            continue
+
+        before, after = text[max(m.start() - 12, 0):m.start()], text[m.end():]
+        if _IGNORED_BEFORE.search(before):
+            continue
+
+        value = parse_korean_number(expr)
+        if value is None or not _AMOUNT_RANGE[0] <= value <= _AMOUNT_RANGE[1]:
+            continue
+
+        if _BOUND_AFTER.search(after):
+            bounded = True
+            continue
+
+        # 바로 앞의 월 표현(매달, 월)이 없으면 매주·분기마다 등의 주기를 확인한다
+        other_period = (_OTHER_PERIOD_BEFORE.search(before) or
+                        _OTHER_PERIOD_AFTER.search(after))
+        if other_period and not _MONTHLY_BEFORE.search(before):
+            periodic = True
+            continue
+
+        if _MONTHLY_AFTER.search(after) or _MONTHLY_BEFORE.search(before):
+            labeled.append(("monthly_deposit", value))
+        elif _TARGET_AFTER.search(after) or _TARGET_BEFORE.search(before):
+            labeled.append(("target_amount", value))
+        else:
+            unlabeled.append(value)
+
+    return labeled, unlabeled, bounded, periodic
+
+
+def _terms(text: str) -> List[int]:
+    terms = []
+    for m in _COMPOUND_TERM.finditer(text):
+        terms.append(int(m.group(1)) * 12 + int(m.group(2)))
+    text = _COMPOUND_TERM.sub(lambda m: " " * len(m.group(0)), text)
+
+    for m in _TERM.finditer(text):
+        unit = m.group("unit")
+        if unit in ("달", "주", "주일") and _PERIOD_SUFFIX.search(text[m.end():]):
+            continue
+        if unit in ("년", "해", "개월") and re.match(r"\s*마다", text[m.end():]):
+            continue
+
+        months = _term_months(m.group("num"), unit, bool(m.group("half")))
+        if months is not None and _TERM_RANGE[0] <= months <= _TERM_RANGE[1]:
+            terms.append(months)
+
+    terms += [6 for _ in _HALF_YEAR.finditer(text)]
+    return terms
+
+
+def parse_search_params(text: str) -> ParsedParams:
+    """월 납입액, 목표 금액, 가입 기간을 규칙으로 찾는다.
+
+    `매달 30만원씩 1년 동안` → {monthly_deposit: 300000, total_term_months: 12}
+    `2년 안에 천만원` → {target_amount: 10000000, total_term_months: 24}
+
+    역할 표현(매달, 씩, 모으다, ~안에 등)이 있는 금액만 사용하며, 같은 파라미터에 서로 다른
+    값이 나오거나 범위 표현(이하, 이상)이 섞인 경우 해당 파라미터는 `ambiguous` 로 돌린다.
+    매주, 분기마다 등 월이 아닌 주기로 내는 금액이 있으면 월 납입액은 `ambiguous` 이다.
+    """
+
+    params: Dict[str, int] = {}
+    ambiguous: List[str] = []
+
+    labeled, unlabeled, bounded, periodic = _amounts(text)
+
+    # 월 납입액이 확실하면 역할 표현이 없는 나머지 금액 하나는 목표 금액
+    if len(unlabeled) == 1 and any(k == "monthly_deposit" for k, _ in labeled):
+        labeled.append(("target_amount", unlabeled.pop()))
+
+    candidates: Dict[str, set] = {}
+    for key, value in labeled:
+        candidates.setdefault(key, set()).add(value)
+    candidates["total_term_months"] = set(_terms(text))
+
+    for key, values in candidates.items():
+        if len(values) == 1:
+            params[key] = values.pop()
+        elif values:
+            ambiguous.append(key)
+
+    if unlabeled or bounded:
+        ambiguous += [
+            k for k in ("monthly_deposit", "target_amount") if k not in params
+        ]
+
+    # 매주 5만원씩 처럼 월이 아닌 주기의 납입액은 월 납입액으로 환산하지 않는다
+    if periodic:
+        params.pop("monthly_deposit", None)
+        if "monthly_deposit" not in ambiguous:
+            ambiguous.append("monthly_deposit")
+
+    monthly, target = params.get("monthly_deposit"), params.get("target_amount")
+    if monthly and target and monthly > target:
+        del params["monthly_deposit"], params["target_amount"]
+        ambiguous += ["monthly_deposit", "target_amount"]
+
+    return ParsedParams(params, ambiguous)
+
+
+def reconcile_tool_args(name: str, args: dict, parsed: ParsedParams) -> dict:
+    """LLM 이 만든 도구 인자 중 빠진 값을 파서 결과로 채운다.
+
+    LLM 이 넣은 값은 덮어쓰지 않으며, 파서와 다르면 기록만 남긴다.
+    """
+
+    fixed = dict(args)
+    for key in SEARCH_TOOL_PARAMS.get(name, frozenset()):
+        value = parsed.params.get(key)
+        if value is None or fixed.get(key) == value:
+            continue
+
+        if fixed.get(key) is None:
+            fixed[key] = value
+        else:
+            print(f"도구 인자가 파서 결과와 다릅니다: {key} {fixed[key]} (파서 {value})")
+
+    return fixed
+
+
+# (발화, 기대 params, 기대 ambiguous). `python -m domains.saving.agents.param_parser` 로 확인
+_CASES: List[Tuple[str, Dict[str, int], List[str]]] = [
+    ("매달 30만원씩 1년 동안", {
+        "monthly_deposit": 300_000,
+        "total_term_months": 12
+    }, []),
+    ("2년 안에 천만원", {
+        "target_amount": 10_000_000,
+        "total_term_months": 24
+    }, []),
+    ("1000만원 모으려면 매달 50만원씩 넣는 적금 있어?", {
+        "monthly_deposit": 500_000,
+        "target_amount": 10_000_000
+    }, []),
+    ("내년 워킹홀리데이 경비 500만원을 1년 안에 모으고 싶어", {
+        "target_amount": 5_000_000,
+        "total_term_months": 12
+    }, []),
+    ("1년 6개월 동안 매달 10만원", {
+        "monthly_deposit": 100_000,
+        "total_term_months": 18
+    }, []),
+    ("10만원씩 열두 달", {
+        "monthly_deposit": 100_000,
+        "total_term_months": 12
+    }, []),
+    ("매달 30만원 이하로 1년", {
+        "total_term_months": 12
+    }, ["monthly_deposit", "target_amount"]),
+    # 월이 아닌 주기의 납입액
+    ("매주 5만원씩 1년", {
+        "total_term_months": 12
+    }, ["monthly_deposit"]),
+    ("매일 1만원씩 1년", {
+        "total_term_months": 12
+    }, ["monthly_deposit"]),
+    ("일주일에 10만원씩 2년 모으기", {
+        "total_term_months": 24
+    }, ["monthly_deposit"]),
+    ("분기마다 100만원씩 2년", {
+        "total_term_months": 24
+    }, ["monthly_deposit"]),
+    # 1년에 는 기간일 수도 있어 기간도 애매하다
+    ("1년에 100만원씩 3년", {}, ["monthly_deposit", "total_term_months"]),
+    ("2주마다 20만원씩 1년", {
+        "total_term_months": 12
+    }, ["monthly_deposit"]),
+    ("3개월마다 50만원씩 2년", {
+        "total_term_months": 24
+    }, ["monthly_deposit"]),
+    ("5만원씩 매주 넣어서 1년", {
+        "total_term_months": 12
+    }, ["monthly_deposit"]),
+    ("30만원씩 1년에 걸쳐", {
+        "monthly_deposit": 300_000,
+        "total_term_months": 12
+    }, []),
+    ("2025년에 500만원 모으기 매달 40만원씩", {
+        "monthly_deposit": 400_000,
+        "target_amount": 5_000_000
+    }, []),
+    ("매주 5만원씩 모아서 2년 안에 500만원", {
+        "target_amount": 5_000_000,
+        "total_term_months": 24
+    }, ["monthly_deposit"]),
+]
+
+if __name__ == "__main__":
+    failed = 0
+    for text, params, ambiguous in _CASES:
+        parsed = parse_search_params(text)
+        if parsed.params != params or sorted(parsed.ambiguous) != sorted(ambiguous):
+            failed += 1
+            print(f"불일치: {text} → {parsed.params} {parsed.ambiguous} "
+                  f"(기대 {params} {ambiguous})")
+
+    print(f"{len(_CASES) - failed}/{len(_CASES)} 통과")
+    raise SystemExit(1 if failed else 0)
@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+from domains.saving.schemas import SavingSearchResult
+
+# 페이지네이션 인자는 키에서 제외
+_PAGING_ARGS = {"top_k", "offset"}
+
+
+class RankedResultCursor:
+    """채팅별 적금 검색 순위를 한 번만 계산해두고 페이지 단위로 잘라 반환한다.
+
+    router 루프가 offset 을 늘려 tool_node 를 다시 호출해도 검색을 반복하지 않는다.
+
+    Attributes:
+        depth (int): 최초 검색 시 미리 계산해 둘 순위 개수
+        ttl_seconds (float): 캐시된 순위의 유효 시간
+        max_sessions (int): 보관할 최대 검색 세션 수 (LRU)
+    """
+
+    def __init__(self,
+                 *,
+                 depth: int = 50,
+                 ttl_seconds: float = 600,
+                 max_sessions: int = 256):
+        self.depth = depth
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+
+        self._rankings: OrderedDict[Hashable, Tuple[float, List[SavingSearchResult]]] = \
+            OrderedDict()
+
+    @staticmethod
+    def make_key(chat_id: str, tool_name: str, args: Dict[str, Any]) -> Hashable:
+        params = tuple(
+            sorted((k, tuple(v) if isinstance(v, list) else v)
+                   for k, v in args.items()
+                   if k not in _PAGING_ARGS))
+        return (chat_id, tool_name, params)
+
+    def _get(self, key: Hashable):
+        entry = self._rankings.get(key)
+        if entry is None:
+            return None
+
+        created_at, ranking = entry
+        if time.monotonic() - created_at > self.ttl_seconds:
+            del self._rankings[key]
+            return None
+
+        self._rankings.move_to_end(key)
+        return ranking
+
+    def _put(self, key: Hashable, ranking: List[SavingSearchResult]):
+        self._rankings[key] = (time.monotonic(), ranking)
+        self._rankings.move_to_end(key)
+
+        while len(self._rankings) > self.max_sessions:
+            self._rankings.popitem(last=False)
+
+    async def page(
+        self,
+        key: Hashable,
+        search: Callable[[int, int], Awaitable[List[SavingSearchResult]]],
+        *,
+        offset: int,
+        size: int,
+    ) -> List[SavingSearchResult]:
+        """`offset` 부터 `size` 개의 검색 결과를 반환한다.
+
+        Args:
+            key: `make_key` 로 생성한 검색 세션 키
+            search: (top_k, offset) 을 받아 검색을 수행하는 함수
+        """
+
+        ranking = self._get(key)
+        if ranking is None:
+            ranking = await search(self.depth, 0)
+            self._put(key, ranking)
+
+        # 미리 계산한 범위를 넘어서는 페이지는 직접 검색
+        if offset + size > len(ranking) and len(ranking) >= self.depth:
+            return await search(size, offset)
+
+        return ranking[offset:offset + size]
+
+    def clear(self, chat_id: str):
+        for key in [k for k in self._rankings if k[0] == chat_id]:  # type: ignore
+            del self._rankings[key]
@@ -1,8 +1,9 @@
 from langgraph.graph import END
 from domains.common.agents.graph_state import GraphState
+from domains.saving.agents.fetch_planner import AdaptiveFetchPlanner
 
 
-def init_router_node():
+def init_router_node(planner: AdaptiveFetchPlanner | None = None):
 
     async def node(state: GraphState):
         print("============ Saving Router Node ============")
@@ -12,10 +13,15 @@ def init_router_node():
         if selected and len(selected) >= state["target_count"]:
             print(len(selected))
             return {"next": END}
-        else:
-            return {
-                "next": "tool_node",
-                "offset": state["offset"] + 5,
-            }
+
+        # 더 가져올 후보가 없거나 요청당 상한에 도달하면 종료
+        if not state.get("candidates") or (planner is not None and
+                                           planner.exhausted(state)):
+            return {"next": END}
+
+        return {
+            "next": "tool_node",
+            "offset": state["offset"] + (state.get("page_size") or 5),
+        }
 
     return node
@@ -1,29 +1,58 @@
-from typing import List
+from typing import List, Optional
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
+from langchain_openai.chat_models.base import ChatOpenAI
 from langgraph.graph import StateGraph
+from motor.motor_asyncio import AsyncIOMotorCollection
 
+from common.metrics import instrument_node
+from domains.common.agents.context_compressor import ContextCompressor
 from domains.common.agents.graph_state import GraphState
 
 from domains.saving.agents.router_node import init_router_node
+from domains.saving.agents.fetch_planner import AdaptiveFetchPlanner
 from domains.saving.agents.filter_node import init_filter_node
 from domains.saving.agents.tool_node import init_saving_tool_node
+from domains.saving.config import SavingSearchConfig
 
 
 def init_saving_subgraph(
     llm: BaseChatModel,
     saving_tools: List[BaseTool],
+    cfg: SavingSearchConfig = SavingSearchConfig(),
+    collection: Optional[AsyncIOMotorCollection] = None,
+    compressor: Optional[ContextCompressor] = None,
+    fit_llm: Optional[BaseChatModel] = None,
 ):
-    """적금 서브그래프 초기화"""
+    """적금 서브그래프 초기화.
+
+    `fit_llm` 은 상품 적합성 평가 모델로, 없으면 기존 평가 모델(gpt-4o)을 사용한다.
+    """
 
     sg = StateGraph(GraphState)
 
-    sg.add_node("tool_node", init_saving_tool_node(llm, saving_tools))
+    planner = AdaptiveFetchPlanner(max_rounds=cfg.fetch_max_rounds,
+                                   max_candidates=cfg.fetch_max_candidates)
+
+    sg.add_node(
+        "tool_node",
+        instrument_node(
+            "tool_node",
+            init_saving_tool_node(llm,
+                                  saving_tools,
+                                  planner=planner,
+                                  select_mode=cfg.tool_select)))
     #sg.add_node("tool_execution_node", init_saving_tool_execution_node(saving_tools))
     #sg.add_edge("tool_selection_node", "tool_execution_node")
 
-    sg.add_node("filter_node", init_filter_node(llm))
-    sg.add_node("router_node", init_router_node())
+    sg.add_node(
+        "filter_node",
+        instrument_node(
+            "filter_node",
+            init_filter_node(fit_llm or ChatOpenAI(model="gpt-4o"), cfg, collection,
+                             planner, compressor)))
+    sg.add_node("router_node", instrument_node("router_node",
+                                               init_router_node(planner)))
 
     sg.add_edge("tool_node", "filter_node")
 
@@ -1,11 +1,34 @@
-from typing import Optional, List
+from itertools import chain, zip_longest
+from typing import Dict, FrozenSet, Iterable, List, Optional
 from motor.motor_asyncio import AsyncIOMotorCollection
 
 from langchain_core.tools import tool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
-from domains.saving.repositories.retrieval import find_savings
-from domains.saving.schemas import SavingRateWeights, SavingSearchResult
+from common.cache import create_cache
+from domains.saving.repositories.retrieval import find_savings, find_savings_batch
+from domains.saving.schemas import (SavingRateWeights, SavingSearchResult,
+                                    SavingSearchScenario)
+from domains.saving.config import SavingSearchConfig
+
+# 검색 도구별로 사용자 발화에서 채워야 하는 파라미터 (페이지네이션 인자 제외)
+SEARCH_TOOL_PARAMS: Dict[str, FrozenSet[str]] = {
+    "find_savings_by_target_and_term":
+        frozenset({"target_amount", "total_term_months"}),
+    "find_savings_by_monthly_and_term":
+        frozenset({"monthly_deposit", "total_term_months"}),
+    "find_savings_by_target_and_monthly":
+        frozenset({"target_amount", "monthly_deposit"}),
+}
+
+
+def tool_for_params(params: Iterable[str]) -> Optional[str]:
+    """주어진 파라미터 조합을 정확히 받는 검색 도구 이름. 없으면 None."""
+
+    keys = frozenset(params)
+    return next(
+        (name for name, required in SEARCH_TOOL_PARAMS.items() if required == keys),
+        None)
 
 
 class TargetTermParams(BaseModel):
@@ -32,10 +55,36 @@ class TargetMonthlyParams(BaseModel):
     monthly_deposit: Optional[int] = Field(None, description="사용자가 매월 납입할 금액 (선택 사항)")
 
 
-def init_saving_retrieval_tools(collection: AsyncIOMotorCollection):
+class TermCompareParams(BaseModel):
+
+    top_k: int = Field(5, description="한 번에 가져올 최대 개수")
+    offset: int = Field(0, description="limit 단위로 증가하며 페이지네이션에 사용")
+    total_term_months_options: List[int] = Field(...,
+                                                 min_length=2,
+                                                 max_length=6,
+                                                 description="비교할 가입 기간(개월 수) 목록")
+    monthly_deposit: Optional[int] = Field(None, description="사용자가 매월 납입할 금액")
+    target_amount: Optional[int] = Field(None, description="달성하고자 하는 목표 금액")
+
+    @model_validator(mode="after")
+    def _check_amount(self):
+        if (self.monthly_deposit is None) == (self.target_amount is None):
+            raise ValueError("월 납입액과 목표 금액 중 하나만 지정해야 합니다.")
+
+        return self
+
+
+def init_saving_retrieval_tools(collection: AsyncIOMotorCollection,
+                                cfg: SavingSearchConfig = SavingSearchConfig()):
     """적금 검색 Tool 초기화 함수"""
 
     default_weights = SavingRateWeights(base=0.3, max=0.3, intermediate=0.4)
+    cache = create_cache(cfg.cache_backend,
+                         prefix="saving_search",
+                         max_size=cfg.cache_size,
+                         ttl_seconds=cfg.cache_ttl_seconds,
+                         redis_url=cfg.redis_url,
+                         sqlite_path=cfg.sqlite_path)
 
     @tool("find_savings_by_target_and_term",
           args_schema=TargetTermParams,
@@ -49,6 +98,9 @@ def init_saving_retrieval_tools(collection: AsyncIOMotorCollection):
 
         results = await find_savings(collection=collection,
                                      weights=default_weights,
+                                     engine=cfg.engine,
+                                     ranking=cfg.ranking,
+                                     cache=cache,
                                      **kwargs)
 
         return results
@@ -65,6 +117,9 @@ def init_saving_retrieval_tools(collection: AsyncIOMotorCollection):
 
         results = await find_savings(collection=collection,
                                      weights=default_weights,
+                                     engine=cfg.engine,
+                                     ranking=cfg.ranking,
+                                     cache=cache,
                                      **kwargs)
 
         return results
@@ -81,11 +136,51 @@ def init_saving_retrieval_tools(collection: AsyncIOMotorCollection):
 
         results = await find_savings(collection=collection,
                                      weights=default_weights,
+                                     engine=cfg.engine,
+                                     ranking=cfg.ranking,
+                                     cache=cache,
                                      **kwargs)
         return results
 
+    @tool("compare_savings_by_terms", args_schema=TermCompareParams, return_direct=True)
+    async def compare_savings_by_terms(**kwargs) -> List[SavingSearchResult]:
+        """
+        월 납입액 또는 목표 금액 하나와 여러 가입 기간(예: 6, 12, 24개월)을 입력받아
+        기간별로 적금 상품을 한 번에 검색한다. "6개월이면? 1년이면?" 처럼 가입 기간을
+        비교하는 요청에 사용한다. 결과는 기간별 순위를 번갈아 합친 목록이며,
+        각 결과에 계산에 사용한 가입 기간이 표시된다.
+        """
+        print("compare_savings_by_terms")
+
+        params = TermCompareParams(**kwargs)
+        terms = list(dict.fromkeys(params.total_term_months_options))
+
+        # 합친 목록의 offset 은 기간별 순위와 맞지 않으므로 처음부터 가져와 자른다
+        scenarios = [
+            SavingSearchScenario(weights=default_weights,
+                                 monthly_deposit=params.monthly_deposit,
+                                 target_amount=params.target_amount,
+                                 total_term_months=term,
+                                 top_k=params.offset + params.top_k) for term in terms
+        ]
+        batches = await find_savings_batch(collection,
+                                           scenarios,
+                                           engine=cfg.engine,
+                                           ranking=cfg.ranking,
+                                           cache=cache)
+
+        # 기간별 1위, 2위, ... 순으로 번갈아 합친다
+        tagged = []
+        for term, results in zip(terms, batches):
+            tagged.append(
+                [r.model_copy(update={"total_term_months": term}) for r in results])
+        merged = [r for r in chain.from_iterable(zip_longest(*tagged)) if r is not None]
+
+        return merged[params.offset:params.offset + params.top_k]
+
     return [
         find_savings_by_target_and_monthly,
         find_savings_by_monthly_and_term,
         find_savings_by_target_and_term,
+        compare_savings_by_terms,
     ]
@@ -3,30 +3,46 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
 from langgraph.config import get_stream_writer
 
+from common.metrics import count, registry as metrics
 from domains.common.agents.graph_state import GraphState
+from domains.saving.agents.fetch_planner import AdaptiveFetchPlanner
+from domains.saving.agents.param_parser import parse_search_params, reconcile_tool_args
+from domains.saving.agents.result_cursor import RankedResultCursor
+from domains.saving.types import SavingToolSelectMode
+
+metrics.describe("saving_tool_select_total", "검색 도구 선택 경로 (parser | llm)")
 
 system_prompt = """\
 당신은 사용자의 요청과 researcher의 리서치 결과를 바탕으로
 상황에 맞는 적금 상품 검색 tool을 호출하는 에이전트다.
 
-올바른 파라미터와 함께 검색 도구를 호출하여라."""
+올바른 파라미터와 함께 검색 도구를 호출하여라.
+여러 가입 기간을 비교해 달라는 요청은 compare_savings_by_terms 를 한 번만 호출하여라."""
+
 
+def init_saving_tool_node(llm: BaseChatModel,
+                          tools: List[BaseTool],
+                          cursor: RankedResultCursor | None = None,
+                          planner: AdaptiveFetchPlanner | None = None,
+                          select_mode: SavingToolSelectMode = "parser"):
+    """적금 검색 tool 노드 초기화
 
-def init_saving_tool_node(llm: BaseChatModel, tools: List[BaseTool]):
+    `select_mode` 가 parser 면 마지막 사용자 메시지에서 금액·기간 중 두 개를 확실히 찾은 경우
+    LLM 호출 없이 해당 조합의 도구를 선택한다. 그 외에는 LLM 이 선택하고, 파서가 찾은 값으로
+    인자를 채우거나 교정한다.
+    """
 
     agent_with_tools = llm.bind_tools(tools)
     tool_map: Dict[str, BaseTool] = {t.name: t for t in tools}
+    cursor = cursor or RankedResultCursor()
 
-    async def node(state: GraphState):
-        writer = get_stream_writer()
-
-        writer({
-            "chat_id": state["chat_id"],
-            "status": "pending",
-            "content": {
-                "message": "상품을 검색하고 있습니다."
-            }
-        })
+    async def select_tool(state: GraphState) -> dict:
+        parsed = None
+        if select_mode == "parser":
+            parsed = parse_search_params(str(state["messages"][-1].content))
+            if parsed.tool_name in tool_map:
+                count("saving_tool_select_total", source="parser")
+                return {"name": parsed.tool_name, "args": dict(parsed.params)}
 
         research_context = ""
         if state.get("documents"):
@@ -40,17 +56,53 @@ def init_saving_tool_node(llm: BaseChatModel, tools: List[BaseTool]):
 
         res = await agent_with_tools.ainvoke(messages)
         tool_call = res.tool_calls[0]  # type: ignore
-        tool = tool_map.get(tool_call.get("name"))
-        tool_args = {**tool_call.get("args", {}), "offset": state["offset"]}
+        name, args = tool_call.get("name"), tool_call.get("args", {})
+        if parsed is not None:
+            args = reconcile_tool_args(name, args, parsed)
+
+        count("saving_tool_select_total", source="llm")
+        return {"name": name, "args": args}
+
+    async def node(state: GraphState):
+        writer = get_stream_writer()
+
+        writer({
+            "chat_id": state["chat_id"],
+            "status": "pending",
+            "content": {
+                "message": "상품을 검색하고 있습니다."
+            }
+        })
+
+        # router 루프로 재진입한 경우 앞서 선택한 tool 을 재사용
+        search_call = state.get("search_call") or await select_tool(state)
+        tool = tool_map.get(search_call["name"])
 
         if not tool:
             raise ValueError
 
-        search_result = await tool.ainvoke(tool_args)
+        tool_args = search_call["args"]
+        key = cursor.make_key(state["chat_id"], tool.name, tool_args)
+
+        async def search(top_k: int, offset: int):
+            return await tool.ainvoke({**tool_args, "top_k": top_k, "offset": offset})
+
+        # 질의 형태별 통과율에 맞춰 필요한 만큼 한 번에 가져온다
+        size = tool_args.get("top_k", 5)
+        if planner is not None:
+            size = planner.page_size(state, planner.shape(search_call))
+
+        search_result = await cursor.page(key,
+                                          search,
+                                          offset=state["offset"],
+                                          size=size)
         #state["messages"].append(res)
 
         return {
             "candidates": search_result,
+            "search_call": search_call,
+            "page_size": size,
+            "search_rounds": (state.get("search_rounds") or 0) + 1,
             "next": "filter_node",
         }
 
@@ -0,0 +1,99 @@
+import hashlib
+import re
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from common.cache import AsyncCache
+from common.metrics import count
+from domains.common.agents.graph_state import GraphState, ProductSearchResult
+from domains.saving.repositories.version import get_catalog_version
+
+# (카탈로그 버전, 메모리 해시, 질문 지문)
+VerdictContext = Tuple[int, str, str]
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+def question_fingerprint(question: str) -> str:
+    """공백, 문장부호, 대소문자, 전각/반각 차이를 무시한 질문 지문"""
+
+    normalized = unicodedata.normalize("NFKC", question).lower()
+    normalized = re.sub(r"[^\w\s]", " ", normalized)
+    return _digest(" ".join(normalized.split()))
+
+
+def memories_hash(memories: Sequence[str]) -> str:
+    """순서와 중복을 무시한 사용자 메모리 해시"""
+
+    return _digest("\n".join(sorted({m.strip() for m in memories})))
+
+
+class ProductFitCache:
+    """상품 적합성 판정(`_evaluate_product_fit`) 결과 캐시.
+
+    판정은 (상품 id, 카탈로그 버전, 사용자 메모리 해시, 질문 지문) 으로 구분된다.
+    상품 정보나 사용자 메모리가 바뀌면 키가 달라져 자연스럽게 다시 평가된다.
+
+    Attributes:
+        cache (AsyncCache): 판정을 저장할 캐시 백엔드
+        collection (AsyncIOMotorCollection | None): 카탈로그 버전을 조회할 상품 컬렉션
+        llm_calls_avoided (int): 캐시가 없었다면 필요했을 LLM 호출 중 생략된 수
+    """
+
+    def __init__(self,
+                 cache: AsyncCache,
+                 collection: Optional[AsyncIOMotorCollection] = None):
+        self.cache = cache
+        self.collection = collection
+        self.llm_calls_avoided = 0
+
+    async def context(self, state: GraphState) -> VerdictContext:
+        version = 0
+        if self.collection is not None:
+            version = await get_catalog_version(self.collection)
+
+        return (
+            version,
+            memories_hash([m.content for m in state["user_memories"]]),
+            question_fingerprint(str(state["messages"][-1].content)),
+        )
+
+    @staticmethod
+    def _key(context: VerdictContext, product: ProductSearchResult):
+        return ("saving_fit", product.product.id, *context)
+
+    async def get_many(self, context: VerdictContext,
+                       products: Sequence[ProductSearchResult]) -> Dict[int, bool]:
+        """캐시된 판정을 `products` 의 위치별로 반환한다. 없는 상품은 제외된다."""
+
+        verdicts: Dict[int, bool] = {}
+        for i, product in enumerate(products):
+            verdict = await self.cache.get(self._key(context, product))
+            if verdict is not None:
+                verdicts[i] = verdict
+
+        count("cache_requests_total", len(verdicts), cache="saving_fit", result="hit")
+        count("cache_requests_total",
+              len(products) - len(verdicts),
+              cache="saving_fit",
+              result="miss")
+
+        return verdicts
+
+    async def set_many(self, context: VerdictContext,
+                       products: Sequence[ProductSearchResult], verdicts: List[bool]):
+        for product, verdict in zip(products, verdicts):
+            await self.cache.set(self._key(context, product), verdict)
+
+    def record_avoided(self, calls: int):
+        self.llm_calls_avoided += calls
+
+    @property
+    def stats(self) -> dict:
+        return {
+            **self.cache.stats.to_dict(), "llm_calls_avoided": self.llm_calls_avoided
+        }
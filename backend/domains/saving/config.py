@@ -0,0 +1,53 @@
+import os
+from dataclasses import dataclass, field
+
+from common.cache import CacheBackendType
+from domains.saving.types import (SavingFilterMode, SavingRankingMode,
+                                  SavingSearchEngine, SavingToolSelectMode)
+
+
+@dataclass(frozen=True)
+class SavingSearchConfig:
+
+    engine: SavingSearchEngine = field(default_factory=lambda: os.getenv(
+        "SAVING_SEARCH_ENGINE", "aggregation").lower())  # type: ignore
+    ranking: SavingRankingMode = field(default_factory=lambda: os.getenv(
+        "SAVING_RANKING_MODE", "facet").lower())  # type: ignore
+
+    # 검색 결과 캐시 (none | memory | sqlite | redis)
+    cache_backend: CacheBackendType = field(default_factory=lambda: os.getenv(
+        "SAVING_CACHE_BACKEND", "none").lower())  # type: ignore
+    cache_size: int = field(
+        default_factory=lambda: int(os.getenv("SAVING_CACHE_SIZE", 1024)))
+    cache_ttl_seconds: float = field(
+        default_factory=lambda: float(os.getenv("SAVING_CACHE_TTL_SECONDS", 300)))
+    redis_url: str = field(
+        default_factory=lambda: os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+    sqlite_path: str = field(
+        default_factory=lambda: os.getenv("CACHE_SQLITE_PATH", "cache.sqlite3"))
+
+    # 검색 도구 선택 (parser | llm)
+    tool_select: SavingToolSelectMode = field(default_factory=lambda: os.getenv(
+        "SAVING_TOOL_SELECT", "parser").lower())  # type: ignore
+
+    # 상품 적합성 평가 (batch | single)
+    filter_mode: SavingFilterMode = field(default_factory=lambda: os.getenv(
+        "SAVING_FILTER_MODE", "batch").lower())  # type: ignore
+    filter_batch_size: int = field(
+        default_factory=lambda: int(os.getenv("SAVING_FILTER_BATCH_SIZE", 10)))
+    filter_concurrency: int = field(
+        default_factory=lambda: int(os.getenv("SAVING_FILTER_CONCURRENCY", 4)))
+
+    # router 루프 상한 (요청당 검색 횟수, 평가 후보 수)
+    fetch_max_rounds: int = field(
+        default_factory=lambda: int(os.getenv("SAVING_FETCH_MAX_ROUNDS", 3)))
+    fetch_max_candidates: int = field(
+        default_factory=lambda: int(os.getenv("SAVING_FETCH_MAX_CANDIDATES", 30)))
+
+    # 상품 적합성 판정 캐시 (none | memory | sqlite | redis)
+    verdict_cache_backend: CacheBackendType = field(default_factory=lambda: os.getenv(
+        "SAVING_VERDICT_CACHE_BACKEND", "memory").lower())  # type: ignore
+    verdict_cache_size: int = field(
+        default_factory=lambda: int(os.getenv("SAVING_VERDICT_CACHE_SIZE", 4096)))
+    verdict_cache_ttl_seconds: float = field(default_factory=lambda: float(
+        os.getenv("SAVING_VERDICT_CACHE_TTL_SECONDS", 86400)))
@@ -10,6 +10,9 @@ from .types import (SavingInterestType, SavingEarnMethod, SavingPreferentialRate
 
 import uuid
 
+# 기간별 기본 금리 조회 테이블의 최대 기간(개월)
+BASE_RATE_LOOKUP_MAX_TERM = 60
+
 
 class PreferentialRateTier(BaseModel):
     """우대금리 내의 개별 조건과 금리
@@ -148,6 +151,38 @@ class Saving(BaseModel):
 
     max_interest_rate: float
 
+    def base_rate_for_term(self, term_months: int) -> Optional[float]:
+        """가입 기간(개월)에 적용되는 기본 금리. 해당 구간이 없으면 None."""
+
+        if not isinstance(self.base_interest_rate, list):
+            return self.base_interest_rate
+
+        for tier in self.base_interest_rate:
+            if tier.min_term <= term_months and (tier.max_term is None or
+                                                 tier.max_term > term_months):
+                return tier.interest_rate
+
+        return None
+
+    @property
+    def intermediate_interest_rate(self) -> float:
+        """중간 금리 (기본 금리 + user_choice 우대 금리)"""
+
+        base_rate: float
+        if isinstance(self.base_interest_rate, list):
+            base_rate = max((tier.interest_rate for tier in self.base_interest_rate),
+                            default=0.0)
+        else:
+            base_rate = self.base_interest_rate
+
+        user_choice_sum = sum(
+            max(tier.interest_rate
+                for tier in pref.tiers)
+            for pref in self.preferential_rates
+            if pref.rate_type == "user_choice" and pref.tiers)
+
+        return base_rate + user_choice_sum
+
     def format_interest_rates(self):
 
         base_rate: float
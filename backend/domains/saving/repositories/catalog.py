@@ -0,0 +1,371 @@
+import asyncio
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from domains.common.maturity import lump_sum_interest
+from domains.saving.models import Saving
+from domains.saving.schemas import (
+    SavingRateWeights,
+    SavingSearchResult,
+    SavingSearchScenario,
+)
+from domains.saving.repositories.version import get_catalog_version
+from domains.saving.types import SavingRankingMode
+
+# 정책 유형 → 정수 코드
+_TERM_POLICY_CODES = {"RANGE": 0, "FIXED_DURATION": 1, "CHOICES": 2, "FIXED_DATE": 3}
+_AMOUNT_POLICY_CODES = {"RANGE": 0, "CHOICES": 1, "FIXED_AMOUNT": 2}
+
+
+def _value(v: Any, default: float = np.nan) -> float:
+    return default if v is None else float(v)
+
+
+def _padded(rows: List[List[float]]) -> np.ndarray:
+    """가변 길이 행을 NaN으로 채운 2차원 배열로 변환한다."""
+
+    width = max([len(row) for row in rows] + [1])
+    out = np.full((len(rows), width), np.nan, dtype=np.float64)
+    for i, row in enumerate(rows):
+        out[i, :len(row)] = row
+    return out
+
+
+def _resolve_params(
+    *,
+    target_amount: Optional[int],
+    monthly_deposit: Optional[int],
+    total_term_months: Optional[int],
+) -> Tuple[int, int]:
+    """세 파라미터 중 두 개로 (가입 기간, 월 납입액) 을 보간한다."""
+
+    supplied = [
+        total_term_months is not None, monthly_deposit is not None, target_amount
+        is not None
+    ]
+    if supplied.count(True) != 2:
+        raise ValueError("세 파라미터 중 정확히 두 개만 지정해야 합니다.")
+
+    if total_term_months is None:
+        term_months = math.ceil(target_amount / monthly_deposit)  # type: ignore
+        return term_months, monthly_deposit  # type: ignore
+
+    if monthly_deposit is None:
+        monthly_amount = math.ceil(target_amount / total_term_months)  # type: ignore
+        return total_term_months, monthly_amount
+
+    return total_term_months, monthly_deposit
+
+
+def _rank_desc(values: np.ndarray) -> np.ndarray:
+    """`$rank` (내림차순) 과 동일한 순위. 값이 없는(NaN) 문서는 가장 낮은 순위."""
+
+    keys = np.where(np.isnan(values), -np.inf, values)
+    ascending = np.sort(keys)
+    greater = len(keys) - np.searchsorted(ascending, keys, side="right")
+    return greater + 1
+
+
+def _count_rank_desc(values: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """`positions` 위치 값들의 `_rank_desc` 순위를 정렬 없이 개수 세기로 계산한다."""
+
+    keys = np.where(np.isnan(values), -np.inf, values)
+    return (keys[None, :] > keys[positions, None]).sum(axis=1) + 1
+
+
+def _top_order(score_key: np.ndarray, tie_key: np.ndarray, k: int) -> np.ndarray:
+    """(score_key, tie_key) 내림차순 상위 k 개의 위치. 동점은 카탈로그 순서.
+
+    k 번째 점수 이상인 후보만 골라 정렬하므로 전체 정렬이 필요 없다.
+    """
+
+    if k >= score_key.size:
+        return np.lexsort((-tie_key, -score_key))
+
+    kth = -np.partition(-score_key, k - 1)[k - 1]
+    chosen = np.flatnonzero(score_key >= kth)
+    order = chosen[np.lexsort((-tie_key[chosen], -score_key[chosen]))]
+    return order[:k]
+
+
+class SavingCatalog:
+    """`savings` 컬렉션을 열 단위 NumPy 배열로 적재한 인메모리 검색 엔진.
+
+    `build_search_pipeline` 과 동일한 가입 기간/납입 금액 필터, 기간별 기본 금리,
+    min-max 정규화, 가중합 점수와 순위를 벡터 연산으로 계산한다.
+    """
+
+    def __init__(self, docs: List[dict], version: int = 0):
+        self._docs = docs
+        self.size = len(docs)
+        self.version = version
+
+        # 검색 결과에 재사용할 상품 인스턴스 (최초 반환 시 생성)
+        self._products: List[Optional[Saving]] = [None] * len(docs)
+
+        terms = [doc.get("term") or {} for doc in docs]
+        amounts = [doc.get("amount") or {} for doc in docs]
+
+        # --- 가입 기간 정책 -------------------------------------------------
+        self.term_type = np.array(
+            [_TERM_POLICY_CODES.get(t.get("policy_type"), -1) for t in terms],
+            dtype=np.int8)
+        self.term_min = np.array([_value(t.get("min_term"), -np.inf) for t in terms])
+        self.term_max = np.array([_value(t.get("max_term"), np.inf) for t in terms])
+        self.term_choices = _padded([t.get("choices") or [] for t in terms])
+
+        # --- 납입 금액 정책 -------------------------------------------------
+        self.amount_type = np.array(
+            [_AMOUNT_POLICY_CODES.get(a.get("policy_type"), -1) for a in amounts],
+            dtype=np.int8)
+        self.amount_min = np.array(
+            [_value(a.get("min_amount"), -np.inf) for a in amounts])
+        self.amount_max = np.array(
+            [_value(a.get("max_amount"), np.inf) for a in amounts])
+        self.amount_choices = _padded([a.get("choices") or [] for a in amounts])
+        self.amount_fixed = np.array([_value(a.get("fixed_amount")) for a in amounts])
+
+        # --- 기본 금리 (단일 금리 또는 기간 구간별 금리) ---------------------
+        base_rates = [doc.get("base_interest_rate") for doc in docs]
+        self.base_tiered = np.array([isinstance(r, list) for r in base_rates])
+        self.base_scalar = np.array(
+            [np.nan if isinstance(r, list) else _value(r) for r in base_rates])
+
+        tiers = [r if isinstance(r, list) else [] for r in base_rates]
+        self.tier_min = _padded(
+            [[_value(t.get("min_term")) for t in row] for row in tiers])
+        self.tier_max = _padded(
+            [[_value(t.get("max_term"), np.inf) for t in row] for row in tiers])
+        self.tier_rate = _padded(
+            [[_value(t.get("interest_rate")) for t in row] for row in tiers])
+
+        self.max_rate = np.array([_value(doc.get("max_interest_rate")) for doc in docs])
+
+    @classmethod
+    async def load(cls,
+                   collection: AsyncIOMotorCollection,
+                   version: int = 0) -> "SavingCatalog":
+        cursor = collection.find({})
+        docs = await cursor.to_list()
+        return cls(docs, version)
+
+    def product(self, position: int) -> Saving:
+        """카탈로그 `position` 번째 상품. 최초 1회만 검증하고 이후에는 재사용한다."""
+
+        product = self._products[position]
+        if product is None:
+            product = Saving.model_validate(self._docs[position])
+            self._products[position] = product
+
+        return product
+
+    def base_rate_for_term(self, term_months) -> np.ndarray:
+        """가입 기간에 해당하는 기본 금리. 해당 구간이 없으면 NaN.
+
+        `term_months` 가 길이 S 배열이면 (S, N) 배열을 반환한다.
+        """
+
+        terms = np.asarray(term_months, dtype=np.float64)[..., None, None]
+
+        matched = (self.tier_min <= terms) & (self.tier_max > terms)
+        first = matched.argmax(axis=-1)[..., None]
+        tier_rate = np.take_along_axis(np.broadcast_to(self.tier_rate, matched.shape),
+                                       first,
+                                       axis=-1)[..., 0]
+        tier_rate = np.where(matched.any(axis=-1), tier_rate, np.nan)
+
+        return np.where(self.base_tiered, tier_rate, self.base_scalar)
+
+    def eligible(self, term_months, monthly_amount) -> np.ndarray:
+        """가입 기간 및 납입 금액 정책을 만족하는 상품 마스크.
+
+        인자가 길이 S 배열이면 (S, N) 마스크를 반환한다.
+        """
+
+        terms = np.asarray(term_months, dtype=np.float64)[..., None]
+        amounts = np.asarray(monthly_amount, dtype=np.float64)[..., None]
+
+        # RANGE, FIXED_DURATION / CHOICES / FIXED_DATE
+        ranged = (self.term_type == 0) | (self.term_type == 1)
+        term_in_range = ranged & (terms >= self.term_min) & (terms <= self.term_max)
+        term_in_choices = ((self.term_type == 2) &
+                           (self.term_choices == terms[..., None]).any(axis=-1))
+        term_ok = term_in_range | term_in_choices | (self.term_type == 3)
+
+        # RANGE / CHOICES / FIXED_AMOUNT
+        amount_in_range = ((self.amount_type == 0) & (amounts >= self.amount_min) &
+                           (amounts <= self.amount_max))
+        amount_in_choices = ((self.amount_type == 1) &
+                             (self.amount_choices == amounts[..., None]).any(axis=-1))
+        amount_fixed = (self.amount_type == 2) & (self.amount_fixed == amounts)
+        amount_ok = amount_in_range | amount_in_choices | amount_fixed
+
+        return term_ok & amount_ok
+
+    def _rank(
+        self,
+        idx: np.ndarray,
+        base: np.ndarray,
+        *,
+        weights: SavingRateWeights,
+        term_months: int,
+        monthly_amount: int,
+        top_k: int,
+        offset: int,
+        ranking: SavingRankingMode = "facet",
+    ) -> List[SavingSearchResult]:
+        """필터를 통과한 상품(`idx`)의 점수와 순위를 계산해 한 페이지를 반환한다.
+
+        ranking="topk" 이면 상위 offset + top_k 개만 부분 선택하고,
+        반환할 상품의 금리 순위만 개수 세기로 계산한다.
+        """
+
+        if idx.size == 0:
+            return []
+
+        max_rate = self.max_rate[idx]
+
+        # --- 원금·이자 -------------------------------------------------------
+        principal = monthly_amount * term_months
+        interest = lump_sum_interest(principal, base, term_months)
+
+        # --- 금리 정규화·가중합 점수 ----------------------------------------
+        def normalize(values: np.ndarray) -> np.ndarray:
+            present = values[~np.isnan(values)]
+            if present.size == 0 or present.min() == present.max():
+                return np.zeros_like(values)
+            return (values - present.min()) / (present.max() - present.min())
+
+        score = normalize(base) * weights.base + normalize(max_rate) * weights.max
+
+        score_key = np.where(np.isnan(score), -np.inf, score)
+
+        if ranking == "topk":
+            page = _top_order(score_key, max_rate, offset + top_k)[offset:]
+            base_rank = _count_rank_desc(base, page)
+            max_rank = _count_rank_desc(max_rate, page)
+        else:
+            page = np.lexsort((-max_rate, -score_key))[offset:offset + top_k]
+            base_rank = _rank_desc(base)[page]
+            max_rank = _rank_desc(max_rate)[page]
+
+        return [
+            SavingSearchResult.from_trusted(
+                {
+                    "score": None if np.isnan(score[i]) else float(score[i]),
+                    "principal": principal,
+                    "interest": float(interest[i]),
+                    "base_rate_rank": int(base_rank[j]),
+                    "max_rate_rank": int(max_rank[j]),
+                },
+                product=self.product(int(idx[i])),
+            ) for j, i in enumerate(page)
+        ]
+
+    def search(
+        self,
+        *,
+        weights: SavingRateWeights,
+        target_amount: Optional[int] = None,
+        monthly_deposit: Optional[int] = None,
+        total_term_months: Optional[int] = None,
+        top_k: int = 5,
+        offset: int = 0,
+        ranking: SavingRankingMode = "facet",
+    ) -> List[SavingSearchResult]:
+        """`find_savings` 의 aggregation 경로와 동일한 결과를 반환한다.
+
+        점수가 같은 상품은 최대 금리, 카탈로그 순서로 정렬한다.
+        """
+
+        term_months, monthly_amount = _resolve_params(
+            target_amount=target_amount,
+            monthly_deposit=monthly_deposit,
+            total_term_months=total_term_months)
+
+        mask = self.eligible(term_months, monthly_amount)
+        idx = np.flatnonzero(mask)
+        base = self.base_rate_for_term(term_months)[idx]
+
+        return self._rank(idx,
+                          base,
+                          weights=weights,
+                          term_months=term_months,
+                          monthly_amount=monthly_amount,
+                          top_k=top_k,
+                          offset=offset,
+                          ranking=ranking)
+
+    def search_many(
+        self,
+        scenarios: List[SavingSearchScenario],
+        ranking: SavingRankingMode = "facet",
+    ) -> List[List[SavingSearchResult]]:
+        """여러 시나리오를 한 번의 카탈로그 순회로 평가한다.
+
+        필터 마스크와 기간별 기본 금리는 (시나리오, 상품) 배열로 한꺼번에 계산하고,
+        시나리오별 점수·순위만 따로 계산한다. 결과는 입력 순서를 따른다.
+        """
+
+        if not scenarios:
+            return []
+
+        resolved = [
+            _resolve_params(target_amount=s.target_amount,
+                            monthly_deposit=s.monthly_deposit,
+                            total_term_months=s.total_term_months) for s in scenarios
+        ]
+        terms = np.array([term for term, _ in resolved])
+        amounts = np.array([amount for _, amount in resolved])
+
+        masks = self.eligible(terms, amounts)
+
+        # 같은 가입 기간은 기본 금리를 한 번만 계산
+        unique_terms, term_index = np.unique(terms, return_inverse=True)
+        base_rates = self.base_rate_for_term(unique_terms)
+
+        results: List[List[SavingSearchResult]] = []
+        for i, scenario in enumerate(scenarios):
+            idx = np.flatnonzero(masks[i])
+            results.append(
+                self._rank(idx,
+                           base_rates[term_index[i], idx],
+                           weights=scenario.weights,
+                           term_months=resolved[i][0],
+                           monthly_amount=resolved[i][1],
+                           top_k=scenario.top_k,
+                           offset=scenario.offset,
+                           ranking=ranking))
+
+        return results
+
+
+_catalogs: Dict[str, SavingCatalog] = {}
+_load_lock = asyncio.Lock()
+
+
+async def get_catalog(collection: AsyncIOMotorCollection) -> SavingCatalog:
+    """컬렉션별 카탈로그를 적재해 재사용한다. 카탈로그 버전이 바뀌면 다시 적재한다."""
+
+    version = await get_catalog_version(collection)
+
+    catalog = _catalogs.get(collection.full_name)
+    if catalog is not None and catalog.version == version:
+        return catalog
+
+    async with _load_lock:
+        catalog = _catalogs.get(collection.full_name)
+        if catalog is None or catalog.version != version:
+            catalog = await SavingCatalog.load(collection, version)
+            _catalogs[collection.full_name] = catalog
+
+    return catalog
+
+
+def invalidate_catalog(collection: AsyncIOMotorCollection):
+    """적재된 카탈로그를 폐기한다. 다음 검색 시 다시 적재된다."""
+
+    _catalogs.pop(collection.full_name, None)
@@ -1,7 +1,27 @@
 from typing import List
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import UpdateOne
 
-from domains.saving.models import Saving
+from domains.saving.models import BASE_RATE_LOOKUP_MAX_TERM, Saving
+from domains.saving.repositories.catalog import invalidate_catalog
+from domains.saving.repositories.product_cache import product_cache
+from domains.saving.repositories.version import bump_catalog_version
+
+
+def materialize_rate_fields(saving: Saving) -> dict:
+    """검색 시 매번 계산하던 금리 값을 저장용 필드로 미리 계산한다.
+
+    - base_rate_by_term: 가입 기간(개월)을 인덱스로 하는 기본 금리 조회 테이블
+    - intermediate_interest_rate: 기본 금리 + user_choice 우대 금리
+    """
+
+    return {
+        "base_rate_by_term": [
+            saving.base_rate_for_term(term)
+            for term in range(BASE_RATE_LOOKUP_MAX_TERM + 1)
+        ],
+        "intermediate_interest_rate": saving.intermediate_interest_rate,
+    }
 
 
 async def insert_saving(
@@ -19,7 +39,33 @@ async def insert_savings(
 ):
     """적금 다중 생성"""
 
-    payload = [saving.model_dump(by_alias=True) for saving in savings]
+    payload = [{
+        **saving.model_dump(by_alias=True),
+        **materialize_rate_fields(saving)
+    } for saving in savings]
     results = await collection.insert_many(payload)
+    invalidate_catalog(collection)
+    version = await bump_catalog_version(collection)
+    product_cache.put_many(collection, version, savings)
 
     return {"ids": results.inserted_ids}
+
+
+async def backfill_rate_fields(collection: AsyncIOMotorCollection):
+    """기존 적금 도큐먼트에 미리 계산된 금리 필드를 채운다."""
+
+    raw_savings = await collection.find({}).to_list()
+    requests = [
+        UpdateOne({"_id": raw["_id"]},
+                  {"$set": materialize_rate_fields(Saving.model_validate(raw))})
+        for raw in raw_savings
+    ]
+
+    if not requests:
+        return {"modified": 0}
+
+    result = await collection.bulk_write(requests, ordered=False)
+    invalidate_catalog(collection)
+    await bump_catalog_version(collection)
+
+    return {"modified": result.modified_count}
@@ -0,0 +1,64 @@
+from typing import Dict, List
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from domains.saving.models import Saving
+from domains.saving.repositories.version import get_catalog_version
+
+
+class SavingProductCache:
+    """검증을 마친 `Saving` 인스턴스를 상품 id 로 재사용하는 캐시.
+
+    적재 시(`put_many`)와 최초 조회 시(`get_many`, `get_or_validate`)에 채워진다.
+    컬렉션별로 카탈로그 버전을 기억하며, 버전이 바뀌면 해당 컬렉션의 상품을 모두 버린다.
+    """
+
+    def __init__(self):
+        self._versions: Dict[str, int] = {}
+        self._products: Dict[str, Dict[str, Saving]] = {}
+
+    def _bucket(self, collection: AsyncIOMotorCollection,
+                version: int) -> Dict[str, Saving]:
+        if self._versions.get(collection.full_name) != version:
+            self._versions[collection.full_name] = version
+            self._products[collection.full_name] = {}
+
+        return self._products[collection.full_name]
+
+    def get_or_validate(self, collection: AsyncIOMotorCollection, version: int,
+                        doc: dict) -> Saving:
+        """`doc` 의 상품을 반환한다. 처음 보는 상품만 검증한다."""
+
+        bucket = self._bucket(collection, version)
+
+        product = bucket.get(doc["_id"])
+        if product is None:
+            product = Saving.model_validate(doc)
+            bucket[product.id] = product
+
+        return product
+
+    def put_many(self, collection: AsyncIOMotorCollection, version: int,
+                 savings: List[Saving]):
+        bucket = self._bucket(collection, version)
+        for saving in savings:
+            bucket[saving.id] = saving
+
+    async def get_many(self, collection: AsyncIOMotorCollection,
+                       ids: List[str]) -> List[Saving]:
+        """id 순서대로 상품을 반환한다. 캐시에 없는 상품만 조회하며, 없는 id 는 건너뛴다."""
+
+        version = await get_catalog_version(collection)
+        bucket = self._bucket(collection, version)
+
+        missing = [id for id in ids if id not in bucket]
+        if missing:
+            raw_savings = await collection.find({"_id": {"$in": missing}}).to_list()
+            for raw in raw_savings:
+                saving = Saving.model_validate(raw)
+                bucket[saving.id] = saving
+
+        return [bucket[id] for id in ids if id in bucket]
+
+
+product_cache = SavingProductCache()
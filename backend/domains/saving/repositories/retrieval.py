@@ -1,39 +1,37 @@
-from typing import Optional, List
+import asyncio
+from typing import List, Optional, Sequence, Tuple
 from motor.motor_asyncio import AsyncIOMotorCollection
 
+from common.cache import AsyncCache
 from common.database import init_mongodb_client
-from domains.saving.models import Saving
+from common.metrics import count, instrumented
+from domains.common.maturity import lump_sum_interest_expr
+from domains.saving.models import BASE_RATE_LOOKUP_MAX_TERM, Saving
+from domains.saving.repositories.catalog import get_catalog
+from domains.saving.repositories.product_cache import product_cache
+from domains.saving.repositories.version import get_catalog_version
 from domains.saving.schemas import (
     SavingRateWeights,
     SavingSearchResult,
+    SavingSearchScenario,
 )
+from domains.saving.types import SavingRankingMode, SavingSearchEngine
 
 
 async def get_saving_by_ids(col: AsyncIOMotorCollection, ids: List[str]):
-    cursor = col.find({"_id": {"$in": ids}})
-    raw_savings = await cursor.to_list()
-    savings = [Saving.model_validate(raw) for raw in raw_savings]
+    savings = await product_cache.get_many(col, ids)
     savings = [SavingSearchResult(product=saving) for saving in savings]
 
     return savings
 
 
-def build_search_pipeline(
-        *,
-        total_term_months: Optional[int] = None,  # 가입 기간(월)
-        monthly_deposit: Optional[int] = None,  # 월 납입 금액
-        target_amount: Optional[int] = None,  # 목표 금액
-        top_k: int = 5,
-        offset: int = 0,
-        w_base: float = 0.5,  # 기본금리 가중치
-        w_max: float = 0.5  # 최대금리 가중치
-):
-    """
-    SavingSearchResult 형태로 반환하기 위한 MongoDB aggregation 파이프라인을 생성한다.
-    세 파라미터 중 **정확히 두 개**만 입력해야 한다.
-    """
-
-    print(f"w_base: {w_base}, w_max: {w_max}")
+def _build_candidate_stages(
+    *,
+    total_term_months: Optional[int] = None,
+    monthly_deposit: Optional[int] = None,
+    target_amount: Optional[int] = None,
+) -> List[dict]:
+    """파라미터 보간, 가입 조건 필터, 기본 금리 추출 스테이지를 생성한다."""
 
     # --- 0) 파라미터 검증 ---------------------------------------------------
     supplied = [
@@ -47,55 +45,67 @@ def build_search_pipeline(
     lt = lambda v: {"$literal": v} if v is not None else v
 
     # --- 1) 기본 금리(baseRate) 추출(가입 기간 반영) -------------------------
+    term_ref = lt(total_term_months) or "$_termMonths"
+
+    # 구간별 금리를 직접 탐색 (미리 계산된 조회 테이블이 없는 경우)
+    tier_rate_expr = {
+        "$cond": [
+            {
+                "$isArray": "$base_interest_rate"
+            },
+            {
+                "$let": {
+                    "vars": {
+                        "tier": {
+                            "$first": {
+                                "$filter": {
+                                    "input": "$base_interest_rate",
+                                    "as": "t",
+                                    "cond": {
+                                        "$and": [
+                                            # min_term ≤ term_months
+                                            {
+                                                "$lte": ["$$t.min_term", term_ref]
+                                            },
+                                            # term_months < max_term  (또는 max_term 없음)
+                                            {
+                                                "$or": [{
+                                                    "$eq": ["$$t.max_term", None]
+                                                }, {
+                                                    "$gt": ["$$t.max_term", term_ref]
+                                                }]
+                                            }
+                                        ]
+                                    }
+                                }
+                            }
+                        }
+                    },
+                    "in": "$$tier.interest_rate"
+                }
+            },
+            "$base_interest_rate"
+        ]
+    }
+
     base_rate_stage = {
         "$set": {
             "baseRate": {
                 "$cond": [
                     {
-                        "$isArray": "$base_interest_rate"
+                        "$and": [{
+                            "$isArray": "$base_rate_by_term"
+                        }, {
+                            "$lte": [term_ref, BASE_RATE_LOOKUP_MAX_TERM]
+                        }]
                     },
+                    # 적재 시 계산된 기간별 기본 금리 조회
                     {
-                        "$let": {
-                            "vars": {
-                                "tier": {
-                                    "$first": {
-                                        "$filter": {
-                                            "input": "$base_interest_rate",
-                                            "as": "t",
-                                            "cond": {
-                                                "$and": [
-                                                    # min_term ≤ term_months
-                                                    {
-                                                        "$lte": [
-                                                            "$$t.min_term",
-                                                            lt(total_term_months) or
-                                                            "$_termMonths"
-                                                        ]
-                                                    },
-                                                    # term_months < max_term  (또는 max_term 없음)
-                                                    {
-                                                        "$or": [{
-                                                            "$eq": [
-                                                                "$$t.max_term", None
-                                                            ]
-                                                        }, {
-                                                            "$gt": [
-                                                                "$$t.max_term",
-                                                                lt(total_term_months) or
-                                                                "$_termMonths"
-                                                            ]
-                                                        }]
-                                                    }
-                                                ]
-                                            }
-                                        }
-                                    }
-                                }
-                            },
-                            "in": "$$tier.interest_rate"
-                        }
+                        "$arrayElemAt": ["$base_rate_by_term", {
+                            "$toInt": term_ref
+                        }]
                     },
-                    "$base_interest_rate"
+                    tier_rate_expr,
                 ]
             }
         }
@@ -207,6 +217,145 @@ def build_search_pipeline(
     }
     filter_stage = {"$match": {"$expr": {"$and": [term_expr, amount_expr]}}}
 
+    return [fill_stage, filter_stage, base_rate_stage]
+
+
+# 정규화에 사용할 금리 min/max 통계
+_stats_group = {
+    "$group": {
+        "_id": 0,
+        "minBase": {
+            "$min": "$baseRate"
+        },
+        "maxBase": {
+            "$max": "$baseRate"
+        },
+        "minMax": {
+            "$min": "$max_interest_rate"
+        },
+        "maxMax": {
+            "$max": "$max_interest_rate"
+        }
+    }
+}
+
+# 검색 결과 생성에 필요한 필드만 남긴다 (보간·정규화용 임시 필드 제외)
+_result_fields = [field.alias or name for name, field in Saving.model_fields.items()]
+_result_fields += ["score", "principal", "interest", "base_rate_rank", "max_rate_rank"]
+_result_projection = {"$project": {field: 1 for field in _result_fields}}
+
+
+def build_stats_pipeline(
+    *,
+    total_term_months: Optional[int] = None,
+    monthly_deposit: Optional[int] = None,
+    target_amount: Optional[int] = None,
+) -> List[dict]:
+    """조건을 만족하는 상품들의 정규화 통계(min/max)만 반환하는 파이프라인을 생성한다."""
+
+    candidate_stages = _build_candidate_stages(total_term_months=total_term_months,
+                                               monthly_deposit=monthly_deposit,
+                                               target_amount=target_amount)
+
+    return [*candidate_stages, _stats_group, {"$project": {"_id": 0}}]
+
+
+def build_rank_count_pipeline(
+    *,
+    thresholds: Sequence[Tuple[str, Optional[float]]],
+    total_term_months: Optional[int] = None,
+    monthly_deposit: Optional[int] = None,
+    target_amount: Optional[int] = None,
+) -> List[dict]:
+    """후보 상품 중 `field` 가 `value` 보다 큰 상품 수를 (field, value) 마다 한 번의 `$group` 으로 센다.
+
+    결과 도큐먼트의 `c{i}` 가 `thresholds[i]` 의 개수이다. 순위는 개수 + 1 로,
+    `$setWindowFields` 의 `$rank` (내림차순, null 은 가장 낮은 금리) 와 같다.
+    """
+
+    candidate_stages = _build_candidate_stages(total_term_months=total_term_months,
+                                               monthly_deposit=monthly_deposit,
+                                               target_amount=target_amount)
+
+    counts = {
+        f"c{i}": {
+            "$sum": {
+                "$cond": [{
+                    "$gt": [{
+                        "$ifNull": [f"${field}", None]
+                    }, value]
+                }, 1, 0]
+            }
+        } for i, (field, value) in enumerate(thresholds)
+    }
+
+    return [*candidate_stages, {"$group": {"_id": 0, **counts}}]
+
+
+# ranking="topk" 에서 반환한 상품의 순위를 계산할 (금리 필드, 순위 필드)
+_RANK_FIELDS = (("baseRate", "base_rate_rank"), ("max_interest_rate", "max_rate_rank"))
+
+
+async def _count_ranks(collection: AsyncIOMotorCollection, raw_datas: List[dict],
+                       **params):
+    """반환할 상품의 서로 다른 금리마다 더 높은 금리의 후보 수를 세어 순위를 채운다.
+
+    후보 전체의 금리를 모으지 않으므로 결과 도큐먼트가 카탈로그 크기와 무관하며,
+    개수는 모두 한 번의 aggregation 으로 센다.
+    """
+
+    if not raw_datas:
+        return
+
+    thresholds = list(
+        dict.fromkeys(
+            (field, raw.get(field)) for field, _ in _RANK_FIELDS for raw in raw_datas))
+
+    docs = await collection.aggregate(
+        build_rank_count_pipeline(thresholds=thresholds, **params)).to_list()
+    result = docs[0] if docs else {}
+    counts = {t: result.get(f"c{i}", 0) for i, t in enumerate(thresholds)}
+
+    for raw in raw_datas:
+        for field, rank_field in _RANK_FIELDS:
+            raw[rank_field] = counts[(field, raw.get(field))] + 1
+        raw.pop("baseRate", None)
+
+
+def build_search_pipeline(
+        *,
+        total_term_months: Optional[int] = None,  # 가입 기간(월)
+        monthly_deposit: Optional[int] = None,  # 월 납입 금액
+        target_amount: Optional[int] = None,  # 목표 금액
+        top_k: int = 5,
+        offset: int = 0,
+        w_base: float = 0.5,  # 기본금리 가중치
+        w_max: float = 0.5,  # 최대금리 가중치
+        ranking: SavingRankingMode = "facet",
+        stats: Optional[dict] = None,  # ranking="stats"/"topk" 일 때 정규화 통계
+):
+    """
+    SavingSearchResult 형태로 반환하기 위한 MongoDB aggregation 파이프라인을 생성한다.
+    세 파라미터 중 **정확히 두 개**만 입력해야 한다.
+
+    ranking="stats" 인 경우 `build_stats_pipeline` 으로 미리 구한 통계를 사용하므로
+    $facet 으로 전체 문서를 하나의 도큐먼트에 모으지 않는다.
+
+    ranking="topk" 인 경우 `$sort` + `$limit` 로 상위 offset + top_k 개만 선택한다.
+    (전체 정렬 대신 크기 k 의 힙) 금리 순위는 포함하지 않으며, 반환된 상품에 대해서만
+    `build_rank_count_pipeline` 으로 따로 계산한다. 이를 위해 `baseRate` 를 남겨 둔다.
+    """
+
+    print(f"w_base: {w_base}, w_max: {w_max}")
+
+    if ranking in ("stats", "topk") and stats is None:
+        raise ValueError(f"ranking='{ranking}' 에는 정규화 통계(stats)가 필요합니다.")
+
+    fill_stage, filter_stage, base_rate_stage = _build_candidate_stages(
+        total_term_months=total_term_months,
+        monthly_deposit=monthly_deposit,
+        target_amount=target_amount)
+
     # --- 3) 원금·이자 계산 --------------------------------------------------
     calc_fin_stage = {
         "$addFields": {
@@ -218,45 +367,13 @@ def build_search_pipeline(
 
     calc_interest_stage = {
         "$addFields": {
-            "interest": {
-                "$divide": [{
-                    "$multiply": [
-                        "$principal", {
-                            "$ifNull": ["$baseRate", 0]
-                        }, {
-                            "$divide": ["$_termMonths", 12]
-                        }
-                    ]
-                }, 100]
-            }
+            "interest":
+                lump_sum_interest_expr("$principal", "$baseRate", "$_termMonths")
         }
     }
 
     # --- 4) 금리 정규화·가중합 점수 ----------------------------------------
-    stats_facet = {
-        "$facet": {
-            "stats": [{
-                "$group": {
-                    "_id": 0,
-                    "minBase": {
-                        "$min": "$baseRate"
-                    },
-                    "maxBase": {
-                        "$max": "$baseRate"
-                    },
-                    "minMax": {
-                        "$min": "$max_interest_rate"
-                    },
-                    "maxMax": {
-                        "$max": "$max_interest_rate"
-                    }
-                }
-            }],
-            "docs": [{
-                "$match": {}
-            }]
-        }
-    }
+    stats_facet = {"$facet": {"stats": [_stats_group], "docs": [{"$match": {}}]}}
 
     unwind_stats = [{
         "$unwind": "$stats"
@@ -337,14 +454,54 @@ def build_search_pipeline(
     }
 
     # 완성된 파이프라인
+    if ranking in ("stats", "topk"):
+        # 통계를 리터럴로 붙이고 문서는 그대로 흘려보낸다
+        stats_stages = [{
+            "$addFields": {
+                key: {
+                    "$literal":
+                        stats.get(key)  # type: ignore
+                } for key in ("minBase", "maxBase", "minMax", "maxMax")
+            }
+        }]
+    else:
+        stats_stages = [stats_facet, *unwind_stats]
+
+    if ranking == "topk":
+        return [
+            fill_stage,
+            filter_stage,
+            base_rate_stage,
+            calc_fin_stage,
+            calc_interest_stage,
+            *stats_stages,
+            norm,
+            score,
+            {
+                "$sort": {
+                    "score": -1
+                }
+            },
+            {
+                "$limit": offset + top_k
+            },
+            {
+                "$skip": offset
+            },
+            {
+                "$project": {
+                    **_result_projection["$project"], "baseRate": 1
+                }
+            },
+        ]
+
     full_stages = [
         fill_stage,
         filter_stage,
         base_rate_stage,
         calc_fin_stage,
         calc_interest_stage,
-        stats_facet,
-        *unwind_stats,
+        *stats_stages,
         norm,
         score,
         rank_base,
@@ -356,11 +513,42 @@ def build_search_pipeline(
         },
     ]
 
-    full_stages += [{"$skip": offset}, {"$limit": top_k}]
+    full_stages += [{"$skip": offset}, {"$limit": top_k}, _result_projection]
 
     return full_stages
 
 
+def _search_cache_key(
+    collection: AsyncIOMotorCollection,
+    version: int,
+    weights: SavingRateWeights,
+    target_amount: Optional[int],
+    monthly_deposit: Optional[int],
+    total_term_months: Optional[int],
+    top_k: int,
+    offset: int,
+    engine: SavingSearchEngine,
+    ranking: SavingRankingMode,
+) -> tuple:
+    """정규화된 검색 파라미터로 캐시 키를 만든다."""
+
+    return (
+        "find_savings",
+        collection.full_name,
+        version,
+        target_amount,
+        monthly_deposit,
+        total_term_months,
+        round(weights.base, 6),
+        round(weights.max, 6),
+        round(weights.intermediate, 6),
+        top_k,
+        offset,
+        engine,
+        ranking,
+    )
+
+
 async def find_savings(
     collection: AsyncIOMotorCollection,
     weights: SavingRateWeights,
@@ -369,7 +557,79 @@ async def find_savings(
     total_term_months: Optional[int] = None,
     top_k: int = 5,
     offset: int = 0,
+    engine: SavingSearchEngine = "aggregation",
+    ranking: SavingRankingMode = "facet",
+    cache: Optional[AsyncCache] = None,
 ) -> List[SavingSearchResult]:
+    """적금 상품을 검색한다.
+
+    `cache` 가 주어지면 카탈로그 버전과 정규화된 파라미터를 키로 결과를 재사용한다.
+    """
+
+    if cache is None:
+        return await _search_savings(collection, weights, target_amount,
+                                     monthly_deposit, total_term_months, top_k, offset,
+                                     engine, ranking)
+
+    version = await get_catalog_version(collection)
+    key = _search_cache_key(collection, version, weights, target_amount,
+                            monthly_deposit, total_term_months, top_k, offset, engine,
+                            ranking)
+
+    cached = await cache.get(key)
+    count("cache_requests_total",
+          cache="saving_search",
+          result="hit" if cached is not None else "miss")
+    if cached is not None:
+        return cached
+
+    savings = await _search_savings(collection, weights, target_amount, monthly_deposit,
+                                    total_term_months, top_k, offset, engine, ranking)
+    await cache.set(key, savings)
+
+    return savings
+
+
+@instrumented("mongo", "search_savings")
+async def _search_savings(
+    collection: AsyncIOMotorCollection,
+    weights: SavingRateWeights,
+    target_amount: Optional[int],
+    monthly_deposit: Optional[int],
+    total_term_months: Optional[int],
+    top_k: int,
+    offset: int,
+    engine: SavingSearchEngine,
+    ranking: SavingRankingMode,
+) -> List[SavingSearchResult]:
+
+    if engine == "catalog":
+        try:
+            catalog = await get_catalog(collection)
+            return catalog.search(weights=weights,
+                                  target_amount=target_amount,
+                                  monthly_deposit=monthly_deposit,
+                                  total_term_months=total_term_months,
+                                  top_k=top_k,
+                                  offset=offset,
+                                  ranking=ranking)
+
+        except Exception as e:
+            raise RuntimeError(f"적금 검색에 실패했습니다: {e}") from e
+
+    stats = None
+    if ranking in ("stats", "topk"):
+        stats_pipeline = build_stats_pipeline(target_amount=target_amount,
+                                              monthly_deposit=monthly_deposit,
+                                              total_term_months=total_term_months)
+        try:
+            stats_docs = await collection.aggregate(stats_pipeline).to_list()
+        except Exception as e:
+            raise RuntimeError(f"적금 검색에 실패했습니다: {e}") from e
+
+        if not stats_docs:
+            return []
+        stats = stats_docs[0]
 
     pipeline = build_search_pipeline(target_amount=target_amount,
                                      monthly_deposit=monthly_deposit,
@@ -377,12 +637,28 @@ async def find_savings(
                                      top_k=top_k,
                                      w_base=weights.base,
                                      w_max=weights.max,
-                                     offset=offset)
+                                     offset=offset,
+                                     ranking=ranking,
+                                     stats=stats)
 
     try:
         cursor = collection.aggregate(pipeline)
         raw_datas = await cursor.to_list()
-        savings = [SavingSearchResult(**raw) for raw in raw_datas]
+
+        if ranking == "topk":
+            await _count_ranks(collection,
+                               raw_datas,
+                               target_amount=target_amount,
+                               monthly_deposit=monthly_deposit,
+                               total_term_months=total_term_months)
+
+        # 상품은 버전별로 한 번만 검증하고, 검색 메타데이터는 재검증 없이 결합
+        version = await get_catalog_version(collection)
+        savings = [
+            SavingSearchResult.from_trusted(
+                raw, product_cache.get_or_validate(collection, version, raw))
+            for raw in raw_datas
+        ]
 
         return savings
 
@@ -390,6 +666,42 @@ async def find_savings(
         raise RuntimeError(f"적금 검색에 실패했습니다: {e}") from e
 
 
+async def find_savings_batch(
+    collection: AsyncIOMotorCollection,
+    scenarios: List[SavingSearchScenario],
+    engine: SavingSearchEngine = "aggregation",
+    ranking: SavingRankingMode = "facet",
+    cache: Optional[AsyncCache] = None,
+) -> List[List[SavingSearchResult]]:
+    """여러 (가입 기간, 월 납입액, 목표 금액, 가중치) 시나리오를 일괄 검색한다.
+
+    catalog 엔진은 모든 시나리오를 한 번의 카탈로그 순회로 평가하고,
+    aggregation 엔진은 시나리오별 파이프라인을 동시에 실행한다. (`cache` 는 aggregation
+    엔진의 시나리오별 검색에 사용) 결과는 시나리오 순서를 따른다.
+    """
+
+    if engine == "catalog":
+        try:
+            catalog = await get_catalog(collection)
+            return catalog.search_many(scenarios, ranking)
+
+        except Exception as e:
+            raise RuntimeError(f"적금 검색에 실패했습니다: {e}") from e
+
+    return list(await asyncio.gather(*[
+        find_savings(collection=collection,
+                     weights=s.weights,
+                     target_amount=s.target_amount,
+                     monthly_deposit=s.monthly_deposit,
+                     total_term_months=s.total_term_months,
+                     top_k=s.top_k,
+                     offset=s.offset,
+                     engine=engine,
+                     ranking=ranking,
+                     cache=cache) for s in scenarios
+    ]))
+
+
 async def _test():
 
     _, db = init_mongodb_client()
@@ -420,7 +732,5 @@ async def _test():
         print("테스트 실패:", e)
 
 
-import asyncio
-
 if __name__ == "__main__":
     asyncio.run(_test())
@@ -0,0 +1,48 @@
+import time
+from typing import Dict, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
+
+# 컬렉션별 카탈로그 버전을 저장하는 컬렉션
+VERSION_COLLECTION = "catalog_versions"
+
+# 버전 조회 결과를 재사용하는 시간(초). 워커 간 전파 지연의 상한이 된다.
+VERSION_MEMO_SECONDS = 1.0
+
+_memo: Dict[str, Tuple[float, int]] = {}
+
+
+def _version_collection(collection: AsyncIOMotorCollection) -> AsyncIOMotorCollection:
+    return collection.database.get_collection(VERSION_COLLECTION)
+
+
+async def get_catalog_version(collection: AsyncIOMotorCollection) -> int:
+    """상품 컬렉션의 현재 카탈로그 버전. 한 번도 갱신되지 않았다면 0."""
+
+    memo = _memo.get(collection.full_name)
+    if memo is not None and time.monotonic() - memo[0] < VERSION_MEMO_SECONDS:
+        return memo[1]
+
+    doc = await _version_collection(collection).find_one({"_id": collection.name})
+    version = int(doc["version"]) if doc else 0
+    _memo[collection.full_name] = (time.monotonic(), version)
+
+    return version
+
+
+async def bump_catalog_version(collection: AsyncIOMotorCollection) -> int:
+    """상품 컬렉션이 변경되었음을 기록한다. 캐시된 검색 결과와 카탈로그가 무효화된다."""
+
+    doc = await _version_collection(collection).find_one_and_update(
+        {"_id": collection.name},
+        {"$inc": {
+            "version": 1
+        }},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    version = int(doc["version"])
+    _memo[collection.full_name] = (time.monotonic(), version)
+
+    return version
@@ -45,6 +45,32 @@ class SavingRateWeights(BaseModel):
         return data
 
 
+class SavingSearchScenario(BaseModel):
+    """일괄 적금 검색의 단일 시나리오.
+
+    목표 금액, 월 납입액, 가입 기간 중 정확히 두 개를 지정한다.
+    """
+
+    weights: SavingRateWeights
+    target_amount: Optional[int] = None
+    monthly_deposit: Optional[int] = None
+    total_term_months: Optional[int] = None
+
+    top_k: int = Field(5, gt=0)
+    offset: int = Field(0, ge=0)
+
+    @model_validator(mode="after")
+    def _check_params(self):
+        supplied = [
+            self.total_term_months is not None, self.monthly_deposit is not None,
+            self.target_amount is not None
+        ]
+        if supplied.count(True) != 2:
+            raise ValueError("세 파라미터 중 정확히 두 개만 지정해야 합니다.")
+
+        return self
+
+
 class SavingSearchResult(BaseModel):
     """메타데이터를 포함하는 적금 상품 검색 결과"""
 
@@ -57,6 +83,8 @@ class SavingSearchResult(BaseModel):
     base_rate_rank: Optional[int] = None  # 기본금리 순위
     max_rate_rank: Optional[int] = None  # 최대 금리 순위
 
+    total_term_months: Optional[int] = None  # 가입 기간 비교 검색에서 결과를 계산한 가입 기간
+
     model_config = ConfigDict(populate_by_name=True, strict=False)
 
     def __init__(self, **data):
@@ -69,6 +97,28 @@ class SavingSearchResult(BaseModel):
 
         super().__init__(product=Saving(**data), **data)
 
+    @classmethod
+    def from_trusted(cls,
+                     doc: dict,
+                     product: Optional[Saving] = None) -> "SavingSearchResult":
+        """적재 시 검증된 검색 결과 도큐먼트로 메타데이터 재검증 없이 생성한다.
+
+        Args:
+            doc: 상품 필드와 score, interest 등 검색 메타데이터를 포함한 도큐먼트
+            product: 이미 검증된 상품 인스턴스. 없으면 `doc` 으로 생성
+        """
+
+        interest = doc.get("interest")
+
+        return cls.model_construct(
+            product=product or Saving.model_validate(doc),
+            score=doc.get("score", 0),
+            interest=None if interest is None else int(interest),
+            principal=doc.get("principal"),
+            base_rate_rank=doc.get("base_rate_rank"),
+            max_rate_rank=doc.get("max_rate_rank"),
+        )
+
     def __str__(self) -> str:
 
         info = "\n".join([
@@ -77,6 +127,8 @@ class SavingSearchResult(BaseModel):
             f"기본금리 순위: {self.base_rate_rank or '-'}위",
             f"최대금리 순위: {self.max_rate_rank or '-'}위",
         ])
+        if self.total_term_months is not None:
+            info = f"가입 기간: {self.total_term_months}개월\n" + info
 
         result = ("### 상품 기본 정보\n"
                   f"{str(self.product)}\n\n"
@@ -12,6 +12,7 @@ from common.database import init_mongodb_client
 from domains.saving.models import Saving
 
 from domains.saving.repositories.mutations import insert_savings
+from domains.saving.repositories.version import bump_catalog_version
 from domains.saving.scrapers.parsers import (
     parse_term_policy,
     parse_amount_policy,
@@ -140,6 +141,7 @@ async def insert_datas(saving_collection: AsyncIOMotorCollection,
                        savings: List[Saving]):
 
     result = await saving_collection.delete_many({})
+    await bump_catalog_version(saving_collection)
     print(f"Deleted {result.deleted_count} documents.")
     """
     raw_datas: List[str] = []
@@ -25,3 +25,26 @@ saving_earn_method_map: Dict[SavingEarnMethod, str] = {
     "fixed": "정액적립식",
     "flexible": "자유적립식",
 }
+
+# 적금 검색 엔진
+# - aggregation: MongoDB aggregation 파이프라인으로 검색
+# - catalog: 메모리에 적재한 카탈로그(NumPy 배열)로 검색
+SavingSearchEngine = Literal["aggregation", "catalog"]
+
+# 금리 정규화 방식
+# - facet: $facet 으로 min/max 와 문서를 함께 계산
+# - stats: 별도 $group 으로 min/max 만 먼저 계산한 뒤 문서를 그대로 정렬
+# - topk: stats 와 같이 통계를 먼저 계산하고, 상위 top_k 만 부분 선택한 뒤
+#         반환할 상품의 금리 순위만 개수 세기로 계산
+SavingRankingMode = Literal["facet", "stats", "topk"]
+
+# 상품 적합성 평가 방식
+# - batch: 후보 여러 개를 한 번의 구조화 출력 호출로 평가
+# - single: 후보마다 개별 호출로 평가
+SavingFilterMode = Literal["batch", "single"]
+
+# 검색 도구 선택 방식
+# - parser: 규칙 기반 파서가 두 파라미터를 확실히 찾으면 LLM 호출 없이 도구를 선택하고,
+#           그 외에는 LLM 이 선택한 인자를 파서 결과로 보정
+# - llm: 항상 LLM 으로 선택
+SavingToolSelectMode = Literal["parser", "llm"]
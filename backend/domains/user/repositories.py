@@ -2,9 +2,11 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, IndexModel
 from pymongo.results import DeleteResult
 
 from app.core.config import AppConfig
+from common.indexes import index_registry
 from domains.user.models import SocialProviders, SocialAccount, User, UserMemory
 
 
@@ -47,6 +49,18 @@ class SocialRepository:
         return social
 
 
+index_registry.declare(
+    "social_accounts",
+    IndexModel([("provider", ASCENDING), ("provider_user_id", ASCENDING)]),
+    IndexModel([("user_id", ASCENDING)]),
+)
+index_registry.declare_query("social_accounts", "by_provider_id", {
+    "provider_user_id": "",
+    "provider": "kakao"
+})
+index_registry.declare_query("social_accounts", "by_user_id", {"user_id": ""})
+
+
 class UserRepository:
 
     def __init__(self, *, cfg: AppConfig, db: AsyncIOMotorDatabase):
@@ -87,6 +101,10 @@ class UserRepository:
         return result.deleted_count > 0
 
 
+index_registry.declare("users", IndexModel([("email", ASCENDING)]))
+index_registry.declare_query("users", "by_email", {"email": ""})
+
+
 class UserMemoryRepository:
     """`user_memories` 컬렉션 CRUD 전담."""
 
@@ -135,3 +153,12 @@ class UserMemoryRepository:
     async def delete_memory(self, memory_id: str) -> bool:
         result: DeleteResult = await self.collection.delete_one({"_id": memory_id})
         return result.deleted_count > 0
+
+
+index_registry.declare(
+    "user_memories",
+    IndexModel([("user_id", ASCENDING), ("created_at", ASCENDING)]),
+)
+index_registry.declare_query("user_memories",
+                             "by_user_id", {"user_id": ""},
+                             sort=[("created_at", ASCENDING)])